@@ -1,6 +1,8 @@
 from sqlalchemy.orm import Session
 from db import models
 from typing import Optional, Dict, Any
+from core.pagination import paginate
+from core.search import contains
 
 
 def get_brands_paginated(
@@ -16,10 +18,7 @@ def get_brands_paginated(
 
     # 브랜드명 검색 (부분 일치)
     if brand_name:
-        query = query.filter(models.Brand.brand_name.ilike(f"%{brand_name}%"))
-
-    # 전체 카운트
-    total_count = query.count()
+        query = query.filter(contains(models.Brand.brand_name, brand_name))
 
     # 정렬
     if orderBy == "name":
@@ -30,9 +29,8 @@ def get_brands_paginated(
         # 기본값: rank 순서
         query = query.order_by(models.Brand.rank.asc())
 
-    # 페이지네이션
-    offset = (page - 1) * size
-    items = query.offset(offset).limit(size).all()
+    # 페이지네이션 (브랜드 수가 적으므로 exact count)
+    items, total_count = paginate(query, page, size)
 
     return {
         "total_count": total_count,
@@ -1,9 +1,65 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, text
 from db import models
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
+# 카테고리별 장바구니 최대 개수
+CART_CATEGORY_LIMIT = 20
+
+# 장바구니 추가 전 같은 사용자의 동시 추가를 순서대로 처리하기 위한 잠금 (트랜잭션 종료 시 해제)
+# 잠금은 별도 문장으로 실행해야 합니다. READ COMMITTED에서는 문장 시작 시 스냅샷을 잡으므로,
+# 같은 문장의 CTE에서 잠그면 잠금을 기다리는 동안 커밋된 앞선 요청의 추가분이 개수 확인에 보이지 않습니다.
+_LOCK_USER_CART_SQL = text("SELECT pg_advisory_xact_lock(hashtext('carts:' || :user_id))")
+
+# 장바구니 추가/수정 (_LOCK_USER_CART_SQL 이후 실행, 잠금 포함 2회 왕복)
+# - 이미 담긴 상품이면 ON CONFLICT로 이미지 URL만 갱신하고, 새 상품은 카테고리 개수가 제한 미만일 때만 추가합니다.
+# - 추가 후 카테고리/전체 개수를 함께 반환합니다. (xmax = 0 이면 새로 추가된 행)
+_ADD_TO_CART_SQL = text("""
+WITH counts AS (
+    SELECT count(*) FILTER (WHERE category = :category) AS category_count,
+           count(*) AS total_count
+    FROM carts
+    WHERE user_id = :user_id
+), upsert AS (
+    INSERT INTO carts (user_id, item_name, main_image_url, category)
+    SELECT :user_id, :item_name, :main_image_url, :category
+    FROM counts
+    WHERE counts.category_count < :category_limit
+       OR EXISTS (
+           SELECT 1 FROM carts
+           WHERE user_id = :user_id AND item_name = :item_name AND category = :category
+       )
+    ON CONFLICT ON CONSTRAINT _user_item_category_uc
+    DO UPDATE SET main_image_url = EXCLUDED.main_image_url
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT EXISTS (SELECT 1 FROM upsert) AS applied,
+       counts.category_count + (SELECT count(*) FROM upsert WHERE inserted) AS category_count,
+       counts.total_count + (SELECT count(*) FROM upsert WHERE inserted) AS total_count
+FROM counts
+""")
+
+# 장바구니 삭제 (1회 왕복, item_name이 NULL이면 카테고리 전체 삭제)
+# CTE 밖의 SELECT는 삭제 전 스냅샷을 보므로 삭제된 개수를 빼서 반환합니다.
+_DELETE_FROM_CART_SQL = text("""
+WITH deleted AS (
+    DELETE FROM carts
+    WHERE user_id = :user_id
+      AND category = :category
+      AND (CAST(:item_name AS VARCHAR) IS NULL OR item_name = :item_name)
+    RETURNING id
+), removed AS (
+    SELECT count(*) AS deleted_count FROM deleted
+)
+SELECT removed.deleted_count,
+       count(carts.id) FILTER (WHERE carts.category = :category) - removed.deleted_count AS category_count,
+       count(carts.id) - removed.deleted_count AS total_count
+FROM removed
+LEFT JOIN carts ON carts.user_id = :user_id
+GROUP BY removed.deleted_count
+""")
+
 
 def get_cart_count(db: Session, user_id: str) -> int:
     """사용자의 장바구니에 담긴 상품 개수 조회"""
@@ -47,13 +103,47 @@ def get_cart_items(
 
     # 최대 40개 제한
     cart_items = query.limit(40).all()
-    
-    # 현재 사용자 정보 조회 (삭제되지 않은 사용자만)
-    current_user = db.query(models.AdminUser).filter(
-        models.AdminUser.username == user_id,
-        models.AdminUser.is_deleted == False
-    ).first()
-    
+
+    # 아이템별 조회 대신 카테고리별로 이름을 모아 한 번에 조회
+    custom_design_names = {item.item_name for item in cart_items if item.category == '커스텀디자인'}
+    portfolio_names = {item.item_name for item in cart_items if item.category == '포트폴리오'}
+
+    current_user = None
+    custom_designs: Dict[str, models.CustomDesign] = {}
+    if custom_design_names:
+        # 현재 사용자 정보 조회 (삭제되지 않은 사용자만)
+        current_user = db.query(models.AdminUser).filter(
+            models.AdminUser.username == user_id,
+            models.AdminUser.is_deleted == False
+        ).first()
+
+        # (user_id, item_name)은 유일하므로 이름별로 하나씩 조회됨
+        custom_designs = {
+            custom_design.item_name: custom_design
+            for custom_design in db.query(models.CustomDesign).filter(
+                models.CustomDesign.item_name.in_(custom_design_names),
+                models.CustomDesign.user_id == user_id
+            )
+        }
+
+    portfolios: Dict[str, tuple] = {}
+    if portfolio_names:
+        # 포트폴리오와 작성자 account_code (삭제된 사용자면 None)
+        # 삭제되지 않은 같은 이름의 포트폴리오가 여러 개면 id가 작은 것을 사용
+        for portfolio, portfolio_account_code in db.query(
+                models.Portfolio, models.AdminUser.account_code
+        ).outerjoin(
+            models.AdminUser,
+            and_(
+                models.AdminUser.id == models.Portfolio.user_id,
+                models.AdminUser.is_deleted == False
+            )
+        ).filter(
+            models.Portfolio.design_name.in_(portfolio_names),
+            models.Portfolio.is_deleted == False
+        ).order_by(models.Portfolio.id):
+            portfolios.setdefault(portfolio.design_name, (portfolio, portfolio_account_code))
+
     # 결과 포맷팅
     formatted_items = []
     for item in cart_items:
@@ -66,31 +156,17 @@ def get_cart_items(
             # 커스텀디자인인 경우 현재 로그인한 사용자의 account_code
             account_code = current_user.account_code if current_user else None
 
-            # 커스텀디자인에서 썸네일 URL 가져오기
-            custom_design = db.query(models.CustomDesign).filter(
-                models.CustomDesign.item_name == item.item_name,
-                models.CustomDesign.user_id == user_id
-            ).first()
-
+            custom_design = custom_designs.get(item.item_name)
             if custom_design:
                 thumbnail_url = custom_design.thumbnail_url
                 custom_design_id = custom_design.id
 
         elif item.category == '포트폴리오':
-            # 포트폴리오인 경우 portfolio의 user_id로 account_code 조회
-            portfolio = db.query(models.Portfolio).filter(
-                models.Portfolio.design_name == item.item_name,
-                models.Portfolio.is_deleted == False
-            ).first()
-
-            if portfolio:
+            # 포트폴리오인 경우 portfolio 작성자의 account_code
+            if item.item_name in portfolios:
+                portfolio, account_code = portfolios[item.item_name]
                 thumbnail_url = portfolio.thumbnail_url
                 portfolio_id = portfolio.id
-                portfolio_user = db.query(models.AdminUser).filter(
-                    models.AdminUser.id == portfolio.user_id,
-                    models.AdminUser.is_deleted == False
-                ).first()
-                account_code = portfolio_user.account_code if portfolio_user else None
 
         formatted_items.append({
             "item_name": item.item_name,
@@ -101,7 +177,7 @@ def get_cart_items(
             "portfolio_id": portfolio_id,
             "custom_design_id": custom_design_id
         })
-    
+
     return formatted_items
 
 
@@ -111,54 +187,45 @@ def add_to_cart(
         item_name: str,
         main_image_url: Optional[str],
         category: str
-) -> models.Cart:
-    """장바구니에 상품 추가 (카테고리별 최대 20개 제한)"""
-
-    # 이미 장바구니에 있는지 확인
-    existing_item = db.query(models.Cart).filter(
-        and_(
-            models.Cart.user_id == user_id,
-            models.Cart.item_name == item_name,
-            models.Cart.category == category
-        )
-    ).first()
-
-    if existing_item:
-        # 이미 존재하면 업데이트만 수행 (이미지 URL이 변경되었을 수 있음)
-        existing_item.main_image_url = main_image_url
-        db.commit()
-        db.refresh(existing_item)
-        return existing_item
-
-    # 해당 카테고리의 현재 개수 확인
-    category_count = db.query(models.Cart).filter(
-        and_(
-            models.Cart.user_id == user_id,
-            models.Cart.category == category
-        )
-    ).count()
-
-    # 카테고리별 20개 제한
-    if category_count >= 20:
+) -> Dict[str, int]:
+    """장바구니에 상품 추가 (카테고리별 최대 20개 제한)
+
+    이미 담긴 상품이면 이미지 URL만 갱신합니다. (이미지 URL이 변경되었을 수 있음)
+    추가 후의 {"category_count", "total_count"} 를 반환합니다.
+    """
+    db.execute(_LOCK_USER_CART_SQL, {"user_id": user_id})
+    row = db.execute(_ADD_TO_CART_SQL, {
+        "user_id": user_id,
+        "item_name": item_name,
+        "main_image_url": main_image_url,
+        "category": category,
+        "category_limit": CART_CATEGORY_LIMIT
+    }).one()
+
+    if not row.applied:
+        db.rollback()
         from fastapi import HTTPException
         raise HTTPException(
             status_code=400,
-            detail=f"{category} 카테고리는 최대 20개까지만 장바구니에 담을 수 있습니다."
+            detail=f"{category} 카테고리는 최대 {CART_CATEGORY_LIMIT}개까지만 장바구니에 담을 수 있습니다."
         )
 
-    # 새로 추가
-    new_cart_item = models.Cart(
-        user_id=user_id,
-        item_name=item_name,
-        main_image_url=main_image_url,
-        category=category
-    )
-
-    db.add(new_cart_item)
     db.commit()
-    db.refresh(new_cart_item)
+    return {"category_count": row.category_count, "total_count": row.total_count}
+
 
-    return new_cart_item
+def _delete_from_cart(db: Session, user_id: str, category: str, item_name: Optional[str]) -> Dict[str, int]:
+    row = db.execute(_DELETE_FROM_CART_SQL, {
+        "user_id": user_id,
+        "item_name": item_name,
+        "category": category
+    }).one()
+    db.commit()
+    return {
+        "deleted_count": row.deleted_count,
+        "category_count": row.category_count,
+        "total_count": row.total_count
+    }
 
 
 def delete_cart_item(
@@ -166,42 +233,25 @@ def delete_cart_item(
         user_id: str,
         item_name: str,
         category: str
-) -> bool:
-    """장바구니에서 단일 상품 삭제"""
-
-    cart_item = db.query(models.Cart).filter(
-        and_(
-            models.Cart.user_id == user_id,
-            models.Cart.item_name == item_name,
-            models.Cart.category == category
-        )
-    ).first()
+) -> Optional[Dict[str, int]]:
+    """장바구니에서 단일 상품 삭제
 
-    if cart_item:
-        db.delete(cart_item)
-        db.commit()
-        return True
-
-    return False
+    삭제 후의 {"deleted_count", "category_count", "total_count"} 를 반환하며, 담겨 있지 않으면 None
+    """
+    result = _delete_from_cart(db, user_id, category, item_name)
+    return result if result["deleted_count"] else None
 
 
 def delete_cart_by_category(
         db: Session,
         user_id: str,
         category: str
-) -> int:
-    """장바구니에서 카테고리별 일괄 삭제"""
-
-    deleted_count = db.query(models.Cart).filter(
-        and_(
-            models.Cart.user_id == user_id,
-            models.Cart.category == category
-        )
-    ).delete()
-
-    db.commit()
+) -> Dict[str, int]:
+    """장바구니에서 카테고리별 일괄 삭제
 
-    return deleted_count
+    삭제 후의 {"deleted_count", "category_count", "total_count"} 를 반환합니다.
+    """
+    return _delete_from_cart(db, user_id, category, None)
 
 
 def add_to_cart_by_id(
@@ -210,8 +260,8 @@ def add_to_cart_by_id(
         portfolio_id: Optional[int] = None,
         custom_design_id: Optional[int] = None,
         main_image_url: Optional[str] = None
-) -> models.Cart:
-    """ID 기반 장바구니 추가 (카테고리별 최대 20개 제한)"""
+) -> Dict[str, int]:
+    """ID 기반 장바구니 추가 (카테고리별 최대 20개 제한, 추가 후 카테고리/전체 개수 반환)"""
 
     if not portfolio_id and not custom_design_id:
         from fastapi import HTTPException
@@ -273,8 +323,8 @@ def delete_cart_item_by_id(
         user_id: str,
         portfolio_id: Optional[int] = None,
         custom_design_id: Optional[int] = None
-) -> bool:
-    """ID 기반 장바구니 단일 삭제"""
+) -> Optional[Dict[str, int]]:
+    """ID 기반 장바구니 단일 삭제 (삭제 후 개수 반환, 담겨 있지 않으면 None)"""
 
     if not portfolio_id and not custom_design_id:
         from fastapi import HTTPException
@@ -298,7 +348,7 @@ def delete_cart_item_by_id(
         ).first()
 
         if not portfolio:
-            return False
+            return None
 
         item_name = portfolio.design_name
         category = '포트폴리오'
@@ -309,7 +359,7 @@ def delete_cart_item_by_id(
         ).first()
 
         if not custom_design:
-            return False
+            return None
 
         item_name = custom_design.item_name
         category = '커스텀디자인'
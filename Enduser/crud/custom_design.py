@@ -1,11 +1,14 @@
 # Enduser/crud/custom_design.py
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
+from sqlalchemy import func, or_, exists
 from db import models
 from typing import Optional, Dict, Any
 import math
 from services.storage_service import storage_service
 from fastapi import UploadFile
+from core.pagination import paginate, paginate_keyset, order_by_keys, count_total, COUNT_WINDOW, COUNT_ESTIMATE
+from core.search import contains
+from core.design_components import resolve_design_component, unity_components
 
 
 def get_images_paginated(
@@ -15,19 +18,27 @@ def get_images_paginated(
         size: int = 10,
         category: Optional[str] = None,
         display_name: Optional[str] = None,
-        orderBy: Optional[str] = None
+        orderBy: Optional[str] = None,
+        cursor: Optional[str] = None,
+        use_cursor: bool = False
 ) -> Dict[str, Any]:
-    """이미지 목록을 페이지네이션하여 조회"""
+    """이미지 목록을 페이지네이션하여 조회
+
+    use_cursor=True 이면 page 대신 cursor(이전 응답의 next_cursor)로 다음 페이지를 조회합니다.
+    """
 
     query = db.query(models.Image)
     
     # exposed_users 필터링
-    # exposed_users가 비어있거나 현재 사용자 ID가 포함된 이미지만 조회
+    # exposed_users가 비어있거나 image_exposed_users에 현재 사용자가 등록된 이미지만 조회
     query = query.filter(
         or_(
             models.Image.exposed_users == None,  # exposed_users가 NULL인 경우
             models.Image.exposed_users == '',     # exposed_users가 빈 문자열인 경우
-            models.Image.exposed_users.like(f'%{user_id}%')  # 현재 사용자 ID가 포함된 경우
+            exists().where(  # 현재 사용자에게 노출된 경우 (PK 인덱스 semi-join)
+                models.ImageExposedUser.image_id == models.Image.id,
+                models.ImageExposedUser.user_id == user_id
+            )
         )
     )
 
@@ -35,38 +46,42 @@ def get_images_paginated(
     if category:
         query = query.filter(models.Image.category == category)
     if display_name:
-        query = query.filter(models.Image.display_name.contains(display_name))
+        query = query.filter(contains(models.Image.display_name, display_name, case_sensitive=True))
 
-    # 정렬
+    # 정렬 (마지막 키는 유일한 id - cursor 페이지네이션에도 사용)
+    default_sort_keys = [(models.Image.uploaded_at, True), (models.Image.id, True)]
+    sort_keys = None
     if orderBy:
         from sqlalchemy import cast, Integer
-        if orderBy.lower().endswith(' desc'):
-            column = orderBy.replace(' desc', '').strip()
-            if column == 'display_name':
-                # display_name이 숫자로만 이루어진 경우 숫자로 변환하여 정렬
-                query = query.order_by(cast(models.Image.display_name, Integer).desc())
-            elif hasattr(models.Image, column):
-                query = query.order_by(getattr(models.Image, column).desc())
-        elif orderBy.lower().endswith(' asc'):
-            column = orderBy.replace(' asc', '').strip()
+        column = orderBy.rsplit(' ', 1)[0].strip()
+        direction = orderBy.rsplit(' ', 1)[-1].lower()
+        if direction in ('desc', 'asc'):
+            descending = direction == 'desc'
             if column == 'display_name':
                 # display_name이 숫자로만 이루어진 경우 숫자로 변환하여 정렬
-                query = query.order_by(cast(models.Image.display_name, Integer).asc())
+                sort_keys = [(cast(models.Image.display_name, Integer), descending), (models.Image.id, descending)]
             elif hasattr(models.Image, column):
-                query = query.order_by(getattr(models.Image, column).asc())
+                sort_keys = [(getattr(models.Image, column), descending), (models.Image.id, descending)]
     else:
-        query = query.order_by(models.Image.uploaded_at.desc())
-
-    # 전체 카운트
-    total_count = query.count()
+        sort_keys = default_sort_keys
 
     # 페이지네이션
-    offset = (page - 1) * size
-    items = query.offset(offset).limit(size).all()
+    next_cursor = None
+    if use_cursor:
+        # cursor 모드: 마지막 정렬 키 다음부터 조회 (OFFSET 없음, 정렬 기준이 없으면 업로드일 내림차순)
+        # 페이지마다 exact count 를 다시 하지 않도록 실행 계획의 예상 행 수 사용 (작은 결과는 exact)
+        total_count = count_total(query, COUNT_ESTIMATE)
+        items, next_cursor = paginate_keyset(query, sort_keys or default_sort_keys, cursor, size)
+    else:
+        if sort_keys:
+            query = order_by_keys(query, sort_keys)
+        # 페이지와 전체 개수를 한 번에 조회
+        items, total_count = paginate(query, page, size, count_strategy=COUNT_WINDOW)
 
     return {
         "total_count": total_count,
-        "items": items
+        "items": items,
+        "next_cursor": next_cursor
     }
 
 
@@ -83,7 +98,7 @@ def get_colors_paginated(
 
     # 필터링
     if color_name:
-        query = query.filter(models.Color.color_name.contains(color_name))
+        query = query.filter(contains(models.Color.color_name, color_name, case_sensitive=True))
 
     # 정렬
     if orderBy:
@@ -98,12 +113,8 @@ def get_colors_paginated(
     else:
         query = query.order_by(models.Color.updated_at.desc())
 
-    # 전체 카운트
-    total_count = query.count()
-
-    # 페이지네이션
-    offset = (page - 1) * size
-    items = query.offset(offset).limit(size).all()
+    # 페이지네이션 (페이지와 전체 개수를 한 번에 조회)
+    items, total_count = paginate(query, page, size, count_strategy=COUNT_WINDOW)
 
     return {
         "total_count": total_count,
@@ -136,54 +147,15 @@ def get_custom_design_detail(db: Session, design_id: int, user_id: str) -> Optio
     if not design:
         return None
 
-    # 각 컴포넌트 정보 조회
-    def get_component_info(image_id: str, color_id: str, transparency: str, size: str):
-        if not image_id or not color_id:
-            return None
-
-        image = db.query(models.Image).filter(models.Image.id == image_id).first()
-        color = db.query(models.Color).filter(models.Color.id == color_id).first()
-
-        if not image or not color:
-            return None
-
-        return {
-            "image_id": image_id,
-            "image_url": image.public_url,
-            "image_name": image.display_name,
-            "RGB_id": color_id,
-            "RGB_color": color.color_values,
-            "RGB_name": color.color_name,
-            "size": int(size) if size else 100,
-            "opacity": int(transparency) if transparency else 100
-        }
+    # 각 컴포넌트 정보 조회 (이미지/컬러 일괄 조회)
+    components = unity_components(resolve_design_component(db, design))
 
     return {
         "item_name": design.item_name,
-        "design_line": get_component_info(
-            design.design_line_image_id,
-            design.design_line_color_id,
-            design.line_transparency,
-            design.line_size
-        ),
-        "design_base1": get_component_info(
-            design.design_base1_image_id,
-            design.design_base1_color_id,
-            design.base1_transparency,
-            design.base1_size
-        ),
-        "design_base2": get_component_info(
-            design.design_base2_image_id,
-            design.design_base2_color_id,
-            design.base2_transparency,
-            design.base2_size
-        ),
-        "design_pupil": get_component_info(
-            design.design_pupil_image_id,
-            design.design_pupil_color_id,
-            design.pupil_transparency,
-            design.pupil_size
-        ),
+        "design_line": components["design_line"],
+        "design_base1": components["design_base1"],
+        "design_base2": components["design_base2"],
+        "design_pupil": components["design_pupil"],
         "graphic_diameter": design.graphic_diameter,
         "optic_zone": design.optic_zone,
         "dia": design.dia
@@ -295,12 +267,8 @@ def get_user_custom_designs_paginated(
             models.CustomDesign.created_at.desc()  # 그 다음 created_at 내림차순
         )
 
-    # 전체 카운트
-    total_count = query.count()
-
-    # 페이지네이션
-    offset = (page - 1) * size
-    items = query.offset(offset).limit(size).all()
+    # 페이지네이션 (페이지와 전체 개수를 한 번에 조회)
+    items, total_count = paginate(query, page, size, count_strategy=COUNT_WINDOW)
 
     return {
         "total_count": total_count,
@@ -1,10 +1,17 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_, and_
 from db import models
 from typing import Optional, List, Dict, Any
 import math
-from datetime import date, datetime
+from datetime import datetime
 from Enduser.crud import realtime_users as realtime_users_crud
+from services.view_counter_service import view_counter_service
+from Manager.portfolio.crud.portfolio import filter_by_exposed_countries
+from core.pagination import (
+    paginate, paginate_keyset, paginate_chained, paginate_keyset_chained, order_by_keys, count_total, COUNT_CACHED
+)
+from services.trending_service import trending_query_parts
+from core.search import contains
+from core.design_components import resolve_design_component, unity_components
 
 
 def get_portfolios_paginated(
@@ -15,9 +22,14 @@ def get_portfolios_paginated(
         exposed_countries: Optional[List[str]] = None,
         is_fixed_axis: Optional[str] = None,
         item_name: Optional[str] = None,
-        orderBy: Optional[str] = None
+        orderBy: Optional[str] = None,
+        cursor: Optional[str] = None,
+        use_cursor: bool = False
 ) -> Dict[str, Any]:
-    """엔드유저용 포트폴리오 목록을 페이지네이션하여 조회"""
+    """엔드유저용 포트폴리오 목록을 페이지네이션하여 조회
+
+    use_cursor=True 이면 page 대신 cursor(이전 응답의 next_cursor)로 다음 페이지를 조회합니다.
+    """
 
     # 기본 쿼리 - 삭제되지 않은 포트폴리오만 조회
     query = db.query(models.Portfolio).filter(
@@ -26,30 +38,14 @@ def get_portfolios_paginated(
 
     # 필터링
     if exposed_countries:
-        # 각 국가 ID가 정확히 일치하는지 확인 (콤마로 구분된 값에서 정확한 매칭)
-        for country_id in exposed_countries:
-            # 정확한 매칭을 위한 조건들:
-            # 1. 시작 부분에 있는 경우: "1,2,3" -> "1"로 시작
-            # 2. 중간에 있는 경우: "4,1,2" -> ",1,"
-            # 3. 끝에 있는 경우: "2,3,1" -> ",1"로 끝
-            # 4. 전체가 하나인 경우: "1" -> 정확히 "1"
-            query = query.filter(
-                or_(
-                    models.Portfolio.exposed_countries == country_id,  # 전체가 하나인 경우
-                    models.Portfolio.exposed_countries.like(f"{country_id},%"),  # 시작 부분
-                    models.Portfolio.exposed_countries.like(f"%,{country_id},%"),  # 중간
-                    models.Portfolio.exposed_countries.like(f"%,{country_id}")  # 끝
-                )
-            )
+        # 요청한 국가 ID가 모두 노출 국가에 포함된 포트폴리오만 조회 (portfolio_countries 인덱스 사용)
+        query = filter_by_exposed_countries(query, exposed_countries)
 
     if is_fixed_axis is not None:
         query = query.filter(models.Portfolio.is_fixed_axis == is_fixed_axis)
 
     if item_name:
-        query = query.filter(models.Portfolio.design_name.contains(item_name))
-
-    # 전체 카운트
-    total_count = query.count()
+        query = query.filter(contains(models.Portfolio.design_name, item_name, case_sensitive=True))
 
 
 
@@ -59,32 +55,40 @@ def get_portfolios_paginated(
 
 
 
-    # 정렬 처리
-    if orderBy == "popularity":
-        # 인기순: 조회수 내림차순, 동일한 경우 디자인명 오름차순
-        query = query.order_by(
-            models.Portfolio.views.desc(),
-            models.Portfolio.design_name.asc()
-        )
+    # 정렬 처리 (마지막 키는 유일한 id - cursor 페이지네이션에도 사용)
+    query_parts = None
+    if orderBy == "trending":
+        # 트렌딩순: 시간 감쇠 조회수 점수 내림차순, 동일한 경우 디자인명 오름차순
+        # 점수가 있는 항목(trending_scores 인덱스 순서) 뒤에 점수 없는 항목을 디자인명 오름차순으로 이어 붙임
+        query_parts = trending_query_parts(query, 'portfolio', models.Portfolio, models.Portfolio.design_name)
     elif orderBy == "latest":
         # 최신순: 생성일 내림차순
-        query = query.order_by(models.Portfolio.created_at.desc())
+        sort_keys = [
+            (models.Portfolio.created_at, True),
+            (models.Portfolio.id, True)
+        ]
     else:
-        # 기본값: 인기순
-        query = query.order_by(
-            models.Portfolio.views.desc(),
-            models.Portfolio.design_name.asc()
-        )
-
-
-
-
-
+        # 인기순(기본값): 조회수 내림차순, 동일한 경우 디자인명 오름차순
+        sort_keys = [
+            (models.Portfolio.views, True),
+            (models.Portfolio.design_name, False),
+            (models.Portfolio.id, False)
+        ]
+
+    # 페이지네이션 (전체 개수는 같은 필터 조건이면 잠시 캐시된 값 사용)
+    next_cursor = None
+    if use_cursor:
+        # cursor 모드: 마지막 정렬 키 다음부터 조회 (OFFSET 없음)
+        total_count = count_total(query, COUNT_CACHED)
+        if query_parts:
+            items, next_cursor = paginate_keyset_chained(query_parts, cursor, size)
+        else:
+            items, next_cursor = paginate_keyset(query, sort_keys, cursor, size)
+    elif query_parts:
+        items, total_count = paginate_chained(query_parts, page, size, count_strategy=COUNT_CACHED)
+    else:
+        items, total_count = paginate(order_by_keys(query, sort_keys), page, size, count_strategy=COUNT_CACHED)
 
-    # 페이지네이션
-    offset = (page - 1) * size
-    items = query.offset(offset).limit(size).all()
-    
     # 사용자의 장바구니 아이템 조회
     cart_items = db.query(models.Cart.item_name).filter(
         models.Cart.user_id == user_id,
@@ -92,14 +96,16 @@ def get_portfolios_paginated(
     ).all()
     cart_item_names = {item.item_name for item in cart_items}
 
+    # 실시간 유저수 일괄 조회 (페이지 전체를 한 번의 쿼리로)
+    realtime_users_map = realtime_users_crud.get_realtime_users_counts(
+        db, 'portfolio', [portfolio.id for portfolio in items]
+    )
+
     # 결과 포맷팅
     formatted_items = []
     for portfolio in items:
-        # 실시간 유저수 조회
-        realtime_users = realtime_users_crud.get_realtime_users_count(
-            db, 'portfolio', portfolio.design_name
-        )
-        
+        realtime_users = realtime_users_map.get(portfolio.id, 0)
+
         # user_id로 account_code 조회
         user = db.query(models.AdminUser).filter(
             models.AdminUser.id == portfolio.user_id
@@ -123,7 +129,8 @@ def get_portfolios_paginated(
 
     return {
         "total_count": total_count,
-        "items": formatted_items
+        "items": formatted_items,
+        "next_cursor": next_cursor
     }
 
 
@@ -146,53 +153,12 @@ def get_portfolio_detail(db: Session, item_name: str = None, portfolio_id: int =
     if not portfolio:
         return None
 
-    # 조회수 증가
-    portfolio.views += 1
+    # 조회수 증가 및 DailyView 기록 (버퍼에 모아 주기적으로 DB 반영)
+    view_counter_service.record('portfolio', portfolio.id)
 
-    # DailyView 기록
-    today = date.today()
-    daily_view = db.query(models.DailyView).filter(
-        models.DailyView.view_date == today,
-        models.DailyView.content_type == 'portfolio',
-        models.DailyView.content_id == portfolio.id
-    ).first()
+    # 각 컴포넌트 정보 조회 (포트폴리오는 크기/투명도가 없으므로 100 고정)
+    components = unity_components(resolve_design_component(db, portfolio), use_options=False)
 
-    if daily_view:
-        daily_view.view_count += 1
-    else:
-        new_daily_view = models.DailyView(
-            view_date=today,
-            content_type='portfolio',
-            content_id=portfolio.id,
-            view_count=1
-        )
-        db.add(new_daily_view)
-
-    db.commit()
-    db.refresh(portfolio)
-
-    # 각 컴포넌트 정보 조회
-    def get_component_info(image_id: str, color_id: str):
-        if not image_id or not color_id:
-            return None
-
-        image = db.query(models.Image).filter(models.Image.id == image_id).first()
-        color = db.query(models.Color).filter(models.Color.id == color_id).first()
-
-        if not image or not color:
-            return None
-
-        return {
-            "image_id": image_id,
-            "image_url": image.public_url,
-            "image_name": image.display_name,
-            "RGB_id": color_id,
-            "RGB_color": color.color_values,
-            "RGB_name": color.color_name,
-            "size": 100,
-            "opacity": 100  # 포트폴리오는 투명도가 없으므로 100 고정
-        }
-    
     # user_id로 account_code 조회
     user = db.query(models.AdminUser).filter(
         models.AdminUser.id == portfolio.user_id
@@ -205,22 +171,10 @@ def get_portfolio_detail(db: Session, item_name: str = None, portfolio_id: int =
         "color_name": portfolio.color_name,
         "account_code": account_code,
         "main_image_url": portfolio.main_image_url,  # main_image_url 추가
-        "design_line": get_component_info(
-            portfolio.design_line_image_id,
-            portfolio.design_line_color_id
-        ),
-        "design_base1": get_component_info(
-            portfolio.design_base1_image_id,
-            portfolio.design_base1_color_id
-        ),
-        "design_base2": get_component_info(
-            portfolio.design_base2_image_id,
-            portfolio.design_base2_color_id
-        ),
-        "design_pupil": get_component_info(
-            portfolio.design_pupil_image_id,
-            portfolio.design_pupil_color_id
-        ),
+        "design_line": components["design_line"],
+        "design_base1": components["design_base1"],
+        "design_base2": components["design_base2"],
+        "design_pupil": components["design_pupil"],
         "graphic_diameter": portfolio.graphic_diameter,
         "optic_zone": portfolio.optic_zone,
         "dia": portfolio.dia
@@ -1,20 +1,33 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
 from db import models
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Union, Iterable, List, Set, Tuple
+from services.presence_service import presence_service
+from services.presence_hub import presence_hub
 
 
-def clean_expired_users(db: Session):
-    """1분 이상 경과한 유저 기록 삭제"""
-    expire_time = datetime.now() - timedelta(minutes=1)
-
-    deleted = db.query(models.RealtimeUser).filter(
-        models.RealtimeUser.entered_at < expire_time
-    ).delete()
-
-    if deleted > 0:
-        db.commit()
+def _resolve_content_id(
+        db: Session,
+        content_type: str,
+        content_name: Optional[str] = None,
+        content_id: Optional[int] = None
+) -> Optional[int]:
+    """content_name으로 호출된 경우 content_id 찾기"""
+    if content_id is not None or content_name is None:
+        return content_id
+
+    if content_type == 'released_product':
+        product = db.query(models.Releasedproduct.id).filter(
+            models.Releasedproduct.design_name == content_name
+        ).first()
+        return product.id if product else None
+    elif content_type == 'portfolio':
+        portfolio = db.query(models.Portfolio.id).filter(
+            models.Portfolio.design_name == content_name,
+            models.Portfolio.is_deleted == False
+        ).first()
+        return portfolio.id if portfolio else None
+
+    return None
 
 
 def enter_content(
@@ -26,80 +39,17 @@ def enter_content(
 ) -> int:
     """컨텐츠에 유저 입장 (ID 기반)"""
 
-    # 만료된 유저 정리
-    clean_expired_users(db)
-    
-    # content_name으로 호출된 경우 ID 찾기
-    if content_id is None and content_name is not None:
-        if content_type == 'released_product':
-            product = db.query(models.Releasedproduct).filter(
-                models.Releasedproduct.design_name == content_name
-            ).first()
-            if product:
-                content_id = product.id
-                content_name = product.design_name
-            else:
-                return 0
-        elif content_type == 'portfolio':
-            portfolio = db.query(models.Portfolio).filter(
-                models.Portfolio.design_name == content_name,
-                models.Portfolio.is_deleted == False
-            ).first()
-            if portfolio:
-                content_id = portfolio.id
-                content_name = portfolio.design_name
-            else:
-                return 0
-    
-    # content_id로 호출된 경우 name 조회 (참고용)
-    elif content_id is not None and content_name is None:
-        if content_type == 'released_product':
-            product = db.query(models.Releasedproduct).filter(
-                models.Releasedproduct.id == content_id
-            ).first()
-            if product:
-                content_name = product.design_name
-            else:
-                return 0
-        elif content_type == 'portfolio':
-            portfolio = db.query(models.Portfolio).filter(
-                models.Portfolio.id == content_id,
-                models.Portfolio.is_deleted == False
-            ).first()
-            if portfolio:
-                content_name = portfolio.design_name
-            else:
-                return 0
-    
+    content_id = _resolve_content_id(db, content_type, content_name, content_id)
     if content_id is None:
         return 0  # content_id가 없으면 처리 불가
 
-    # 이미 입장한 기록이 있는지 확인 (ID 기반)
-    existing = db.query(models.RealtimeUser).filter(
-        and_(
-            models.RealtimeUser.user_id == user_id,
-            models.RealtimeUser.content_type == content_type,
-            models.RealtimeUser.content_id == content_id
-        )
-    ).first()
-
-    if existing:
-        # 이미 있으면 시간만 업데이트
-        existing.entered_at = datetime.now()
-    else:
-        # 새로 추가
-        new_entry = models.RealtimeUser(
-            user_id=user_id,
-            content_type=content_type,
-            content_id=content_id,
-            content_name=content_name  # 참고용
-        )
-        db.add(new_entry)
+    # 이미 입장한 기록이 있으면 시간만 갱신, 없으면 새로 추가
+    count = presence_service.touch(content_type, content_id, user_id, content_name)
 
-    db.commit()
+    # 구독 중인 클라이언트에 변경 알림
+    presence_hub.publish(content_type, content_id, count)
 
-    # 현재 유저수 반환
-    return get_realtime_users_count(db, content_type, content_name, content_id)
+    return count
 
 
 def leave_content(
@@ -111,45 +61,17 @@ def leave_content(
 ) -> int:
     """컨텐츠에서 유저 퇴장 (ID 기반)"""
 
-    # 만료된 유저 정리
-    clean_expired_users(db)
-    
-    # content_name으로 호출된 경우 ID 찾기
-    if content_id is None and content_name is not None:
-        if content_type == 'released_product':
-            product = db.query(models.Releasedproduct).filter(
-                models.Releasedproduct.design_name == content_name
-            ).first()
-            if product:
-                content_id = product.id
-            else:
-                return 0
-        elif content_type == 'portfolio':
-            portfolio = db.query(models.Portfolio).filter(
-                models.Portfolio.design_name == content_name,
-                models.Portfolio.is_deleted == False
-            ).first()
-            if portfolio:
-                content_id = portfolio.id
-            else:
-                return 0
-    
+    content_id = _resolve_content_id(db, content_type, content_name, content_id)
     if content_id is None:
         return 0  # content_id가 없으면 처리 불가
 
-    # 유저 기록 삭제 (ID 기반)
-    db.query(models.RealtimeUser).filter(
-        and_(
-            models.RealtimeUser.user_id == user_id,
-            models.RealtimeUser.content_type == content_type,
-            models.RealtimeUser.content_id == content_id
-        )
-    ).delete()
+    # 유저 기록 삭제
+    count = presence_service.leave(content_type, content_id, user_id)
 
-    db.commit()
+    # 구독 중인 클라이언트에 변경 알림
+    presence_hub.publish(content_type, content_id, count)
 
-    # 현재 유저수 반환
-    return get_realtime_users_count(db, content_type, content_name, content_id)
+    return count
 
 
 def get_realtime_users_count(
@@ -160,38 +82,89 @@ def get_realtime_users_count(
 ) -> int:
     """현재 실시간 유저수 조회 (ID 기반)"""
 
-    # 만료된 유저 정리
-    clean_expired_users(db)
-    
-    # content_name으로 호출된 경우 ID 찾기
-    if content_id is None and content_name is not None:
-        if content_type == 'released_product':
-            product = db.query(models.Releasedproduct).filter(
-                models.Releasedproduct.design_name == content_name
-            ).first()
-            if product:
-                content_id = product.id
-            else:
-                return 0
-        elif content_type == 'portfolio':
-            portfolio = db.query(models.Portfolio).filter(
-                models.Portfolio.design_name == content_name,
-                models.Portfolio.is_deleted == False
-            ).first()
-            if portfolio:
-                content_id = portfolio.id
-            else:
-                return 0
-    
+    content_id = _resolve_content_id(db, content_type, content_name, content_id)
     if content_id is None:
         return 0  # content_id가 없으면 처리 불가
 
-    # 현재 유저수 카운트 (ID 기반)
-    count = db.query(func.count(models.RealtimeUser.id)).filter(
-        and_(
-            models.RealtimeUser.content_type == content_type,
-            models.RealtimeUser.content_id == content_id
-        )
-    ).scalar()
+    return presence_service.count(content_type, content_id)
+
+
+def get_realtime_users_counts(
+        db: Session,
+        content_type: str,
+        content_ids: Iterable[int]
+) -> Dict[int, int]:
+    """여러 컨텐츠의 실시간 유저수를 한 번에 조회 (ID 기반)
+
+    목록 조회용 읽기 전용 함수입니다. 만료된 기록은 저장소가 집계에서 제외합니다.
+    """
+    content_ids = list({content_id for content_id in content_ids if content_id is not None})
+    if not content_ids:
+        return {}
+
+    return presence_service.counts(content_type, content_ids)
+
+
+def _existing_content_ids(db: Session, content_type: str, content_ids: List[int]) -> Set[int]:
+    """존재하는 컨텐츠 ID만 한 번에 조회"""
+    if content_type == 'released_product':
+        rows = db.query(models.Releasedproduct.id).filter(
+            models.Releasedproduct.id.in_(content_ids)
+        ).all()
+    elif content_type == 'portfolio':
+        rows = db.query(models.Portfolio.id).filter(
+            models.Portfolio.id.in_(content_ids),
+            models.Portfolio.is_deleted == False
+        ).all()
+    else:
+        return set()
+
+    return {row.id for row in rows}
 
-    return count or 0
\ No newline at end of file
+
+def apply_heartbeat(
+        db: Session,
+        user_id: str,
+        items: List[Tuple[str, int, str]]
+) -> List[Dict[str, Any]]:
+    """여러 컨텐츠의 입장/갱신/퇴장을 한 번에 처리 (ID 기반)
+
+    items: (content_type, content_id, action) 목록. 같은 컨텐츠가 여러 번 오면 마지막 action을 사용합니다.
+    존재하지 않는 컨텐츠는 처리하지 않고 found=False로 반환합니다.
+    """
+    actions: Dict[Tuple[str, int], str] = {}
+    for content_type, content_id, action in items:
+        actions[(content_type, content_id)] = action
+
+    # 컨텐츠 종류별로 존재 여부 일괄 확인
+    ids_by_type: Dict[str, List[int]] = {}
+    for content_type, content_id in actions:
+        ids_by_type.setdefault(content_type, []).append(content_id)
+    existing = {
+        (content_type, content_id)
+        for content_type, content_ids in ids_by_type.items()
+        for content_id in _existing_content_ids(db, content_type, content_ids)
+    }
+
+    enter_keys = [key for key, action in actions.items() if key in existing and action != 'leave']
+    leave_keys = [key for key, action in actions.items() if key in existing and action == 'leave']
+
+    counts = {}
+    if enter_keys or leave_keys:
+        counts = presence_service.heartbeat(user_id, enter_keys, leave_keys)
+
+    results = []
+    for key in actions:
+        content_type, content_id = key
+        count = counts.get(key, 0)
+        if key in existing:
+            # 구독 중인 클라이언트에 변경 알림
+            presence_hub.publish(content_type, content_id, count)
+        results.append({
+            "content_type": content_type,
+            "content_id": content_id,
+            "realtime_users": count,
+            "found": key in existing
+        })
+
+    return results
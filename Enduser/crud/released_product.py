@@ -1,9 +1,14 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
 from db import models
 from typing import Optional, Dict, Any, Union
-from datetime import date
 from Enduser.crud import realtime_users as realtime_users_crud
+from services.view_counter_service import view_counter_service
+from core.pagination import (
+    paginate, paginate_keyset, paginate_chained, paginate_keyset_chained, order_by_keys, count_total, COUNT_CACHED
+)
+from services.trending_service import trending_query_parts
+from core.search import contains
+from core.design_components import resolve_design_component, unity_components
 
 
 def get_released_products_paginated(
@@ -12,9 +17,14 @@ def get_released_products_paginated(
         size: int = 10,
         brand_name: Optional[str] = None,
         item_name: Optional[str] = None,
-        orderBy: Optional[str] = None
+        orderBy: Optional[str] = None,
+        cursor: Optional[str] = None,
+        use_cursor: bool = False
 ) -> Dict[str, Any]:
-    """출시 제품 목록을 페이지네이션하여 조회"""
+    """출시 제품 목록을 페이지네이션하여 조회
+
+    use_cursor=True 이면 page 대신 cursor(이전 응답의 next_cursor)로 다음 페이지를 조회합니다.
+    """
 
     query = db.query(models.Releasedproduct, models.Brand).join(
         models.Brand,
@@ -26,39 +36,53 @@ def get_released_products_paginated(
         query = query.filter(models.Brand.brand_name == brand_name)
 
     if item_name:
-        query = query.filter(models.Releasedproduct.design_name.contains(item_name))
-
-    # 전체 카운트
-    total_count = query.count()
+        query = query.filter(contains(models.Releasedproduct.design_name, item_name, case_sensitive=True))
 
-    # 정렬
+    # 정렬 (마지막 키는 유일한 id - cursor 페이지네이션에도 사용)
+    query_parts = None
     if orderBy == "latest":
         # 최신순 정렬
-        query = query.order_by(models.Releasedproduct.created_at.desc())
-    elif orderBy == "popularity" or orderBy is None:
-        # 인기순 정렬 (조회수 기준, 동일한 경우 디자인명 ABC순)
-        query = query.order_by(
-            models.Releasedproduct.views.desc(),
-            models.Releasedproduct.design_name.asc()
+        sort_keys = [
+            (models.Releasedproduct.created_at, True),
+            (models.Releasedproduct.id, True)
+        ]
+    elif orderBy == "trending":
+        # 트렌딩순 정렬 (시간 감쇠 조회수 점수 기준, 동일한 경우 디자인명 ABC순)
+        # 점수가 있는 항목(trending_scores 인덱스 순서) 뒤에 점수 없는 항목을 디자인명 ABC순으로 이어 붙임
+        query_parts = trending_query_parts(
+            query, 'released_product', models.Releasedproduct, models.Releasedproduct.design_name
         )
     else:
-        # 기본값: 인기순
-        query = query.order_by(
-            models.Releasedproduct.views.desc(),
-            models.Releasedproduct.design_name.asc()
-        )
+        # 인기순 정렬 - 기본값 (조회수 기준, 동일한 경우 디자인명 ABC순)
+        sort_keys = [
+            (models.Releasedproduct.views, True),
+            (models.Releasedproduct.design_name, False),
+            (models.Releasedproduct.id, False)
+        ]
+
+    # 페이지네이션 (전체 개수는 같은 필터 조건이면 잠시 캐시된 값 사용)
+    next_cursor = None
+    if use_cursor:
+        # cursor 모드: 마지막 정렬 키 다음부터 조회 (OFFSET 없음)
+        total_count = count_total(query, COUNT_CACHED)
+        if query_parts:
+            results, next_cursor = paginate_keyset_chained(query_parts, cursor, size)
+        else:
+            results, next_cursor = paginate_keyset(query, sort_keys, cursor, size)
+    elif query_parts:
+        results, total_count = paginate_chained(query_parts, page, size, count_strategy=COUNT_CACHED)
+    else:
+        results, total_count = paginate(order_by_keys(query, sort_keys), page, size, count_strategy=COUNT_CACHED)
 
-    # 페이지네이션
-    offset = (page - 1) * size
-    results = query.offset(offset).limit(size).all()
+    # 실시간 유저수 일괄 조회 (페이지 전체를 한 번의 쿼리로)
+    realtime_users_map = realtime_users_crud.get_realtime_users_counts(
+        db, 'released_product', [product.id for product, brand in results]
+    )
 
     # 결과 포맷팅
     formatted_items = []
     for product, brand in results:
-        # 실시간 유저수 조회
-        realtime_users = realtime_users_crud.get_realtime_users_count(
-            db, 'released_product', product.design_name
-        )
+        realtime_users = realtime_users_map.get(product.id, 0)
 
         formatted_items.append({
             "id": product.id,  # ID 추가
@@ -71,7 +95,8 @@ def get_released_products_paginated(
 
     return {
         "total_count": total_count,
-        "items": formatted_items
+        "items": formatted_items,
+        "next_cursor": next_cursor
     }
 
 
@@ -96,55 +121,15 @@ def get_released_product_detail(db: Session, item_name: str = None, product_id:
 
     product, brand = result
 
-    # 조회수 증가
-    product.views += 1
-
-    # DailyView 기록
-    today = date.today()
-    daily_view = db.query(models.DailyView).filter(
-        models.DailyView.view_date == today,
-        models.DailyView.content_type == 'released_product',
-        models.DailyView.content_id == product.id
-    ).first()
-
-    if daily_view:
-        daily_view.view_count += 1
-    else:
-        new_daily_view = models.DailyView(
-            view_date=today,
-            content_type='released_product',
-            content_id=product.id,
-            view_count=1
-        )
-        db.add(new_daily_view)
-
-    db.commit()
-    db.refresh(product)
+    # 조회수 증가 및 DailyView 기록 (버퍼에 모아 주기적으로 DB 반영)
+    view_counter_service.record('released_product', product.id)
 
     # 각 컴포넌트 정보 조회 (색상 정보만)
-    def get_component_info(color_id: str):
-        if not color_id:
-            return None
-
-        color = db.query(models.Color).filter(models.Color.id == color_id).first()
-
-        if not color:
-            return None
-
-        return {
-            "image_id": None,  # 출시제품은 이미지 정보 없음
-            "image_url": None,
-            "image_name": None,
-            "RGB_id": color_id,
-            "RGB_color": color.color_values,
-            "RGB_name": color.color_name,
-            "size": 100,
-            "opacity": 100
-        }
+    components = unity_components(resolve_design_component(db, product))
 
     # 실시간 유저수 조회
     realtime_users = realtime_users_crud.get_realtime_users_count(
-        db, 'released_product', product.design_name
+        db, 'released_product', content_id=product.id
     )
 
     return {
@@ -152,10 +137,10 @@ def get_released_product_detail(db: Session, item_name: str = None, product_id:
         "item_name": product.design_name,
         "color_name": product.color_name,
         "main_image_url": product.main_image_url,
-        "design_line": get_component_info(product.color_line_color_id),
-        "design_base1": get_component_info(product.color_base1_color_id),
-        "design_base2": get_component_info(product.color_base2_color_id),
-        "design_pupil": get_component_info(product.color_pupil_color_id),
+        "design_line": components["design_line"],
+        "design_base1": components["design_base1"],
+        "design_base2": components["design_base2"],
+        "design_pupil": components["design_pupil"],
         "graphic_diameter": product.graphic_diameter,
         "optic_zone": product.optic_zone,
         "base_curve": product.base_curve,  # 추가
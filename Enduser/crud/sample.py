@@ -1,8 +1,10 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, insert
 from db import models
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta, date
+from core.pagination import paginate, COUNT_WINDOW
+from core.design_components import resolve_design_component, resolve_design_components, unity_components
 
 
 def get_samples_paginated(
@@ -37,9 +39,6 @@ def get_samples_paginated(
         models.Progressstatus.portfolio_id == models.Portfolio.id
     )
 
-    # 전체 카운트
-    total_count = query.count()
-
     # 정렬
     if orderBy == "oldest":
         query = query.order_by(models.Progressstatus.created_at.asc())
@@ -47,13 +46,17 @@ def get_samples_paginated(
         # 기본값: 최신순
         query = query.order_by(models.Progressstatus.created_at.desc())
 
-    # 페이지네이션
-    offset = (page - 1) * size
-    results = query.offset(offset).limit(size).all()
+    # 페이지네이션 (페이지와 전체 개수를 한 번에 조회)
+    results, total_count = paginate(query, page, size, count_strategy=COUNT_WINDOW)
+
+    # 페이지 전체 디자인의 컴포넌트(이미지/컬러)를 한 번에 조회
+    resolved_components = resolve_design_components(
+        db, [portfolio or custom_design for progress_status, custom_design, portfolio in results]
+    )
 
     # 결과 포맷팅
     formatted_items = []
-    for progress_status, custom_design, portfolio in results:
+    for (progress_status, custom_design, portfolio), components in zip(results, resolved_components):
         # 카테고리 및 아이템 정보 결정
         if portfolio:
             item_name = portfolio.design_name
@@ -70,8 +73,8 @@ def get_samples_paginated(
         else:
             continue
 
-        # 디자인 컴포넌트 정보 조회
-        design_components = get_design_components(db, design_obj, category)
+        # 디자인 컴포넌트 정보 (커스텀디자인이면 투명도와 크기 사용, 포트폴리오면 100 고정)
+        design_components = unity_components(components, use_options=category == '커스텀디자인')
 
         # 상태 매핑 (0: 대기, 1: 진행중, 2: 지연, 3: 배송완료)
         status_map = {'0': '대기', '1': '진행중', '2': '지연', '3': '발송완료'}
@@ -272,74 +275,98 @@ def create_progress_status_from_cart(
     return True
 
 
-# Enduser/crud/sample.py (get_design_components 함수 부분만)
 def get_design_components(db: Session, design_obj: Any, category: str) -> Dict[str, Any]:
-    """디자인 컴포넌트 정보 조회"""
+    """디자인 컴포넌트 정보 조회 (커스텀디자인이면 투명도와 크기 사용, 포트폴리오면 100 고정)"""
+    return unity_components(resolve_design_component(db, design_obj), use_options=category == '커스텀디자인')
 
-    def get_component_info(image_id: str, color_id: str, transparency: Optional[str] = None,
-                           size: Optional[str] = None):
-        if not image_id or not color_id:
-            return None
 
-        image = db.query(models.Image).filter(models.Image.id == image_id).first()
-        color = db.query(models.Color).filter(models.Color.id == color_id).first()
+def create_progress_statuses_from_cart(
+        db: Session,
+        user: models.AdminUser,
+        category: str,
+        client_name: str,
+        number: str,
+        address: str,
+        request_note: Optional[str] = None
+) -> Dict[str, List[str]]:
+    """장바구니의 카테고리 전체를 한 트랜잭션으로 샘플 요청(progress_status) 생성
 
-        if not image or not color:
-            return None
+    장바구니 행을 잠근 뒤 디자인을 일괄 조회하고, progress_status 일괄 추가와 장바구니 일괄 삭제를
+    한 번에 커밋합니다. 디자인을 찾을 수 없는 아이템(삭제된 포트폴리오 등)은 실패로 보고하고
+    장바구니에 남겨 둡니다. 오류가 나면 아무것도 반영하지 않습니다.
 
-        # 커스텀디자인이면 투명도와 크기 사용, 포트폴리오면 100 고정
-        opacity = 100
-        component_size = 100
+    {"created": [아이템 이름], "failed": [아이템 이름]} 을 반환합니다.
+    """
+    # 동시에 같은 요청이 들어와도 한 번만 처리되도록 장바구니 행 잠금
+    cart_items = db.query(models.Cart).filter(
+        models.Cart.user_id == user.username,
+        models.Cart.category == category
+    ).order_by(models.Cart.created_at.asc(), models.Cart.id.asc()).with_for_update().all()
 
-        if category == '커스텀디자인':
-            if transparency:
-                try:
-                    opacity = int(transparency)
-                except (ValueError, TypeError):
-                    opacity = 100
-            if size:
-                try:
-                    component_size = int(size)
-                except (ValueError, TypeError):
-                    component_size = 100
-
-        return {
-            "image_id": image_id,
-            "image_url": image.public_url,
-            "image_name": image.display_name,
-            "RGB_id": color_id,
-            "RGB_color": color.color_values,
-            "RGB_name": color.color_name,
-            "size": component_size,
-            "opacity": opacity
-        }
+    if not cart_items:
+        return {"created": [], "failed": []}
 
-    return {
-        "design_line": get_component_info(
-            design_obj.design_line_image_id if hasattr(design_obj, 'design_line_image_id') else None,
-            design_obj.design_line_color_id if hasattr(design_obj, 'design_line_color_id') else None,
-            design_obj.line_transparency if hasattr(design_obj, 'line_transparency') else None,
-            design_obj.line_size if hasattr(design_obj, 'line_size') else None
-        ),
-        "design_base1": get_component_info(
-            design_obj.design_base1_image_id if hasattr(design_obj, 'design_base1_image_id') else None,
-            design_obj.design_base1_color_id if hasattr(design_obj, 'design_base1_color_id') else None,
-            design_obj.base1_transparency if hasattr(design_obj, 'base1_transparency') else None,
-            design_obj.base1_size if hasattr(design_obj, 'base1_size') else None
-        ),
-        "design_base2": get_component_info(
-            design_obj.design_base2_image_id if hasattr(design_obj, 'design_base2_image_id') else None,
-            design_obj.design_base2_color_id if hasattr(design_obj, 'design_base2_color_id') else None,
-            design_obj.base2_transparency if hasattr(design_obj, 'base2_transparency') else None,
-            design_obj.base2_size if hasattr(design_obj, 'base2_size') else None
-        ),
-        "design_pupil": get_component_info(
-            design_obj.design_pupil_image_id if hasattr(design_obj, 'design_pupil_image_id') else None,
-            design_obj.design_pupil_color_id if hasattr(design_obj, 'design_pupil_color_id') else None,
-            design_obj.pupil_transparency if hasattr(design_obj, 'pupil_transparency') else None,
-            design_obj.pupil_size if hasattr(design_obj, 'pupil_size') else None
-        )
-    }
+    item_names = {cart_item.item_name for cart_item in cart_items}
+
+    # 아이템 이름 -> (custom_design_id, portfolio_id, 요청사항)
+    designs = {}
+    if category == '커스텀디자인':
+        for custom_design in db.query(models.CustomDesign).filter(
+                models.CustomDesign.item_name.in_(item_names),
+                models.CustomDesign.user_id == user.username
+        ):
+            # Case 122: 커스텀 디자인의 완료 시 저장된 요청사항 사용
+            designs[custom_design.item_name] = (
+                custom_design.id, None,
+                custom_design.request_message or request_note or f"{category} 샘플 제작 요청"
+            )
+    else:  # 포트폴리오 (같은 이름이 여러 개면 id가 작은 것 사용)
+        for portfolio in db.query(models.Portfolio).filter(
+                models.Portfolio.design_name.in_(item_names),
+                models.Portfolio.is_deleted == False
+        ).order_by(models.Portfolio.id):
+            designs.setdefault(portfolio.design_name, (
+                None, portfolio.id, request_note or f"{category} 샘플 제작 요청"
+            ))
+
+    now = datetime.now()
+    progress_rows = []
+    processed_cart_ids = []
+    created, failed = [], []
+    for cart_item in cart_items:
+        design = designs.get(cart_item.item_name)
+        if design is None:
+            failed.append(cart_item.item_name)
+            continue
+
+        custom_design_id, portfolio_id, final_request_note = design
+        progress_rows.append({
+            "user_id": user.id,  # AdminUser의 id
+            "custom_design_id": custom_design_id,
+            "portfolio_id": portfolio_id,
+            "status": '0',  # 대기 상태
+            "notes": final_request_note,
+            "client_name": client_name,
+            "number": number,
+            "address": address,
+            "request_date": now,
+            "expected_shipping_date": now.date() + timedelta(days=10)
+        })
+        processed_cart_ids.append(cart_item.id)
+        created.append(cart_item.item_name)
+
+    try:
+        if progress_rows:
+            db.execute(insert(models.Progressstatus), progress_rows)
+            db.query(models.Cart).filter(
+                models.Cart.id.in_(processed_cart_ids)
+            ).delete(synchronize_session=False)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    return {"created": created, "failed": failed}
 
 
 def create_progress_status_from_cart_by_id(
@@ -120,8 +120,8 @@ def add_to_cart(
                 detail="해당 포트폴리오를 찾을 수 없습니다."
             )
 
-    # 장바구니에 추가
-    cart_crud.add_to_cart(
+    # 장바구니에 추가 (추가 후 개수를 같은 쿼리에서 반환)
+    counts = cart_crud.add_to_cart(
         db=db,
         user_id=current_user.username,
         item_name=cart_data.item_name,
@@ -129,13 +129,7 @@ def add_to_cart(
         category=cart_data.category
     )
 
-    # 추가 후 전체 개수 반환
-    count = cart_crud.get_cart_count(
-        db=db,
-        user_id=current_user.username
-    )
-
-    return cart_schema.CartCountResponse(count=count)
+    return cart_schema.CartCountResponse(count=counts["total_count"], category_count=counts["category_count"])
 
 
 # 우선순위: 정적 경로(/cart/by-id) 라우트를 파라미터 경로(/cart/{item_name})보다 먼저 선언해야
@@ -149,8 +143,8 @@ def add_to_cart_by_id(
 ):
     """ID 기반 장바구니 추가 (신규 엔드포인트)"""
 
-    # 장바구니에 추가
-    cart_crud.add_to_cart_by_id(
+    # 장바구니에 추가 (추가 후 개수를 같은 쿼리에서 반환)
+    counts = cart_crud.add_to_cart_by_id(
         db=db,
         user_id=current_user.username,
         portfolio_id=cart_data.portfolio_id,
@@ -158,13 +152,7 @@ def add_to_cart_by_id(
         main_image_url=cart_data.main_image_url
     )
 
-    # 추가 후 전체 개수 반환
-    count = cart_crud.get_cart_count(
-        db=db,
-        user_id=current_user.username
-    )
-
-    return cart_schema.CartCountResponse(count=count)
+    return cart_schema.CartCountResponse(count=counts["total_count"], category_count=counts["category_count"])
 
 
 @router.delete("/cart/by-id", response_model=cart_schema.CartCountResponse)
@@ -176,27 +164,21 @@ def delete_cart_item_by_id(
 ):
     """ID 기반 장바구니 단일 삭제 (신규 엔드포인트)"""
 
-    # 삭제 수행
-    success = cart_crud.delete_cart_item_by_id(
+    # 삭제 수행 (삭제 후 개수를 같은 쿼리에서 반환)
+    counts = cart_crud.delete_cart_item_by_id(
         db=db,
         user_id=current_user.username,
         portfolio_id=portfolio_id,
         custom_design_id=custom_design_id
     )
 
-    if not success:
+    if not counts:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="장바구니에서 해당 상품을 찾을 수 없습니다."
         )
 
-    # 삭제 후 전체 개수 반환
-    count = cart_crud.get_cart_count(
-        db=db,
-        user_id=current_user.username
-    )
-
-    return cart_schema.CartCountResponse(count=count)
+    return cart_schema.CartCountResponse(count=counts["total_count"], category_count=counts["category_count"])
 
 
 @router.delete("/cart/{item_name}", response_model=cart_schema.CartCountResponse)
@@ -215,27 +197,21 @@ def delete_cart_item(
             detail="카테고리는 '커스텀디자인' 또는 '포트폴리오'여야 합니다."
         )
 
-    # 삭제 수행
-    success = cart_crud.delete_cart_item(
+    # 삭제 수행 (삭제 후 개수를 같은 쿼리에서 반환)
+    counts = cart_crud.delete_cart_item(
         db=db,
         user_id=current_user.username,
         item_name=item_name,
         category=delete_data.category
     )
 
-    if not success:
+    if not counts:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="장바구니에서 해당 상품을 찾을 수 없습니다."
         )
 
-    # 삭제 후 전체 개수 반환
-    count = cart_crud.get_cart_count(
-        db=db,
-        user_id=current_user.username
-    )
-
-    return cart_schema.CartCountResponse(count=count)
+    return cart_schema.CartCountResponse(count=counts["total_count"], category_count=counts["category_count"])
 
 
 @router.delete("/cart", response_model=cart_schema.CartCountResponse)
@@ -253,26 +229,20 @@ def delete_cart_by_category(
             detail="카테고리는 '커스텀디자인' 또는 '포트폴리오'여야 합니다."
         )
 
-    # 일괄 삭제 수행
-    deleted_count = cart_crud.delete_cart_by_category(
+    # 일괄 삭제 수행 (삭제 후 개수를 같은 쿼리에서 반환)
+    counts = cart_crud.delete_cart_by_category(
         db=db,
         user_id=current_user.username,
         category=delete_data.category
     )
 
-    if deleted_count == 0:
+    if counts["deleted_count"] == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"장바구니에 {delete_data.category} 카테고리의 상품이 없습니다."
         )
 
-    # 삭제 후 전체 개수 반환
-    count = cart_crud.get_cart_count(
-        db=db,
-        user_id=current_user.username
-    )
-
-    return cart_schema.CartCountResponse(count=count)
+    return cart_schema.CartCountResponse(count=counts["total_count"], category_count=counts["category_count"])
 
 
 @router.post("/cart/by-id", response_model=cart_schema.CartCountResponse)
@@ -283,8 +253,8 @@ def add_to_cart_by_id(
 ):
     """ID 기반 장바구니 추가 (신규 엔드포인트)"""
 
-    # 장바구니에 추가
-    cart_crud.add_to_cart_by_id(
+    # 장바구니에 추가 (추가 후 개수를 같은 쿼리에서 반환)
+    counts = cart_crud.add_to_cart_by_id(
         db=db,
         user_id=current_user.username,
         portfolio_id=cart_data.portfolio_id,
@@ -292,13 +262,7 @@ def add_to_cart_by_id(
         main_image_url=cart_data.main_image_url
     )
 
-    # 추가 후 전체 개수 반환
-    count = cart_crud.get_cart_count(
-        db=db,
-        user_id=current_user.username
-    )
-
-    return cart_schema.CartCountResponse(count=count)
+    return cart_schema.CartCountResponse(count=counts["total_count"], category_count=counts["category_count"])
 
 
 @router.delete("/cart/by-id", response_model=cart_schema.CartCountResponse)
@@ -310,24 +274,18 @@ def delete_cart_item_by_id(
 ):
     """ID 기반 장바구니 단일 삭제 (신규 엔드포인트)"""
 
-    # 삭제 수행
-    success = cart_crud.delete_cart_item_by_id(
+    # 삭제 수행 (삭제 후 개수를 같은 쿼리에서 반환)
+    counts = cart_crud.delete_cart_item_by_id(
         db=db,
         user_id=current_user.username,
         portfolio_id=portfolio_id,
         custom_design_id=custom_design_id
     )
 
-    if not success:
+    if not counts:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="장바구니에서 해당 상품을 찾을 수 없습니다."
         )
 
-    # 삭제 후 전체 개수 반환
-    count = cart_crud.get_cart_count(
-        db=db,
-        user_id=current_user.username
-    )
-
-    return cart_schema.CartCountResponse(count=count)
+    return cart_schema.CartCountResponse(count=counts["total_count"], category_count=counts["category_count"])
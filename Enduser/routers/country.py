@@ -104,7 +104,7 @@ def get_sorted_countries(
     """
     포트폴리오에 노출된 국가들을 rank 순으로 정렬하여 반환합니다.
     
-    - portfolios 테이블의 exposed_countries 필드에 있는 국가 ID들만 추출
+    - portfolio_countries 테이블에서 삭제되지 않은 포트폴리오의 노출 국가만 조회
     - account 테이블의 language_preference에 따라 국가명을 반환
     - rank 필드 순으로 정렬
     """
@@ -120,28 +120,17 @@ def get_sorted_countries(
     else:
         language = 'ko'  # 기본값
     
-    # 모든 포트폴리오에서 exposed_countries 수집
-    portfolios = db.query(models.Portfolio).filter(
-        models.Portfolio.exposed_countries.isnot(None),
+    # 삭제되지 않은 포트폴리오에 노출된 국가 ID (portfolio_countries 인덱스 사용)
+    exposed_country_ids = db.query(models.PortfolioCountry.country_id).join(
+        models.Portfolio,
+        models.PortfolioCountry.portfolio_id == models.Portfolio.id
+    ).filter(
         models.Portfolio.is_deleted == False
-    ).all()
-    
-    # 중복 제거를 위한 set
-    exposed_country_ids = set()
-    
-    for portfolio in portfolios:
-        if portfolio.exposed_countries:
-            # exposed_countries는 "1,2,3" 형태로 저장되어 있음
-            country_ids = [id.strip() for id in portfolio.exposed_countries.split(',')]
-            exposed_country_ids.update(country_ids)
-    
-    # 노출된 국가가 없는 경우
-    if not exposed_country_ids:
-        return []
-    
-    # 해당 ID의 국가들을 rank 순으로 조회
+    ).distinct()
+
+    # 해당 ID의 국가들을 rank 순으로 조회 (노출된 국가가 없으면 빈 목록)
     countries = db.query(models.Country).filter(
-        models.Country.id.in_([int(id) for id in exposed_country_ids])
+        models.Country.id.in_(exposed_country_ids.scalar_subquery())
     ).order_by(models.Country.rank).all()
     
     # 국가 정보를 반환
@@ -22,20 +22,34 @@ def get_images_list(
         category: Optional[str] = Query(None, description="카테고리 필터링"),
         display_name: Optional[str] = Query(None, description="디자인 번호로 검색"),
         orderBy: Optional[str] = Query(None, description="정렬 기준"),
+        use_cursor: bool = Query(False, description="cursor 페이지네이션 사용 여부 (page 대신 cursor 사용)"),
+        cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (cursor 모드 첫 페이지는 생략)"),
         db: Session = Depends(get_db),
         current_user: models.AdminUser = Depends(get_current_user)
 ):
-    """관리자가 등록한 라인/바탕1/바탕2/동공 디자인 목록 조회"""
+    """관리자가 등록한 라인/바탕1/바탕2/동공 디자인 목록 조회
 
-    paginated_data = custom_design_crud.get_images_paginated(
-        db=db,
-        user_id=current_user.id,  # 현재 사용자 ID 전달
-        page=page,
-        size=size,
-        category=category,
-        display_name=display_name,
-        orderBy=orderBy
-    )
+    - use_cursor / cursor: cursor 페이지네이션 (첫 페이지는 use_cursor=true, 이후 응답의 next_cursor 전달)
+      cursor 모드의 total_count 는 결과가 1000건 이상이면 예상 값입니다.
+    """
+
+    try:
+        paginated_data = custom_design_crud.get_images_paginated(
+            db=db,
+            user_id=current_user.id,  # 현재 사용자 ID 전달
+            page=page,
+            size=size,
+            category=category,
+            display_name=display_name,
+            orderBy=orderBy,
+            cursor=cursor,
+            use_cursor=use_cursor or cursor is not None
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 cursor입니다."
+        )
 
     total_count = paginated_data["total_count"]
     total_pages = math.ceil(total_count / size) if total_count > 0 else 1
@@ -45,7 +59,8 @@ def get_images_list(
         total_pages=total_pages,
         page=page,
         size=size,
-        items=paginated_data["items"]
+        items=paginated_data["items"],
+        next_cursor=paginated_data["next_cursor"]
     )
 
 
@@ -20,7 +20,9 @@ def get_portfolio_list(
         exposed_countries: Optional[List[str]] = Query(None, description="노출 국가 ID 필터링"),
         is_fixed_axis: Optional[str] = Query(None, description="축고정 여부 필터링 (Y/N)"),
         item_name: Optional[str] = Query(None, description="디자인 이름으로 검색"),
-        orderBy: Optional[str] = Query("popularity", description="정렬 기준 (popularity: 인기순-기본값, latest: 최신순)"),
+        orderBy: Optional[str] = Query("popularity", description="정렬 기준 (popularity: 인기순-기본값, latest: 최신순, trending: 트렌딩순)"),
+        use_cursor: bool = Query(False, description="cursor 페이지네이션 사용 여부 (page 대신 cursor 사용)"),
+        cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (cursor 모드 첫 페이지는 생략)"),
         db: Session = Depends(get_db),
         current_user: models.AdminUser = Depends(get_current_user)
 ):
@@ -33,6 +35,9 @@ def get_portfolio_list(
     - orderBy: 정렬 기준
       - popularity: 인기순 (기본값) - 조회수 기준, 동일한 경우 디자인명 ABC순
       - latest: 최신순 - 생성일 기준
+      - trending: 트렌딩순 - 최근 조회수에 가중치를 둔 점수 기준 (반감기 TRENDING_HALF_LIFE_DAYS일)
+    - use_cursor / cursor: cursor 페이지네이션 (깊은 페이지도 일정한 속도, 인기순/트렌딩순은 페이지 사이에 조회수가 바뀐 항목이 중복되거나 빠질 수 있음)
+      - 첫 페이지는 use_cursor=true, 다음 페이지부터 응답의 next_cursor를 cursor로 전달
     """
 
     # is_fixed_axis 검증
@@ -43,22 +48,30 @@ def get_portfolio_list(
         )
 
     # orderBy 검증
-    if orderBy not in ['popularity', 'latest']:
+    if orderBy not in ['popularity', 'latest', 'trending']:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="orderBy는 'popularity' 또는 'latest'여야 합니다."
+            detail="orderBy는 'popularity', 'latest' 또는 'trending'이어야 합니다."
         )
 
-    paginated_data = portfolio_crud.get_portfolios_paginated(
-        db=db,
-        user_id=current_user.username,
-        page=page,
-        size=size,
-        exposed_countries=exposed_countries,
-        is_fixed_axis=is_fixed_axis,
-        item_name=item_name,
-        orderBy=orderBy
-    )
+    try:
+        paginated_data = portfolio_crud.get_portfolios_paginated(
+            db=db,
+            user_id=current_user.username,
+            page=page,
+            size=size,
+            exposed_countries=exposed_countries,
+            is_fixed_axis=is_fixed_axis,
+            item_name=item_name,
+            orderBy=orderBy,
+            cursor=cursor,
+            use_cursor=use_cursor or cursor is not None
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 cursor입니다."
+        )
 
     total_count = paginated_data["total_count"]
     total_pages = math.ceil(total_count / size) if total_count > 0 else 1
@@ -73,7 +86,8 @@ def get_portfolio_list(
         total_pages=total_pages,
         page=page,
         size=size,
-        items=items_with_account_code
+        items=items_with_account_code,
+        next_cursor=paginated_data["next_cursor"]
     )
 
 
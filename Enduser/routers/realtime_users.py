@@ -0,0 +1,115 @@
+import asyncio
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, Query, status
+from jose import JWTError, jwt
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from db.database import SessionLocal, get_db
+from db import models
+from core.config import settings
+from core.security import get_current_user
+from Manager.admin.crud import user as user_crud
+from Enduser.schemas import realtime_users as realtime_users_schema
+from Enduser.crud import realtime_users as realtime_users_crud
+from services.presence_hub import presence_hub, PresenceSubscription
+
+router = APIRouter(tags=["Realtime Users"])
+
+
+def _authenticate(token: str) -> bool:
+    """WebSocket 연결용 토큰 검증 (헤더 대신 쿼리 파라미터로 전달)"""
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return False
+
+    username = payload.get("sub")
+    if username is None:
+        return False
+
+    with SessionLocal() as db:
+        return user_crud.get_user_by_username(db, username=username) is not None
+
+
+@router.post("/realtime-users/heartbeat", response_model=realtime_users_schema.HeartbeatResponse)
+def realtime_users_heartbeat(
+        heartbeat_data: realtime_users_schema.HeartbeatRequest,
+        db: Session = Depends(get_db),
+        current_user: models.AdminUser = Depends(get_current_user)
+):
+    """
+    여러 컨텐츠 실시간 유저수 일괄 입장/갱신/퇴장
+
+    포트폴리오/출시제품별 enter·leave API를 항목마다 호출하는 대신 한 번에 처리합니다.
+
+    - items: [{"content_type": "portfolio" | "released_product", "content_id": 1, "action": "enter" | "refresh" | "leave"}]
+    - 응답: 각 항목의 처리 후 실시간 유저수 (존재하지 않는 컨텐츠는 found=false)
+    """
+    results = realtime_users_crud.apply_heartbeat(
+        db=db,
+        user_id=current_user.username,
+        items=[(item.content_type, item.content_id, item.action) for item in heartbeat_data.items]
+    )
+
+    return realtime_users_schema.HeartbeatResponse(items=results)
+
+
+@router.websocket("/realtime-users/ws")
+async def realtime_users_ws(
+        websocket: WebSocket,
+        token: str = Query(..., description="액세스 토큰")
+):
+    """
+    실시간 유저수 구독 (WebSocket)
+
+    폴링 대신 구독한 컨텐츠의 실시간 유저수가 바뀔 때만 전송합니다.
+
+    - 연결: /unity/realtime-users/ws?token={access_token}
+    - 구독: {"action": "subscribe", "items": [{"content_type": "portfolio", "content_id": 1}]}
+    - 해제: {"action": "unsubscribe", "items": [...]}
+    - 수신: 구독 직후 {"type": "snapshot", "items": [...]},
+      이후 변경 시 {"type": "delta", "items": [{"content_type", "content_id", "realtime_users"}]}
+    """
+    if not await run_in_threadpool(_authenticate, token):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    subscription = PresenceSubscription(asyncio.get_running_loop())
+
+    receive_task = asyncio.create_task(websocket.receive_json())
+    delta_task = asyncio.create_task(subscription.queue.get())
+
+    try:
+        while True:
+            done, _ = await asyncio.wait(
+                {receive_task, delta_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if delta_task in done:
+                items = [delta_task.result()]
+                # 대기 중인 변경분을 한 번에 묶어서 전송
+                while not subscription.queue.empty():
+                    items.append(subscription.queue.get_nowait())
+                await websocket.send_json({"type": "delta", "items": items})
+                delta_task = asyncio.create_task(subscription.queue.get())
+
+            if receive_task in done:
+                try:
+                    message = realtime_users_schema.SubscribeMessage(**receive_task.result())
+                except (ValueError, TypeError) as e:  # JSON 파싱 오류 및 ValidationError 포함
+                    await websocket.send_json({"type": "error", "detail": str(e)})
+                else:
+                    keys = [(item.content_type, item.content_id) for item in message.items]
+                    if message.action == 'subscribe':
+                        snapshot = await run_in_threadpool(presence_hub.subscribe, subscription, keys)
+                        await websocket.send_json({"type": "snapshot", "items": snapshot})
+                    else:
+                        presence_hub.unsubscribe(subscription, keys)
+                receive_task = asyncio.create_task(websocket.receive_json())
+
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receive_task.cancel()
+        delta_task.cancel()
+        presence_hub.unsubscribe(subscription)
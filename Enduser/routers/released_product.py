@@ -20,7 +20,9 @@ def get_released_product_list(
         size: int = Query(10, ge=1, le=100, description="페이지 당 항목 수"),
         brand_name: Optional[str] = Query(None, description="브랜드 이름"),
         item_name: Optional[str] = Query(None, description="디자인 이름으로 검색"),
-        orderBy: Optional[str] = Query("popularity", description="정렬 기준 (popularity: 인기순-기본값, latest: 최신순)"),
+        orderBy: Optional[str] = Query("popularity", description="정렬 기준 (popularity: 인기순-기본값, latest: 최신순, trending: 트렌딩순)"),
+        use_cursor: bool = Query(False, description="cursor 페이지네이션 사용 여부 (page 대신 cursor 사용)"),
+        cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (cursor 모드 첫 페이지는 생략)"),
         db: Session = Depends(get_db),
         current_user: models.AdminUser = Depends(get_current_user),
         language: str = Depends(get_current_language_dependency)  # 추가
@@ -28,20 +30,28 @@ def get_released_product_list(
     """선택된 브랜드에 해당하는 디자인 목록 조회"""
 
     # orderBy 검증
-    if orderBy not in ['popularity', 'latest']:
+    if orderBy not in ['popularity', 'latest', 'trending']:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="orderBy는 'popularity' 또는 'latest'여야 합니다."
+            detail="orderBy는 'popularity', 'latest' 또는 'trending'이어야 합니다."
         )
 
-    paginated_data = released_product_crud.get_released_products_paginated(
-        db=db,
-        page=page,
-        size=size,
-        brand_name=brand_name,
-        item_name=item_name,
-        orderBy=orderBy
-    )
+    try:
+        paginated_data = released_product_crud.get_released_products_paginated(
+            db=db,
+            page=page,
+            size=size,
+            brand_name=brand_name,
+            item_name=item_name,
+            orderBy=orderBy,
+            cursor=cursor,
+            use_cursor=use_cursor or cursor is not None
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 cursor입니다."
+        )
 
     total_count = paginated_data["total_count"]
     total_pages = math.ceil(total_count / size) if total_count > 0 else 1
@@ -62,7 +72,8 @@ def get_released_product_list(
         total_pages=total_pages,
         page=page,
         size=size,
-        items=items
+        items=items,
+        next_cursor=paginated_data["next_cursor"]
     )
 
 
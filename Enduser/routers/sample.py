@@ -6,9 +6,12 @@ from db import models
 from core.security import get_current_user
 from Enduser.schemas import sample as sample_schema
 from Enduser.crud import sample as sample_crud
+import logging
 import math
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(tags=["Sample"])
 
 
@@ -177,39 +180,32 @@ def create_all_samples_from_custom_design(
 ):
     """장바구니의 모든 커스텀디자인을 일괄 샘플 요청"""
 
-    # 카트에서 사용자의 모든 커스텀디자인 가져오기
-    cart_items = db.query(models.Cart).filter(
-        models.Cart.user_id == current_user.username,
-        models.Cart.category == "커스텀디자인"
-    ).all()
+    # 장바구니의 커스텀디자인 전체를 한 트랜잭션으로 요청 (배치 조회, 일괄 추가/삭제)
+    try:
+        result = sample_crud.create_progress_statuses_from_cart(
+            db=db,
+            user=current_user,
+            category='커스텀디자인',
+            client_name=client_name,
+            number=number,
+            address=address,
+            request_note=request_note
+        )
+    except Exception:
+        logger.exception(f"Bulk sample request from cart failed (user={current_user.username}, category=커스텀디자인)")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="샘플 요청 처리 중 오류가 발생했습니다."
+        )
 
-    if not cart_items:
+    if not result["created"] and not result["failed"]:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="장바구니에 커스텀디자인이 없습니다."
         )
 
-    success_count = 0
-    failed_items = []
-
-    for cart_item in cart_items:
-        try:
-            success = sample_crud.create_progress_status_from_cart(
-                db=db,
-                user_id=current_user.username,
-                item_name=cart_item.item_name,
-                category='커스텀디자인',
-                client_name=client_name,
-                number=number,
-                address=address,
-                request_note=request_note
-            )
-            if success:
-                success_count += 1
-            else:
-                failed_items.append(cart_item.item_name)
-        except Exception as e:
-            failed_items.append(cart_item.item_name)
+    success_count = len(result["created"])
+    failed_items = result["failed"]
 
     return sample_schema.BulkSampleResultResponse(
         result=f"커스텀디자인 {success_count}개 샘플 요청 완료",
@@ -230,39 +226,32 @@ def create_all_samples_from_portfolio(
 ):
     """장바구니의 모든 포트폴리오를 일괄 샘플 요청"""
 
-    # 카트에서 사용자의 모든 포트폴리오 가져오기
-    cart_items = db.query(models.Cart).filter(
-        models.Cart.user_id == current_user.username,
-        models.Cart.category == "포트폴리오"
-    ).all()
+    # 장바구니의 포트폴리오 전체를 한 트랜잭션으로 요청 (배치 조회, 일괄 추가/삭제)
+    try:
+        result = sample_crud.create_progress_statuses_from_cart(
+            db=db,
+            user=current_user,
+            category='포트폴리오',
+            client_name=client_name,
+            number=number,
+            address=address,
+            request_note=request_note
+        )
+    except Exception:
+        logger.exception(f"Bulk sample request from cart failed (user={current_user.username}, category=포트폴리오)")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="샘플 요청 처리 중 오류가 발생했습니다."
+        )
 
-    if not cart_items:
+    if not result["created"] and not result["failed"]:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="장바구니에 포트폴리오가 없습니다."
         )
 
-    success_count = 0
-    failed_items = []
-
-    for cart_item in cart_items:
-        try:
-            success = sample_crud.create_progress_status_from_cart(
-                db=db,
-                user_id=current_user.username,
-                item_name=cart_item.item_name,
-                category='포트폴리오',
-                client_name=client_name,
-                number=number,
-                address=address,
-                request_note=request_note
-            )
-            if success:
-                success_count += 1
-            else:
-                failed_items.append(cart_item.item_name)
-        except Exception as e:
-            failed_items.append(cart_item.item_name)
+    success_count = len(result["created"])
+    failed_items = result["failed"]
 
     return sample_schema.BulkSampleResultResponse(
         result=f"포트폴리오 {success_count}개 샘플 요청 완료",
@@ -6,6 +6,7 @@ from datetime import datetime
 # 장바구니 카운트 응답
 class CartCountResponse(BaseModel):
     count: int  # 장바구니에 담긴 상품 개수
+    category_count: Optional[int] = None  # 추가/삭제한 카테고리의 상품 개수
 
 
 # 장바구니 아이템
@@ -21,6 +21,7 @@ class PaginatedImageResponse(BaseModel):
     page: int
     size: int
     items: List[ImageListItem]
+    next_cursor: Optional[str] = None  # cursor 모드에서 다음 페이지 조회용 (마지막 페이지면 null)
 
 # 색상 목록 조회 스키마
 class ColorListItem(BaseModel):
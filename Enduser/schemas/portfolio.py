@@ -37,6 +37,7 @@ class PaginatedPortfolioResponse(BaseModel):
     page: int
     size: int
     items: List[PortfolioListItem]
+    next_cursor: Optional[str] = None  # cursor 모드에서 다음 페이지 조회용 (마지막 페이지면 null)
 
 
 # 포트폴리오 상세 조회 응답
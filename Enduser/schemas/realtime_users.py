@@ -0,0 +1,38 @@
+from pydantic import BaseModel, Field
+from typing import List, Literal
+
+
+# 실시간 유저수 대상 컨텐츠
+class ContentRef(BaseModel):
+    content_type: Literal['portfolio', 'released_product']  # 컨텐츠 종류
+    content_id: int  # portfolio.id 또는 releasedproduct.id
+
+
+# WebSocket 구독 요청 (클라이언트 → 서버)
+class SubscribeMessage(BaseModel):
+    action: Literal['subscribe', 'unsubscribe']  # 구독 / 구독 해제
+    items: List[ContentRef]
+
+
+
+# 하트비트 항목 (enter: 입장, refresh: 입장 시간 갱신, leave: 퇴장)
+class HeartbeatItem(ContentRef):
+    action: Literal['enter', 'refresh', 'leave'] = 'refresh'
+
+
+# 일괄 하트비트 요청
+class HeartbeatRequest(BaseModel):
+    items: List[HeartbeatItem] = Field(..., max_length=100)
+
+
+# 일괄 하트비트 결과 항목
+class HeartbeatResultItem(BaseModel):
+    content_type: str
+    content_id: int
+    realtime_users: int  # 처리 후 실시간 유저수
+    found: bool = True  # 컨텐츠 존재 여부 (없으면 처리하지 않음)
+
+
+# 일괄 하트비트 응답
+class HeartbeatResponse(BaseModel):
+    items: List[HeartbeatResultItem]
@@ -35,6 +35,7 @@ class PaginatedReleasedProductResponse(BaseModel):
     page: int
     size: int
     items: List[ReleasedProductListItem]
+    next_cursor: Optional[str] = None  # cursor 모드에서 다음 페이지 조회용 (마지막 페이지면 null)
 
 
 # 출시 제품 상세 정보 응답
@@ -6,6 +6,8 @@ from sqlalchemy import func
 from Manager.admin.schemas import user as user_schema
 
 from typing import Optional
+from core.pagination import paginate, COUNT_WINDOW
+from core.search import contains
 
 
 def get_user_by_username(db: Session, username: str):
@@ -138,9 +140,8 @@ def get_users_by_contact_name(db: Session, name: str):
     """
     담당자명(contact_name)으로 사용자 목록을 검색 (LIKE 검색) - 삭제되지 않은 사용자만
     """
-    search_pattern = f"%{name}%"
     return db.query(models.AdminUser).filter(
-        models.AdminUser.contact_name.like(search_pattern),
+        contains(models.AdminUser.contact_name, name, case_sensitive=True),
         models.AdminUser.is_deleted == False
     ).all()
 
@@ -166,11 +167,11 @@ def get_admin_users_paginated(
     if permission:
         query = query.filter(models.AdminUser.permission == permission)
     if username:
-        query = query.filter(models.AdminUser.username.like(f"%{username}%"))
+        query = query.filter(contains(models.AdminUser.username, username, case_sensitive=True))
     if company_name:
-        query = query.filter(models.AdminUser.company_name.like(f"%{company_name}%"))
+        query = query.filter(contains(models.AdminUser.company_name, company_name, case_sensitive=True))
     if contact_name:
-        query = query.filter(models.AdminUser.contact_name.like(f"%{contact_name}%"))
+        query = query.filter(contains(models.AdminUser.contact_name, contact_name, case_sensitive=True))
 
     # ▼▼▼▼▼ 전화번호 검색 로직 수정 ▼▼▼▼▼
     if contact_phone:
@@ -183,10 +184,8 @@ def get_admin_users_paginated(
             #    숫자가 아닌 모든 문자('[^0-9]')를 빈 문자열('')로 바꿉니다.
             #    그 결과와 search_digits를 LIKE로 비교합니다.
             db_phone_digits = func.regexp_replace(models.AdminUser.contact_phone, r'[^0-9]', '', 'g')
-            query = query.filter(db_phone_digits.like(f"%{search_digits}%"))
+            query = query.filter(contains(db_phone_digits, search_digits, case_sensitive=True))
 
-    total_count = query.count()
-    offset = (page - 1) * size
-    items = query.order_by(models.AdminUser.id.desc()).offset(offset).limit(size).all()
+    items, total_count = paginate(query.order_by(models.AdminUser.id.desc()), page, size, count_strategy=COUNT_WINDOW)
 
     return {"items": items, "total_count": total_count}
\ No newline at end of file
@@ -6,6 +6,7 @@ from typing import List, Dict, Any, Optional
 from db.database import get_db, engine
 from db import models
 from core.security import get_current_user
+from services.reference_cache import reference_cache
 import json
 from datetime import datetime, date
 
@@ -151,6 +152,7 @@ async def update_table_data(
                 db.execute(text(query), params)
 
         db.commit()
+        reference_cache.invalidate(table_name)  # 직접 SQL 수정은 세션 이벤트로 감지되지 않음
         return {"message": f"{len(updates['updates'])}개 행이 업데이트되었습니다."}
 
     except Exception as e:
@@ -191,6 +193,7 @@ async def delete_table_data(
             query = f"DELETE FROM {table_name} WHERE id IN ({placeholders})"
             db.execute(text(query), params)
             db.commit()
+            reference_cache.invalidate(table_name)
 
         return {"message": f"{len(ids)}개 행이 삭제되었습니다."}
 
@@ -238,6 +241,7 @@ async def insert_table_data(
             query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join(placeholders)})"
             db.execute(text(query), params)
             db.commit()
+            reference_cache.invalidate(table_name)
 
         return {"message": "새 행이 추가되었습니다."}
 
@@ -249,6 +253,19 @@ async def insert_table_data(
         )
 
 
+@router.get("/reference_cache")
+async def get_reference_cache_stats(
+        current_user: models.AdminUser = Depends(get_current_user)
+):
+    """참조 테이블 캐시의 테이블별 버전, 캐시 행 수, hit/miss 횟수를 반환합니다. (현재 워커 기준)"""
+    if current_user.permission not in ['admin', 'superadmin']:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다."
+        )
+    return reference_cache.stats()
+
+
 @router.get("/test")
 async def test_database_api():
     """데이터베이스 API 테스트"""
@@ -5,8 +5,9 @@ from db import models
 from typing import Optional
 from Manager.brand.schemas import brand as brand_schema
 from typing import List
-from sqlalchemy import or_
+from core.pagination import paginate
 from fastapi import HTTPException
+from core.search import contains
 
 def update_brand_ranks_bulk(db: Session, ranks: List[brand_schema.RankItem]):
     db.query(models.Brand).update(
@@ -48,7 +49,7 @@ def delete_brand_by_id(db: Session, brand_id: int) -> models.Brand:
 def get_all_brands_ordered(db: Session, brand_name: Optional[str] = None):
     query = db.query(models.Brand)
     if brand_name:
-        query = query.filter(models.Brand.brand_name.like(f"%{brand_name}%"))
+        query = query.filter(contains(models.Brand.brand_name, brand_name, case_sensitive=True))
     return query.order_by(models.Brand.rank).all()
 
 
@@ -65,8 +66,7 @@ def get_brands_paginated(
 ):
     query = db.query(models.Brand)
     if searchText:
-        search_pattern = f"%{searchText}%"
-        query = query.filter(or_(models.Brand.brand_name.like(search_pattern)))
+        query = query.filter(contains(models.Brand.brand_name, searchText, case_sensitive=True))
     if orderBy:
         try:
             order_column_name, order_direction = orderBy.split()
@@ -81,9 +81,7 @@ def get_brands_paginated(
     else:
         query = query.order_by(models.Brand.rank.asc())  # 기본 정렬은 rank 순
 
-    total_count = query.count()
-    offset = (page - 1) * size
-    items = query.offset(offset).limit(size).all()
+    items, total_count = paginate(query, page, size)  # 브랜드 수가 적으므로 exact count
 
     return {"items": items, "total_count": total_count}
 
@@ -6,6 +6,8 @@ from typing import Optional
 from sqlalchemy import or_, cast, Integer, func, case
 from fastapi import HTTPException
 import re
+from core.pagination import paginate, COUNT_WINDOW
+from core.search import contains
 
 
 def natural_sort_key(text):
@@ -155,15 +157,12 @@ def get_colors_paginated(
 
     # 1. 다중 컬럼 텍스트 검색
     if searchText:
-        search_pattern = f"%{searchText}%"
         query = query.filter(
             or_(
-                models.Color.color_name.like(search_pattern),
+                contains(models.Color.color_name, searchText, case_sensitive=True),
             )
         )
 
-    total_count = query.count()
-
     # 2. 동적 정렬 처리
     color_name_sort = False
     sort_desc = False
@@ -206,13 +205,13 @@ def get_colors_paginated(
         # color_name으로 정렬하는 경우: 모든 데이터를 가져와서 Python에서 자연 정렬
         all_items = query.all()
         sorted_items = sorted(all_items, key=lambda x: natural_sort_key(x.color_name), reverse=sort_desc)
-        
+        total_count = len(sorted_items)
+
         # 페이지네이션 적용
         offset = (page - 1) * size
         items = sorted_items[offset:offset + size]
     else:
-        # 다른 컬럼으로 정렬하는 경우: DB에서 페이지네이션 적용
-        offset = (page - 1) * size
-        items = query.offset(offset).limit(size).all()
+        # 다른 컬럼으로 정렬하는 경우: DB에서 페이지네이션 적용 (페이지와 전체 개수를 한 번에 조회)
+        items, total_count = paginate(query, page, size, count_strategy=COUNT_WINDOW)
 
     return {"items": items, "total_count": total_count}
\ No newline at end of file
@@ -45,19 +45,16 @@ def create_country(db: Session, country: country_schema.CountryCreate):
 def delete_country_by_id(db: Session, country_id: int) -> models.Country:
     """국가 ID로 국가를 삭제합니다. 종속성 검사를 포함합니다."""
 
-    # 종속성 검사: portfolio 테이블의 exposed_countries 필드에서 사용 여부 확인
-    portfolios = db.query(models.Portfolio).filter(
-        models.Portfolio.exposed_countries.isnot(None)
-    ).all()
-
-    for portfolio in portfolios:
-        if portfolio.exposed_countries:
-            country_ids = [id.strip() for id in portfolio.exposed_countries.split(',')]
-            if str(country_id) in country_ids:
-                raise HTTPException(
-                    status_code=400,
-                    detail="이 국가는 포트폴리오의 노출 국가로 설정되어 있으므로 삭제할 수 없습니다."
-                )
+    # 종속성 검사: portfolio_countries 테이블에서 사용 여부 확인
+    is_exposed = db.query(models.PortfolioCountry.portfolio_id).filter(
+        models.PortfolioCountry.country_id == country_id
+    ).first()
+
+    if is_exposed:
+        raise HTTPException(
+            status_code=400,
+            detail="이 국가는 포트폴리오의 노출 국가로 설정되어 있으므로 삭제할 수 없습니다."
+        )
 
     # 종속성이 없으면 삭제 진행
     country = db.query(models.Country).filter(models.Country.id == country_id).first()
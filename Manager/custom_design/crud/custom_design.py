@@ -3,7 +3,10 @@ from sqlalchemy import or_
 from Manager.custom_design.schemas import custom_design as custom_design_schema
 from db import models
 from typing import Optional, Dict, Any
+from core.pagination import paginate, COUNT_WINDOW
 from fastapi import HTTPException
+from core.search import contains
+from core.design_components import resolve_design_component, image_detail, color_detail, to_int
 # from Manager.progress_status.crud import progress_status as progress_status_crud  # Case 131: 자동 생성 제거
 
 
@@ -153,61 +156,28 @@ def get_design_detail_formatted(db: Session, design_id: int):
         print(f"ERROR in get_design_detail_formatted - get_design_by_id: {str(e)}")
         raise
 
-    def get_image_details(image_id: Optional[str], opacity: Optional[str], size: Optional[str]):
-        if not image_id:
-            return None
-        try:
-            # image_id를 정수로 변환
-            image_id_int = int(image_id)
-        except (ValueError, TypeError):
-            return None
-        image = db.query(models.Image).filter(models.Image.id == image_id_int).first()
-        if not image:
-            return None
-        try:
-            opacity_int = int(opacity) if opacity is not None else None
-            size_int = int(size) if size is not None else None
-        except (ValueError, TypeError):
-            opacity_int = None
-            size_int = None
-        return {
-            "id": image.id,
-            "display_name": image.display_name,
-            "public_url": image.public_url,
-            "opacity": opacity_int,
-            "size": size_int
-        }
-
-    def get_color_details(color_id: Optional[str]):
-        if not color_id:
-            return None
-        try:
-            # color_id를 정수로 변환
-            color_id_int = int(color_id)
-        except (ValueError, TypeError):
-            return None
-        color = db.query(models.Color).filter(models.Color.id == color_id_int).first()
-        if not color:
-            return None
-        return {
-            "id": color.id,
-            "color_name": color.color_name,
-            "color_values": color.color_values
-        }
+    def get_image_details(layer):
+        details = image_detail(layer)
+        if details:
+            details["opacity"] = to_int(layer.transparency)
+            details["size"] = to_int(layer.size)
+        return details
 
     try:
-        # 각 컴포넌트 정보 조회
-        design_line_details = get_image_details(db_design.design_line_image_id, db_design.line_transparency, db_design.line_size)
-        design_line_color_details = get_color_details(db_design.design_line_color_id)
+        # 각 컴포넌트 정보 조회 (이미지/컬러 일괄 조회)
+        layers = resolve_design_component(db, db_design)
+
+        design_line_details = get_image_details(layers['line'])
+        design_line_color_details = color_detail(layers['line'])
 
-        design_base1_details = get_image_details(db_design.design_base1_image_id, db_design.base1_transparency, db_design.base1_size)
-        design_base1_color_details = get_color_details(db_design.design_base1_color_id)
+        design_base1_details = get_image_details(layers['base1'])
+        design_base1_color_details = color_detail(layers['base1'])
 
-        design_base2_details = get_image_details(db_design.design_base2_image_id, db_design.base2_transparency, db_design.base2_size)
-        design_base2_color_details = get_color_details(db_design.design_base2_color_id)
+        design_base2_details = get_image_details(layers['base2'])
+        design_base2_color_details = color_detail(layers['base2'])
 
-        design_pupil_details = get_image_details(db_design.design_pupil_image_id, db_design.pupil_transparency, db_design.pupil_size)
-        design_pupil_color_details = get_color_details(db_design.design_pupil_color_id)
+        design_pupil_details = get_image_details(layers['pupil'])
+        design_pupil_color_details = color_detail(layers['pupil'])
 
         # 사용자 정보 조회하여 account_code 가져오기
         user = db.query(models.AdminUser).filter(models.AdminUser.username == db_design.user_id).first()
@@ -284,10 +254,10 @@ def get_designs_paginated(
         
         query = query.filter(
             or_(
-                models.CustomDesign.item_name.ilike(f"%{item_name}%"),
-                models.AdminUser.account_code.ilike(f"%{item_name}%"),
+                contains(models.CustomDesign.item_name, item_name),
+                contains(models.AdminUser.account_code, item_name),
                 # account_code + "-" + item_name 조합으로 검색 (NULL 안전)
-                combined_search.ilike(f"%{item_name}%")
+                contains(combined_search, item_name)
             )
         )
 
@@ -295,20 +265,18 @@ def get_designs_paginated(
         # user_name 파라미터로 AdminUser의 username 또는 contact_name을 검색
         query = query.filter(
             or_(
-                models.AdminUser.username.ilike(f"%{user_name}%"),
-                models.AdminUser.contact_name.ilike(f"%{user_name}%")
+                contains(models.AdminUser.username, user_name),
+                contains(models.AdminUser.contact_name, user_name)
             )
         )
 
     if status:
-        query = query.filter(models.CustomDesign.status.ilike(f"%{status}%"))
+        query = query.filter(contains(models.CustomDesign.status, status))
 
-    # 검색 조건에 맞는 총 개수 계산
-    total_count = query.count()
-
-    # 페이지네이션 적용
-    offset = (page - 1) * size
-    results = query.order_by(models.CustomDesign.created_at.desc()).offset(offset).limit(size).all()
+    # 페이지네이션 적용 (페이지와 검색 조건에 맞는 총 개수를 한 번에 조회)
+    results, total_count = paginate(
+        query.order_by(models.CustomDesign.created_at.desc()), page, size, count_strategy=COUNT_WINDOW
+    )
 
     # --- [수정 3] 결과를 새로운 형식에 맞게 가공 ---
     formatted_items = []
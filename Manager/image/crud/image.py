@@ -1,8 +1,37 @@
 from sqlalchemy.orm import Session
 from db import models
-from typing import Optional
+from typing import Optional, List
 from sqlalchemy import or_, cast, Integer, func
 from fastapi import HTTPException
+from core.pagination import paginate, COUNT_WINDOW
+from core.search import contains
+
+def parse_user_ids(exposed_users: Optional[str]) -> List[int]:
+    """콤마로 구분된 사용자 ID 문자열을 정수 목록으로 변환 (숫자가 아닌 값은 무시)"""
+    if not exposed_users:
+        return []
+    user_ids = []
+    for value in exposed_users.split(','):
+        value = value.strip()
+        if value.isdigit() and int(value) not in user_ids:
+            user_ids.append(int(value))
+    return user_ids
+
+
+def set_image_exposed_users(db: Session, image_id: int, exposed_users: Optional[str]):
+    """image_exposed_users 테이블을 exposed_users 문자열과 같게 맞춤 (커밋은 호출한 쪽에서 수행)
+
+    exposed_users가 비어 있으면 전체 공개이므로 행을 남기지 않습니다.
+    """
+    db.query(models.ImageExposedUser).filter(
+        models.ImageExposedUser.image_id == image_id
+    ).delete(synchronize_session=False)
+
+    db.add_all([
+        models.ImageExposedUser(image_id=image_id, user_id=user_id)
+        for user_id in parse_user_ids(exposed_users)
+    ])
+
 
 def update_image(
         db: Session,
@@ -20,6 +49,7 @@ def update_image(
     # exposed_users가 제공된 경우 업데이트 (None이나 빈 문자열도 허용)
     if exposed_users is not None:
         db_image.exposed_users = exposed_users
+        set_image_exposed_users(db, db_image.id, exposed_users)
 
     # 새로운 파일 정보가 제공된 경우에만 업데이트
     if new_object_name and new_public_url:
@@ -117,11 +147,10 @@ def get_images_paginated(
 
     # 2. 다중 컬럼 텍스트 검색 (searchText)
     if searchText:
-        search_pattern = f"%{searchText}%"
         query = query.filter(
             or_(
-                models.Image.display_name.like(search_pattern),
-                models.Image.category.like(search_pattern)
+                contains(models.Image.display_name, searchText, case_sensitive=True),
+                contains(models.Image.category, searchText, case_sensitive=True)
                 # 추가하고 싶은 다른 검색 대상 컬럼을 여기에 or_()로 추가
             )
         )
@@ -158,8 +187,6 @@ def get_images_paginated(
         # orderBy 파라미터가 없으면 기본 정렬 (최신순)
         query = query.order_by(models.Image.created_at.desc())
 
-    total_count = query.count()
-    offset = (page - 1) * size
-    items = query.offset(offset).limit(size).all()
+    items, total_count = paginate(query, page, size, count_strategy=COUNT_WINDOW)
 
     return {"items": items, "total_count": total_count}
\ No newline at end of file
@@ -113,6 +113,8 @@ def upload_image(
     new_image = models.Image(**image_data)
 
     db.add(new_image)
+    db.flush()
+    image_crud.set_image_exposed_users(db, new_image.id, exposed_users)
     db.commit()
     db.refresh(new_image)
 
@@ -1,13 +1,59 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy.orm import Session, Query
+from sqlalchemy import exists, false
 from db import models
 from Manager.portfolio.schemas import portfolio as portfolio_schema
 from typing import Optional, List, Dict, Any
 from fastapi import HTTPException
-from datetime import date
+from services.view_counter_service import view_counter_service
+from core.pagination import paginate, COUNT_WINDOW
+from core.search import contains
+from services.reference_cache import reference_cache
 # from Manager.progress_status.crud import progress_status as progress_status_crud  # Case 131: 자동 생성 제거
 
 
+def parse_country_ids(exposed_countries: Optional[str]) -> List[int]:
+    """콤마로 구분된 국가 ID 문자열을 정수 목록으로 변환 (숫자가 아닌 값은 무시, 순서 유지)"""
+    if not exposed_countries:
+        return []
+    country_ids = []
+    for value in exposed_countries.split(','):
+        value = value.strip()
+        if value.isdigit() and int(value) not in country_ids:
+            country_ids.append(int(value))
+    return country_ids
+
+
+def set_portfolio_countries(db: Session, portfolio_id: int, exposed_countries: Optional[str]):
+    """portfolio_countries 테이블을 exposed_countries 문자열과 같게 맞춤 (커밋은 호출한 쪽에서 수행)
+
+    전환 기간 동안 exposed_countries 컬럼과 portfolio_countries 테이블에 함께 기록합니다.
+    """
+    db.query(models.PortfolioCountry).filter(
+        models.PortfolioCountry.portfolio_id == portfolio_id
+    ).delete(synchronize_session=False)
+
+    db.add_all([
+        models.PortfolioCountry(portfolio_id=portfolio_id, country_id=country_id)
+        for country_id in parse_country_ids(exposed_countries)
+    ])
+
+
+def filter_by_exposed_countries(query: Query, country_ids: List[str]) -> Query:
+    """요청한 국가에 모두 노출된 포트폴리오만 남김 (portfolio_countries 인덱스 사용)"""
+    for country_id in country_ids:
+        country_id = str(country_id).strip()
+        if not country_id.isdigit():
+            # 숫자가 아닌 국가 ID는 일치하는 포트폴리오가 없음
+            return query.filter(false())
+        query = query.filter(
+            exists().where(
+                models.PortfolioCountry.country_id == int(country_id),
+                models.PortfolioCountry.portfolio_id == models.Portfolio.id
+            )
+        )
+    return query
+
+
 def create_portfolio(db: Session, portfolio: portfolio_schema.PortfolioCreate, user_id: int):
 
     if portfolio.is_fixed_axis not in ['Y', 'N']:
@@ -35,6 +81,8 @@ def create_portfolio(db: Session, portfolio: portfolio_schema.PortfolioCreate, u
     )
 
     db.add(db_portfolio)
+    db.flush()
+    set_portfolio_countries(db, db_portfolio.id, db_portfolio.exposed_countries)
     db.commit()
     db.refresh(db_portfolio)
 
@@ -76,6 +124,8 @@ def update_portfolio(
     update_data = portfolio_update.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(db_portfolio, key, value)
+    if 'exposed_countries' in update_data:
+        set_portfolio_countries(db, db_portfolio.id, db_portfolio.exposed_countries)
     db.commit()
     db.refresh(db_portfolio)
     return db_portfolio
@@ -99,27 +149,14 @@ def get_portfolios_paginated(
 
     query = query.filter( models.Portfolio.is_deleted == False)
     if design_name:
-        query = query.filter(models.Portfolio.design_name.ilike(f"%{design_name}%"))
+        query = query.filter(contains(models.Portfolio.design_name, design_name))
 
     if color_name:
-        query = query.filter(models.Portfolio.color_name.ilike(f"%{color_name}%"))
+        query = query.filter(contains(models.Portfolio.color_name, color_name))
 
     if exposed_countries:
-        # 각 국가 ID가 정확히 일치하는지 확인 (콤마로 구분된 값에서 정확한 매칭)
-        for country_id in exposed_countries:
-            # 정확한 매칭을 위한 조건들:
-            # 1. 시작 부분에 있는 경우: "1,2,3" -> "1"로 시작
-            # 2. 중간에 있는 경우: "4,1,2" -> ",1,"
-            # 3. 끝에 있는 경우: "2,3,1" -> ",1"로 끝
-            # 4. 전체가 하나인 경우: "1" -> 정확히 "1"
-            query = query.filter(
-                or_(
-                    models.Portfolio.exposed_countries == country_id,  # 전체가 하나인 경우
-                    models.Portfolio.exposed_countries.like(f"{country_id},%"),  # 시작 부분
-                    models.Portfolio.exposed_countries.like(f"%,{country_id},%"),  # 중간
-                    models.Portfolio.exposed_countries.like(f"%,{country_id}")  # 끝
-                )
-            )
+        # 요청한 국가 ID가 모두 노출 국가에 포함된 포트폴리오만 조회
+        query = filter_by_exposed_countries(query, exposed_countries)
 
     if is_fixed_axis is not None:
         query = query.filter(models.Portfolio.is_fixed_axis == is_fixed_axis)
@@ -157,9 +194,9 @@ def get_portfolios_paginated(
         # orderBy 파라미터가 없으면 기본 정렬 (최신순)
         query = query.order_by(models.Portfolio.created_at.desc())
 
-    total_count = query.count()
-    offset = (page - 1) * size
-    results = query.order_by(models.Portfolio.created_at.desc()).offset(offset).limit(size).all()
+    results, total_count = paginate(
+        query.order_by(models.Portfolio.created_at.desc()), page, size, count_strategy=COUNT_WINDOW
+    )
 
     # --- 5. 결과를 새로운 형식에 맞게 가공 ---
     formatted_items = []
@@ -181,13 +218,13 @@ def get_portfolios_paginated(
         if portfolio.exposed_countries:
             all_country_ids.update(id.strip() for id in portfolio.exposed_countries.split(',') if id.strip())
 
-    # ID를 한 번에 조회하여 딕셔너리로 만듦
-    images_map = {str(img.id): img for img in
-                  db.query(models.Image).filter(models.Image.id.in_(list(all_image_ids))).all()}
-    colors_map = {str(col.id): col for col in
-                  db.query(models.Color).filter(models.Color.id.in_(list(all_color_ids))).all()}
-    countries_map = {str(c.id): c.country_name for c in
-                     db.query(models.Country).filter(models.Country.id.in_(list(all_country_ids))).all()}
+    # ID를 한 번에 조회하여 딕셔너리로 만듦 (참조 테이블 캐시)
+    images_map = {str(img_id): img for img_id, img in
+                  reference_cache.get_many(db, 'images', all_image_ids).items()}
+    colors_map = {str(col_id): col for col_id, col in
+                  reference_cache.get_many(db, 'colors', all_color_ids).items()}
+    countries_map = {str(c_id): c.country_name for c_id, c in
+                     reference_cache.get_many(db, 'countries', all_country_ids).items()}
 
     # 헬퍼 함수
     def get_country_names(ids_str):
@@ -229,53 +266,24 @@ def get_portfolio_detail(db: Session, portfolio_id: int, is_admin: bool = True)
 
     # 조회수 증가 로직 - 관리자가 아닌 경우에만 증가
     if not is_admin:
-        db.query(models.Portfolio).filter(models.Portfolio.id == portfolio_id).update(
-            {models.Portfolio.views: models.Portfolio.views + 1},
-            synchronize_session=False,
-
-        )
-        # DailyView 기록 로직
-        today = date.today()
-
-        daily_view = db.query(models.DailyView).filter(
-            models.DailyView.view_date == today,
-            models.DailyView.content_type == 'portfolio',
-            models.DailyView.content_id == portfolio_id
-        ).first()
-
-        if daily_view:
-            # 데이터가 있으면 view_count를 1 증가
-            daily_view.view_count += 1
-        else:
-            # 데이터가 없으면 새로 생성
-            new_daily_view = models.DailyView(
-                view_date=today,
-                content_type='portfolio',
-                content_id=portfolio_id,
-                view_count=1
-            )
-            db.add(new_daily_view)
-
-        db.commit()
-        db.refresh(portfolio)
+        # 조회수 및 DailyView 기록 (엔드유저 상세 조회와 같이 버퍼에 모아 주기적으로 DB/랭킹에 반영)
+        view_counter_service.record('portfolio', portfolio_id)
 
     # 헬퍼 함수 정의
     def get_image_details(image_id: Optional[str]):
         if not image_id: return None
-        image = db.query(models.Image).filter(models.Image.id == image_id).first()
-        return image
+        return reference_cache.image(db, image_id)
 
     def get_color_details(color_id: Optional[str]):
         if not color_id: return None
-        color = db.query(models.Color).filter(models.Color.id == color_id).first()
-        return color
+        return reference_cache.color(db, color_id)
 
     def get_country_names(country_ids_str: str):
         if not country_ids_str: return ""
         country_ids = [cid.strip() for cid in country_ids_str.split(',') if cid.strip()]
         if not country_ids: return ""
-        countries = db.query(models.Country.country_name).filter(models.Country.id.in_(country_ids)).all()
-        return ", ".join([name for name, in countries])
+        countries = {str(c_id): c for c_id, c in reference_cache.get_many(db, 'countries', country_ids).items()}
+        return ", ".join([countries[cid].country_name for cid in country_ids if cid in countries])
 
     # 관련 객체들을 portfolio 객체에 동적으로 추가
     portfolio.user_name = user.contact_name or user.username
@@ -1,10 +1,15 @@
 # progress_status/crud/progress_status.py
 from sqlalchemy.orm import Session
 from db import models
-from datetime import timedelta, date
+from datetime import datetime, timedelta, timezone, date
 from Manager.progress_status.schemas import progress_status as progress_status_schema
-from typing import Optional
-from sqlalchemy import or_
+from typing import Callable, List, Optional, Tuple
+from core.pagination import paginate, COUNT_WINDOW
+from sqlalchemy import or_, insert, select, update, literal, any_, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+from core.search import contains
+from services.reference_cache import reference_cache
+from core.design_components import LAYERS, resolve_design_component, image_detail, color_detail, to_int
 
 def create_progress_status(
         db: Session,
@@ -82,74 +87,83 @@ def create_progress_status_for_portfolio(
     return create_progress_status(db, progress_status_data)
 
 
-def sync_existing_data(db: Session):
-    """기존 데이터를 기반으로 progress_status를 일괄 생성합니다."""
-    created_count = 0
+def _sync_custom_design_select(notes: str, expected_shipping_date: date):
+    """status가 '3'이고 progress_status(portfolio_id 없음)가 없는 custom_design -> 생성할 행"""
+    existing = select(models.Progressstatus.id).where(
+        models.Progressstatus.custom_design_id == models.CustomDesign.id,
+        models.Progressstatus.portfolio_id.is_(None)
+    )
+    return select(
+        models.AdminUser.id,
+        models.CustomDesign.id,
+        literal('0'),
+        literal(notes),
+        literal(expected_shipping_date),
+    ).select_from(models.CustomDesign).join(
+        models.AdminUser, models.AdminUser.username == models.CustomDesign.user_id
+    ).where(
+        models.CustomDesign.status == '3',
+        ~existing.exists()
+    )
 
-    # 1. status가 '3'인 모든 custom_design 찾기
-    completed_designs = db.query(models.CustomDesign).filter(
-        models.CustomDesign.status == '3'
-    ).all()
-
-    for design in completed_designs:
-        # progress_status가 없으면 생성
-        existing = db.query(models.Progressstatus).filter(
-            models.Progressstatus.custom_design_id == design.id,
-            models.Progressstatus.portfolio_id.is_(None)  # portfolio_id가 없는 것만
-        ).first()
-
-        if not existing:
-            # AdminUser에서 user_id 가져오기
-            user = db.query(models.AdminUser).filter(
-                models.AdminUser.username == design.user_id
-            ).first()
-
-            if user:
-                progress_status_data = progress_status_schema.ProgressStatusCreate(
-                    user_id=user.id,
-                    custom_design_id=design.id,
-                    portfolio_id=None,
-                    status="0",
-                    notes="기존 데이터 동기화 - custom_design"
-                )
-                create_progress_status(db, progress_status_data)
-                created_count += 1
-
-    # 2. 모든 portfolio에 대해 progress_status 생성 (업데이트 하지 않고 새로 생성)
-    portfolios = db.query(models.Portfolio).all()
-
-    for portfolio in portfolios:
-        # 포트폴리오와 연관된 custom_design 찾기
-        user = db.query(models.AdminUser).filter(
-            models.AdminUser.id == portfolio.user_id
-        ).first()
-
-        if user:
-            # 해당 사용자의 custom_design 찾기
-            custom_designs = db.query(models.CustomDesign).filter(
-                models.CustomDesign.user_id == user.username
-            ).order_by(models.CustomDesign.created_at.desc()).all()
-
-            if custom_designs:
-                # 가장 최근의 custom_design 사용
-                latest_design = custom_designs[0]
-
-                # 해당 portfolio_id를 가진 progress_status가 있는지 확인
-                existing = db.query(models.Progressstatus).filter(
-                    models.Progressstatus.portfolio_id == portfolio.id
-                ).first()
-
-                if not existing:
-                    # 새로 생성
-                    progress_status_data = progress_status_schema.ProgressStatusCreate(
-                        user_id=portfolio.user_id,
-                        custom_design_id=latest_design.id,
-                        portfolio_id=portfolio.id,
-                        status="0",
-                        notes="기존 데이터 동기화 - portfolio"
-                    )
-                    create_progress_status(db, progress_status_data)
-                    created_count += 1
+
+def _sync_portfolio_select(notes: str, expected_shipping_date: date):
+    """progress_status가 없는 portfolio -> 소유자의 가장 최근 custom_design과 함께 생성할 행"""
+    latest_design_id = select(models.CustomDesign.id).where(
+        models.CustomDesign.user_id == models.AdminUser.username
+    ).order_by(
+        models.CustomDesign.created_at.desc(), models.CustomDesign.id.desc()
+    ).limit(1).correlate(models.AdminUser).scalar_subquery()
+
+    existing = select(models.Progressstatus.id).where(
+        models.Progressstatus.portfolio_id == models.Portfolio.id
+    )
+    return select(
+        models.Portfolio.user_id,
+        latest_design_id,
+        models.Portfolio.id,
+        literal('0'),
+        literal(notes),
+        literal(expected_shipping_date),
+    ).select_from(models.Portfolio).join(
+        models.AdminUser, models.AdminUser.id == models.Portfolio.user_id
+    ).where(
+        latest_design_id.isnot(None),
+        ~existing.exists()
+    )
+
+
+# 기존 데이터 동기화 단계 (단계 이름, 생성 메모, INSERT 컬럼, SELECT 생성 함수)
+SYNC_STEPS = (
+    ('custom_design', "기존 데이터 동기화 - custom_design",
+     ('user_id', 'custom_design_id', 'status', 'notes', 'expected_shipping_date'),
+     _sync_custom_design_select),
+    ('portfolio', "기존 데이터 동기화 - portfolio",
+     ('user_id', 'custom_design_id', 'portfolio_id', 'status', 'notes', 'expected_shipping_date'),
+     _sync_portfolio_select),
+)
+
+
+def sync_existing_data(db: Session, on_step: Optional[Callable[[str, int], None]] = None) -> int:
+    """기존 데이터를 기반으로 progress_status를 일괄 생성하고 생성된 행 수를 반환합니다.
+
+    단계별로 INSERT ... SELECT ... WHERE NOT EXISTS 한 문장씩 실행하고 커밋하므로
+    중간에 실패해도 다시 실행하면 남은 행만 생성됩니다. on_step(단계 이름, 생성 수)은 단계가 끝날 때마다 호출됩니다.
+    """
+    # create_progress_status와 같이 요청일 + 10일을 예상 배송일로 설정
+    expected_shipping_date = (datetime.now(timezone.utc) + timedelta(days=10)).date()
+
+    created_count = 0
+    for step, notes, columns, build_select in SYNC_STEPS:
+        result = db.execute(
+            insert(models.Progressstatus).from_select(
+                list(columns), build_select(notes, expected_shipping_date)
+            )
+        )
+        db.commit()
+        created_count += result.rowcount
+        if on_step:
+            on_step(step, result.rowcount)
 
     return created_count
 
@@ -161,78 +175,198 @@ def get_progress_status_by_id(db: Session, progress_status_id: int):
     ).first()
 
 
+# 변경 이력 필드별 표시 이름 (legacy: 이관 시 해석하지 못한 구 텍스트 줄, new_value에 원문 보관)
+CHANGELOG_LABELS = {
+    'status': '진행현황',
+    'expected_shipping_date': '발송예정일',
+    'status_note': '발송메모',
+}
+
+# 변경 이력 표시 시간대 (한국 시간, UTC+9)
+CHANGELOG_TIMEZONE = timezone(timedelta(hours=9))
+
+
+def add_changelog_entries(db: Session, entries: List[dict]):
+    """변경 이력 행을 한 번의 INSERT로 추가합니다. (커밋은 호출한 쪽에서 수행)
+
+    entries: {progress_id, actor, field, old_value, new_value} 목록
+    """
+    if entries:
+        db.execute(insert(models.ProgressstatusChangelog), entries)
+
+
+def render_changelog(db: Session, progress_id: int) -> Optional[str]:
+    """진행 상태의 변경 이력을 기존 텍스트 형식(한 줄에 한 건, 오래된 순)으로 만듭니다."""
+    entries = db.query(models.ProgressstatusChangelog).filter(
+        models.ProgressstatusChangelog.progress_id == progress_id
+    ).order_by(models.ProgressstatusChangelog.id).all()
+    if not entries:
+        return None
+
+    lines = []
+    for entry in entries:
+        label = CHANGELOG_LABELS.get(entry.field)
+        if label is None:
+            lines.append(entry.new_value or "")
+            continue
+        created_at = entry.created_at or datetime.now(timezone.utc)
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        timestamp = created_at.astimezone(CHANGELOG_TIMEZONE).strftime("[%Y-%m-%d %H:%M]")
+        lines.append(
+            f"{timestamp} {label}: \"{entry.old_value or ''}\" → \"{entry.new_value or ''}\", {entry.actor}"
+        )
+    return "\n".join(lines)
+
+
+# 진행 상태 표시 이름
+STATUS_LABELS = {'0': '대기', '1': '진행중', '2': '지연', '3': '발송완료'}
+
+
+def build_changelog_entries(old_values: dict, update_data: dict) -> List[tuple]:
+    """변경 전 값과 수정할 값으로 변경 이력 (field, old_value, new_value) 목록을 만듭니다.
+
+    값이 실제로 바뀐 status, expected_shipping_date, status_note만 기록합니다.
+    """
+    entries = []
+    for key, value in update_data.items():
+        old_value = old_values.get(key)
+        if old_value == value:
+            continue
+
+        if key == 'status':
+            old_status = STATUS_LABELS.get(str(old_value), str(old_value))
+            new_status = STATUS_LABELS.get(str(value), str(value))
+
+            # 발송완료로 변경될 때 status_note 포함
+            if value == '3' and update_data.get('status_note'):
+                new_status = f"{new_status}({update_data['status_note']})"
+
+            entries.append((key, old_status, new_status))
+
+        elif key == 'expected_shipping_date':
+            old_date = old_value.strftime("%y-%m-%d") if old_value else "미정"
+            new_date = value.strftime("%y-%m-%d") if value else "미정"
+            entries.append((key, old_date, new_date))
+
+        elif key == 'status_note':
+            # status가 3일 때만 의미가 있지만 언제든 변경 가능, 둘 중 하나라도 값이 있을 때만 기록
+            old_note = old_value if old_value else ""
+            new_note = value if value else ""
+            if old_note or new_note:
+                entries.append((key, old_note, new_note))
+    return entries
+
+
 def update_progress_status(
         db: Session,
         db_progress_status: models.Progressstatus,
         progress_status_update: progress_status_schema.ProgressStatusUpdate,
         current_user: models.AdminUser
 ):
-    """진행 상태 정보를 업데이트합니다."""
-    from datetime import datetime, timezone, timedelta
-    
-    # 변경 이력을 위한 정보
-    changelog_entries = []
-    # 한국 시간대 (UTC+9) 적용
-    kst = timezone(timedelta(hours=9))
-    timestamp = datetime.now(kst).strftime("[%Y-%m-%d %H:%M]")
+    """진행 상태 정보를 업데이트하고 변경 이력을 progressstatus_changelog에 추가합니다."""
     user_info = f"{current_user.username}({current_user.company_name})"
-    
-    # 상태 매핑
-    status_map = {'0': '대기', '1': '진행중', '2': '지연', '3': '발송완료'}
-    
     update_data = progress_status_update.model_dump(exclude_unset=True)
-    
+
+    old_values = {key: getattr(db_progress_status, key) for key in update_data}
+    changelog_entries = build_changelog_entries(old_values, update_data)
+
+    # 값이 실제로 변경된 필드만 업데이트
     for key, value in update_data.items():
-        old_value = getattr(db_progress_status, key)
-        
-        # 값이 실제로 변경된 경우에만 처리
-        if old_value != value:
-            if key == 'status':
-                # 상태값 변경
-                old_status = status_map.get(str(old_value), str(old_value))
-                new_status = status_map.get(str(value), str(value))
-                
-                # 발송완료로 변경될 때 status_note 포함
-                if value == '3' and 'status_note' in update_data and update_data['status_note']:
-                    new_status = f"{new_status}({update_data['status_note']})"
-                
-                changelog_entries.append(
-                    f"{timestamp} 진행현황: \"{old_status}\" → \"{new_status}\", {user_info}"
-                )
-            
-            elif key == 'expected_shipping_date':
-                # 발송예정일 변경
-                old_date = old_value.strftime("%y-%m-%d") if old_value else "미정"
-                new_date = value.strftime("%y-%m-%d") if value else "미정"
-                changelog_entries.append(
-                    f"{timestamp} 발송예정일: \"{old_date}\" → \"{new_date}\", {user_info}"
-                )
-            
-            elif key == 'status_note':
-                # status_note 변경 (status가 3일 때만 의미가 있지만, 언제든 변경 가능)
-                old_note = old_value if old_value else ""
-                new_note = value if value else ""
-                if old_note or new_note:  # 둘 중 하나라도 값이 있을 때만 로그 기록
-                    changelog_entries.append(
-                        f"{timestamp} 발송메모: \"{old_note}\" → \"{new_note}\", {user_info}"
-                    )
-            
-            # 실제 값 업데이트
+        if old_values[key] != value:
             setattr(db_progress_status, key, value)
-    
+
     # 변경 이력 추가
-    if changelog_entries:
-        current_changelog = db_progress_status.changelog or ""
-        if current_changelog:
-            current_changelog += "\n"
-        current_changelog += "\n".join(changelog_entries)
-        db_progress_status.changelog = current_changelog
-    
+    add_changelog_entries(db, [
+        {
+            "progress_id": db_progress_status.id,
+            "actor": user_info,
+            "field": field,
+            "old_value": old,
+            "new_value": new,
+        }
+        for field, old, new in changelog_entries
+    ])
+
     db.commit()
     db.refresh(db_progress_status)
     return db_progress_status
 
 
+# 일괄 수정 시 변경 이력에 필요한 변경 전 값
+_BULK_OLD_COLUMNS = ('status', 'status_note', 'expected_shipping_date')
+
+
+def bulk_update_progress_status(
+        db: Session,
+        ids: List[int],
+        progress_status_update: progress_status_schema.ProgressStatusUpdate,
+        current_user: models.AdminUser
+) -> Tuple[List[dict], List[int]]:
+    """여러 진행 상태에 같은 수정 내용을 적용하고 (수정된 행 목록, 이미 같은 값이라 수정하지 않은 id 목록)을 반환합니다.
+
+    WITH old AS (SELECT ... WHERE id = ANY(:ids) FOR UPDATE), updated AS (UPDATE ... RETURNING)
+    한 문장으로 변경 전/후 값을 함께 받고, 변경 이력은 한 번의 INSERT로 추가한 뒤 한 번 커밋합니다.
+    값이 하나도 바뀌지 않는 행은 IS DISTINCT FROM 조건으로 UPDATE 하지 않습니다. (updated_at, 카운터 트리거 유지)
+    없는 id는 두 목록 모두에서 빠집니다.
+    """
+    user_info = f"{current_user.username}({current_user.company_name})"
+    update_data = progress_status_update.model_dump(exclude_unset=True)
+    table = models.Progressstatus.__table__
+
+    old = select(
+        table.c.id, *(table.c[key] for key in _BULK_OLD_COLUMNS)
+    ).where(
+        table.c.id == any_(literal(list(ids), ARRAY(Integer)))
+    ).with_for_update().cte('old')
+
+    returned_columns = [column for column in table.c if column.key != 'changelog']
+    updated = (
+        update(table)
+        .where(
+            table.c.id == old.c.id,
+            or_(*(table.c[key].is_distinct_from(value) for key, value in update_data.items()))
+        )
+        .values(**update_data)
+        .returning(*returned_columns)
+        .cte('updated')
+    )
+    rows = db.execute(
+        select(
+            *(old.c[key].label(f'old_{key}') for key in ('id',) + _BULK_OLD_COLUMNS),
+            *updated.c
+        ).select_from(
+            old.outerjoin(updated, updated.c.id == old.c.id)
+        )
+    ).mappings().all()
+
+    updated_rows = []
+    unchanged_ids = []
+    changelog_entries = []
+    for row in rows:
+        if row['id'] is None:
+            unchanged_ids.append(row['old_id'])
+            continue
+
+        old_values = {key: row[f'old_{key}'] for key in _BULK_OLD_COLUMNS}
+        changelog_entries.extend(
+            {
+                "progress_id": row['id'],
+                "actor": user_info,
+                "field": field,
+                "old_value": old_value,
+                "new_value": new_value,
+            }
+            for field, old_value, new_value in build_changelog_entries(old_values, update_data)
+        )
+        updated_rows.append({column.key: row[column.key] for column in returned_columns})
+
+    add_changelog_entries(db, changelog_entries)
+    db.commit()
+
+    return sorted(updated_rows, key=lambda row: row['id']), sorted(unchanged_ids)
+
+
 def delete_progress_status_by_id(db: Session, progress_status_id: int) -> bool:
     """ID로 진행 상태를 삭제합니다."""
     db_progress_status = db.query(models.Progressstatus).filter(
@@ -251,137 +385,21 @@ def process_component_details(db, result, design_obj):
     # 커스텀 디자인인지 확인
     is_custom_design = isinstance(design_obj, models.CustomDesign)
 
-    # 디자인 라인 정보
-    if hasattr(design_obj, 'design_line_image_id') and design_obj.design_line_image_id:
-        design_line = db.query(models.Image).filter(models.Image.id == design_obj.design_line_image_id).first()
-        if design_line:
-            line_data = {
-                'id': design_line.id,
-                'display_name': design_line.display_name,
-                'public_url': design_line.public_url,
-            }
-
-            # 커스텀 디자인이면 투명도 정보 추가
-            if is_custom_design and hasattr(design_obj, 'line_transparency') and design_obj.line_transparency:
-                try:
-                    line_data['opacity'] = int(design_obj.line_transparency)
-                except (ValueError, TypeError):
-                    pass
+    # 레이어별 이미지/컬러 일괄 조회
+    layers = resolve_design_component(db, design_obj)
 
-            result['design_line'] = line_data
-    else:
-        result['design_line'] = None
-
-    # 디자인 라인 컬러 정보
-    if hasattr(design_obj, 'design_line_color_id') and design_obj.design_line_color_id:
-        design_line_color = db.query(models.Color).filter(models.Color.id == design_obj.design_line_color_id).first()
-        if design_line_color:
-            result['design_line_color'] = {
-                'id': design_line_color.id,
-                'color_name': design_line_color.color_name,
-                'color_values': design_line_color.color_values
-            }
-    else:
-        result['design_line_color'] = None
-
-    # 디자인 base1 정보
-    if hasattr(design_obj, 'design_base1_image_id') and design_obj.design_base1_image_id:
-        design_base1 = db.query(models.Image).filter(models.Image.id == design_obj.design_base1_image_id).first()
-        if design_base1:
-            base1_data = {
-                'id': design_base1.id,
-                'display_name': design_base1.display_name,
-                'public_url': design_base1.public_url
-            }
-
-            # 커스텀 디자인이면 투명도 정보 추가
-            if is_custom_design and hasattr(design_obj, 'base1_transparency') and design_obj.base1_transparency:
-                try:
-                    base1_data['opacity'] = int(design_obj.base1_transparency)
-                except (ValueError, TypeError):
-                    pass
-
-            result['design_base1'] = base1_data
-    else:
-        result['design_base1'] = None
-
-    # 디자인 base1 컬러 정보
-    if hasattr(design_obj, 'design_base1_color_id') and design_obj.design_base1_color_id:
-        design_base1_color = db.query(models.Color).filter(models.Color.id == design_obj.design_base1_color_id).first()
-        if design_base1_color:
-            result['design_base1_color'] = {
-                'id': design_base1_color.id,
-                'color_name': design_base1_color.color_name,
-                'color_values': design_base1_color.color_values
-            }
-    else:
-        result['design_base1_color'] = None
-
-    # 디자인 base2 정보
-    if hasattr(design_obj, 'design_base2_image_id') and design_obj.design_base2_image_id:
-        design_base2 = db.query(models.Image).filter(models.Image.id == design_obj.design_base2_image_id).first()
-        if design_base2:
-            base2_data = {
-                'id': design_base2.id,
-                'display_name': design_base2.display_name,
-                'public_url': design_base2.public_url
-            }
-
-            # 커스텀 디자인이면 투명도 정보 추가
-            if is_custom_design and hasattr(design_obj, 'base2_transparency') and design_obj.base2_transparency:
-                try:
-                    base2_data['opacity'] = int(design_obj.base2_transparency)
-                except (ValueError, TypeError):
-                    pass
-
-            result['design_base2'] = base2_data
-    else:
-        result['design_base2'] = None
-
-    # 디자인 base2 컬러 정보
-    if hasattr(design_obj, 'design_base2_color_id') and design_obj.design_base2_color_id:
-        design_base2_color = db.query(models.Color).filter(models.Color.id == design_obj.design_base2_color_id).first()
-        if design_base2_color:
-            result['design_base2_color'] = {
-                'id': design_base2_color.id,
-                'color_name': design_base2_color.color_name,
-                'color_values': design_base2_color.color_values
-            }
-    else:
-        result['design_base2_color'] = None
-
-    # 디자인 pupil 정보
-    if hasattr(design_obj, 'design_pupil_image_id') and design_obj.design_pupil_image_id:
-        design_pupil = db.query(models.Image).filter(models.Image.id == design_obj.design_pupil_image_id).first()
-        if design_pupil:
-            pupil_data = {
-                'id': design_pupil.id,
-                'display_name': design_pupil.display_name,
-                'public_url': design_pupil.public_url,
-            }
+    for layer_name in LAYERS:
+        layer = layers[layer_name]
 
-            # 커스텀 디자인이면 투명도 정보 추가
-            if is_custom_design and hasattr(design_obj, 'pupil_transparency') and design_obj.pupil_transparency:
-                try:
-                    pupil_data['opacity'] = int(design_obj.pupil_transparency)
-                except (ValueError, TypeError):
-                    pass
+        image_data = image_detail(layer)
+        # 커스텀 디자인이면 투명도 정보 추가
+        if image_data and is_custom_design:
+            opacity = to_int(layer.transparency)
+            if opacity is not None:
+                image_data['opacity'] = opacity
 
-            result['design_pupil'] = pupil_data
-    else:
-        result['design_pupil'] = None
-
-    # 디자인 pupil 컬러 정보
-    if hasattr(design_obj, 'design_pupil_color_id') and design_obj.design_pupil_color_id:
-        design_pupil_color = db.query(models.Color).filter(models.Color.id == design_obj.design_pupil_color_id).first()
-        if design_pupil_color:
-            result['design_pupil_color'] = {
-                'id': design_pupil_color.id,
-                'color_name': design_pupil_color.color_name,
-                'color_values': design_pupil_color.color_values
-            }
-    else:
-        result['design_pupil_color'] = None
+        result[f'design_{layer_name}'] = image_data
+        result[f'design_{layer_name}_color'] = color_detail(layer)
 
 
 def get_progress_status_detail(db: Session, progress_status_id: int):
@@ -402,7 +420,7 @@ def get_progress_status_detail(db: Session, progress_status_id: int):
     result['number'] = progress_status.number
     result['address'] = progress_status.address
     result['status_note'] = progress_status.status_note
-    result['changelog'] = progress_status.changelog  # 변경 이력 추가
+    result['changelog'] = render_changelog(db, progress_status.id)  # 변경 이력 추가
 
 
     # 사용자 정보 조회
@@ -468,15 +486,8 @@ def get_progress_status_paginated(
 ):
     """진행 상태 목록을 페이지네이션하여 조회합니다."""
 
-    # 배송 예정일이 지난 진행중(1) 상태를 조회 전에 일괄 지연(2) 상태로 반영
-    today = date.today()
-    updated_rows = db.query(models.Progressstatus).filter(
-        models.Progressstatus.status == '1',
-        models.Progressstatus.expected_shipping_date.isnot(None),
-        models.Progressstatus.expected_shipping_date < today
-    ).update({models.Progressstatus.status: '2'}, synchronize_session=False)
-    if updated_rows:
-        db.commit()
+    # 배송 예정일이 지난 진행중(1) -> 지연(2) 변경은 services/progress_delay_service.py 에서 하루 한 번 수행
+    # (조회는 읽기 전용)
 
     # 기본 쿼리 - 필요한 테이블들을 조인
     query = db.query(
@@ -497,7 +508,7 @@ def get_progress_status_paginated(
     # 필터링 적용
     if user_name:
         query = query.filter(
-            models.AdminUser.username.ilike(f"%{user_name}%")  # username으로만 검색
+            contains(models.AdminUser.username, user_name)  # username으로만 검색
         )
 
     if custom_design_name:
@@ -505,23 +516,23 @@ def get_progress_status_paginated(
             # account_code와 함께 검색하도록 수정
             query = query.filter(
                 or_(
-                    models.CustomDesign.item_name.ilike(f"%{custom_design_name}%"),
-                    models.Portfolio.design_name.ilike(f"%{custom_design_name}%"),
+                    contains(models.CustomDesign.item_name, custom_design_name),
+                    contains(models.Portfolio.design_name, custom_design_name),
                     # account_code와 item_name을 조합한 검색 추가
-                    (models.AdminUser.account_code + '-' + models.CustomDesign.item_name).ilike(f"%{custom_design_name}%")
+                    contains((models.AdminUser.account_code + '-' + models.CustomDesign.item_name), custom_design_name)
                 )
             )
         elif type == 0:
             # 커스텀 디자인의 경우 account_code와 함께 검색
             query = query.filter(
                 or_(
-                    models.CustomDesign.item_name.ilike(f"%{custom_design_name}%"),
-                    (models.AdminUser.account_code + '-' + models.CustomDesign.item_name).ilike(f"%{custom_design_name}%")
+                    contains(models.CustomDesign.item_name, custom_design_name),
+                    contains((models.AdminUser.account_code + '-' + models.CustomDesign.item_name), custom_design_name)
                 )
             )
         elif type == 1:
             query = query.filter(
-                models.Portfolio.design_name.ilike(f"%{custom_design_name}%")
+                contains(models.Portfolio.design_name, custom_design_name)
             )
 
     if type is not None:
@@ -533,14 +544,10 @@ def get_progress_status_paginated(
     if status:
         query = query.filter(models.Progressstatus.status == status)
 
-    # 총 개수 계산
-    total_count = query.count()
-
-    # 페이지네이션 적용
-    offset = (page - 1) * size
-    results = query.order_by(
-        models.Progressstatus.created_at.desc()
-    ).offset(offset).limit(size).all()
+    # 페이지네이션 적용 (페이지와 총 개수를 한 번에 조회)
+    results, total_count = paginate(
+        query.order_by(models.Progressstatus.created_at.desc()), page, size, count_strategy=COUNT_WINDOW
+    )
 
     # N+1 문제 해결을 위한 ID 사전 수집 로직 (기존과 동일)
     all_image_ids = set()
@@ -560,11 +567,11 @@ def get_progress_status_paginated(
             all_image_ids.update(filter(None, image_ids))
             all_color_ids.update(filter(None, color_ids))
 
-    # ID를 한 번에 조회하여 딕셔너리로 만듦
-    images_map = {str(img.id): img for img in
-                  db.query(models.Image).filter(models.Image.id.in_(list(all_image_ids))).all()} if all_image_ids else {}
-    colors_map = {str(col.id): col for col in
-                  db.query(models.Color).filter(models.Color.id.in_(list(all_color_ids))).all()} if all_color_ids else {}
+    # ID를 한 번에 조회하여 딕셔너리로 만듦 (참조 테이블 캐시)
+    images_map = {str(img_id): img for img_id, img in
+                  reference_cache.get_many(db, 'images', all_image_ids).items()}
+    colors_map = {str(col_id): col for col_id, col in
+                  reference_cache.get_many(db, 'colors', all_color_ids).items()}
 
     # 헬퍼 함수
     def get_image_details(image_id):
@@ -583,14 +590,8 @@ def get_progress_status_paginated(
         col = colors_map.get(str(color_id))
         return {"id": col.id, "color_name": col.color_name, "color_values": col.color_values} if col else None
 
-    # --- [수정 2] 결과를 가공하면서 업데이트된 상태를 기준으로 필터링 ---
     formatted_items = []
     for progress_status, user, custom_design, portfolio in results:
-        # API 요청 시 status 필터가 있었고, DB 업데이트 후 현재 아이템의 상태가
-        # 해당 필터와 일치하지 않으면 최종 결과 목록에서 제외합니다.
-        if status and progress_status.status != status:
-            continue
-
         item = {}
         # portfolio가 있으면 portfolio 정보 사용, 없으면 custom_design 정보 사용
         if portfolio:
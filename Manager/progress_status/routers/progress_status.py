@@ -7,6 +7,8 @@ from Manager.progress_status.schemas import progress_status as progress_status_s
 from Manager.progress_status.crud import progress_status as progress_status_crud
 from db import models
 from core.security import get_current_user
+from services.progress_delay_service import progress_delay_service
+from services.progress_sync_service import progress_sync_service
 
 router = APIRouter(prefix="/progress-status", tags=["Progress Status"])
 
@@ -180,17 +182,20 @@ def get_single_progress_status(
 
 
 
-@router.post("/sync-existing-data", response_model=progress_status_schema.StatusResponse)
+@router.post("/sync-existing-data", response_model=progress_status_schema.SyncJobResponse,
+             status_code=status.HTTP_202_ACCEPTED)
 def sync_existing_progress_data(
-        db: Session = Depends(get_db),
         current_user: models.AdminUser = Depends(get_current_user)
 ):
     """
-    기존 데이터를 기반으로 progress_status를 일괄 생성합니다.
-    (임시 API - 한 번만 실행)
+    기존 데이터를 기반으로 progress_status를 일괄 생성하는 백그라운드 작업을 시작합니다.
+    (임시 API - 한 번만 실행, 다시 실행해도 없는 행만 생성)
 
     - status가 '3'인 모든 custom_design에 대해 progress_status 생성
-    - 모든 portfolio에 대해 progress_status 생성 또는 portfolio_id 업데이트
+    - progress_status가 없는 모든 portfolio에 대해 progress_status 생성
+
+    반환된 job_id로 GET /progress-status/sync-existing-data/{job_id} 에서 진행 상황을 확인합니다.
+    이미 실행 중인 작업이 있으면 그 작업 정보를 반환합니다.
     """
     # superadmin 권한만 실행 가능
     if current_user.permission != 'superadmin':
@@ -199,18 +204,46 @@ def sync_existing_progress_data(
             detail="이 작업은 superadmin 권한이 필요합니다."
         )
 
-    try:
-        created_count = progress_status_crud.sync_existing_data(db)
-        return progress_status_schema.StatusResponse(
-            status="success",
-            message=f"기존 데이터 동기화 완료. {created_count}개의 progress_status가 생성되었습니다."
+    return progress_sync_service.start()
+
+
+@router.get("/sync-existing-data/{job_id}", response_model=progress_status_schema.SyncJobResponse)
+def get_sync_existing_data_job(
+        job_id: str,
+        current_user: models.AdminUser = Depends(get_current_user)
+):
+    """기존 데이터 동기화 작업의 진행 상황을 조회합니다."""
+    if current_user.permission != 'superadmin':
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 작업은 superadmin 권한이 필요합니다."
         )
-    except Exception as e:
+
+    job = progress_sync_service.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="해당 동기화 작업을 찾을 수 없습니다.")
+    return job
+
+@router.post("/mark-delayed", response_model=progress_status_schema.StatusResponse)
+def mark_delayed_progress_status(
+        current_user: models.AdminUser = Depends(get_current_user)
+):
+    """
+    배송 예정일이 지난 진행중(1) 상태를 즉시 지연(2)으로 변경합니다.
+    (평소에는 백그라운드 작업이 하루 한 번 수행)
+    """
+    if current_user.permission not in ['admin', 'superadmin']:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"동기화 중 오류 발생: {str(e)}"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다."
         )
 
+    updated_count = progress_delay_service.run(force=True)
+    return progress_status_schema.StatusResponse(
+        status="success",
+        message=f"{updated_count}개의 진행 상태가 지연으로 변경되었습니다."
+    )
+
 @router.get("/info/{progress_status_id}", response_model=progress_status_schema.ProgressStatusDetailResponse)
 def get_progress_status_detail(
         progress_status_id: int,
@@ -236,6 +269,57 @@ def get_progress_status_detail(
 
     return detail_data
 
+@router.patch("/bulk", response_model=progress_status_schema.ProgressStatusBulkUpdateResponse)
+def bulk_update_progress_status(
+        bulk_update: progress_status_schema.ProgressStatusBulkUpdate,
+        db: Session = Depends(get_db),
+        current_user: models.AdminUser = Depends(get_current_user)
+):
+    """
+    여러 진행 상태에 같은 수정 내용을 한 번에 적용합니다. (예: 여러 샘플을 발송완료로 변경)
+
+    수정 가능한 필드는 단건 수정과 같습니다: expected_shipping_date, status, status_note, notes
+    이미 같은 값이라 수정하지 않은 ID는 unchanged_ids, 없는 ID는 not_found_ids로 반환합니다.
+    """
+    # 권한 검사
+    if current_user.permission not in ['admin', 'superadmin']:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="진행 상태를 수정할 권한이 없습니다."
+        )
+
+    update_data = bulk_update.update.model_dump(exclude_unset=True)
+    if not update_data:
+        raise HTTPException(
+            status_code=400,
+            detail="수정할 항목이 없습니다."
+        )
+
+    # 상태값 유효성 검사
+    if bulk_update.update.status and bulk_update.update.status not in ['0', '1', '2', '3']:
+        raise HTTPException(
+            status_code=400,
+            detail="상태값은 0, 1, 2, 3 중 하나여야 합니다."
+        )
+
+    ids = list(dict.fromkeys(bulk_update.ids))
+    updated_rows, unchanged_ids = progress_status_crud.bulk_update_progress_status(
+        db,
+        ids=ids,
+        progress_status_update=bulk_update.update,
+        current_user=current_user
+    )
+
+    found_ids = {row['id'] for row in updated_rows} | set(unchanged_ids)
+    return progress_status_schema.ProgressStatusBulkUpdateResponse(
+        success=True,
+        message=f"{len(updated_rows)}개의 진행 상태가 성공적으로 업데이트되었습니다.",
+        updated_count=len(updated_rows),
+        unchanged_ids=unchanged_ids,
+        not_found_ids=[progress_id for progress_id in ids if progress_id not in found_ids],
+        data=[progress_status_schema.ProgressStatusResponse.model_validate(row) for row in updated_rows]
+    )
+
 @router.patch("/{progress_status_id}", response_model=progress_status_schema.ProgressStatusApiResponse)
 def update_progress_status_details(
         progress_status_id: int,
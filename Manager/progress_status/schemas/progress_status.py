@@ -1,6 +1,6 @@
 # progress_status/schemas/progress_status.py
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime, date
 
 
@@ -31,6 +31,12 @@ class ProgressStatusUpdate(BaseModel):
     expected_shipping_date: Optional[date] = None
 
 
+# 일괄 수정용 스키마 (같은 수정 내용을 여러 진행 상태에 적용)
+class ProgressStatusBulkUpdate(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=500, description="수정할 진행 상태 ID 목록")
+    update: ProgressStatusUpdate
+
+
 # API 응답을 위한 기본 스키마
 class ProgressStatusResponse(ProgressStatusBase):
     id: int
@@ -149,7 +155,31 @@ class ProgressStatusApiResponse(BaseModel):
     data: Optional[ProgressStatusResponse] = None
 
 
+# 일괄 수정 응답 스키마
+class ProgressStatusBulkUpdateResponse(BaseModel):
+    success: bool
+    message: str
+    updated_count: int
+    unchanged_ids: List[int] = []  # 이미 같은 값이라 수정하지 않은 ID
+    not_found_ids: List[int] = []
+    data: List[ProgressStatusResponse] = []
+
+
 # 상태 응답 스키마 (삭제 등에 사용)
 class StatusResponse(BaseModel):
     status: str
-    message: str
\ No newline at end of file
+    message: str
+
+
+# 기존 데이터 동기화 작업 상태 스키마
+class SyncJobResponse(BaseModel):
+    job_id: str
+    status: str  # pending, running, completed, failed
+    current_step: Optional[str] = None  # custom_design, portfolio
+    steps_total: int
+    steps_done: int
+    created: Dict[str, int] = {}  # 단계별 생성된 progress_status 수
+    created_count: int = 0
+    error: Optional[str] = None
+    started_at: datetime
+    finished_at: Optional[datetime] = None
@@ -2,47 +2,48 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from db import models
-from datetime import date
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+from Manager.rank.schemas import rank as rank_schema
+from services.leaderboard_service import leaderboard_service
+from services.view_counter_service import VIEW_CONTENT_MODELS
+from services.status_counter_service import get_status_counts
+from services.view_rollup_service import view_rollup_service, plan_periods, week_start, month_start, next_month
+
+
+def _get_top_items(db: Session, content_type: str, model, limit: int):
+    """메모리 랭킹(leaderboard_service)의 top 목록에 이미지/이름만 PK로 조회해서 붙입니다."""
+    ranked = leaderboard_service.get_top(content_type, limit=leaderboard_service.capacity)
+    if not ranked:
+        return []
+
+    rows = db.query(model.id, model.main_image_url, model.design_name).filter(
+        model.id.in_([content_id for content_id, _ in ranked])
+    ).all()
+    rows_map = {row.id: row for row in rows}
+
+    items = []
+    for content_id, view_count in ranked:
+        row = rows_map.get(content_id)
+        if not row:
+            continue  # 삭제된 컨텐츠는 제외
+        items.append(rank_schema.RankItem(image=row.main_image_url, name=row.design_name, view=view_count))
+        if len(items) >= limit:
+            break
+
+    return items
 
 def get_top_released_products(db: Session, limit: int = 10):
     """오늘 날짜의 조회수(daily_views)가 가장 많은 출시 제품 10개를 조회합니다."""
-    today = date.today()
-    return db.query(
-        models.Releasedproduct.main_image_url.label('image'),
-        models.Releasedproduct.design_name.label('name'),
-        models.DailyView.view_count.label('view')
-    ).join(
-        models.DailyView,
-        (models.DailyView.content_id == models.Releasedproduct.id) &
-        (models.DailyView.content_type == 'released_product')
-    ).filter(
-        models.DailyView.view_date == today
-    ).order_by(
-        models.DailyView.view_count.desc()
-    ).limit(limit).all()
+    return _get_top_items(db, 'released_product', models.Releasedproduct, limit)
 
 def get_top_portfolios(db: Session, limit: int = 10):
     """오늘 날짜의 조회수(daily_views)가 가장 많은 포트폴리오 10개를 조회합니다."""
-    today = date.today()
-    return db.query(
-        models.Portfolio.main_image_url.label('image'),
-        models.Portfolio.design_name.label('name'),
-        models.DailyView.view_count.label('view')
-    ).join(
-        models.DailyView,
-        (models.DailyView.content_id == models.Portfolio.id) &
-        (models.DailyView.content_type == 'portfolio')
-    ).filter(
-        models.DailyView.view_date == today
-    ).order_by(
-        models.DailyView.view_count.desc()
-    ).limit(limit).all()
+    return _get_top_items(db, 'portfolio', models.Portfolio, limit)
 
 def get_custom_design_status_counts(db: Session):
-    status_counts = db.query(
-        models.CustomDesign.status,
-        func.count(models.CustomDesign.id)
-    ).group_by(models.CustomDesign.status).all()
+    # 트리거가 증감하는 status_counters 에서 읽음 (전체 테이블 GROUP BY 없음)
+    status_counts = get_status_counts(db, 'custom_design').items()
 
     # 사용자 요청: 0=wait, 1=reject, 2=under_review, 3=complet
     # DB 컬럼 타입이 String이므로, 키를 문자열로 사용합니다.
@@ -74,11 +75,8 @@ def get_custom_design_status_counts(db: Session):
 
 
 def get_progress_status_counts(db: Session):
-    """진행 상태별 개수를 조회합니다."""
-    status_counts = db.query(
-        models.Progressstatus.status,
-        func.count(models.Progressstatus.id)
-    ).group_by(models.Progressstatus.status).all()
+    """진행 상태별 개수를 조회합니다. (status_counters 에서 읽음)"""
+    status_counts = get_status_counts(db, 'progress_status').items()
 
     # wait=0, progress=1, delay=2, delivery_completed=3
     counts = {
@@ -101,4 +99,112 @@ def get_progress_status_counts(db: Session):
     total = sum(counts.values())
     counts['total'] = total
 
-    return counts
\ No newline at end of file
+    return counts
+
+# 집계 단위별 (모델, 기간 시작일 컬럼)
+_VIEW_LEVEL_COLUMNS = {
+    'day': (models.DailyView, models.DailyView.view_date),
+    'week': (models.WeeklyView, models.WeeklyView.week_start),
+    'month': (models.MonthlyView, models.MonthlyView.month_start),
+}
+
+
+def get_view_buckets(start_date: date, end_date: date, granularity: str) -> List[Tuple[date, date]]:
+    """[start_date, end_date] 구간을 granularity 단위 (시작일, 종료일) 목록으로 나눕니다. (양 끝은 구간에 맞춰 자름)"""
+    buckets = []
+    cur = start_date
+    while cur <= end_date:
+        if granularity == 'month':
+            following = next_month(month_start(cur))
+        elif granularity == 'week':
+            following = week_start(cur) + timedelta(days=7)
+        else:
+            following = cur + timedelta(days=1)
+        bucket_end = min(following - timedelta(days=1), end_date)
+        buckets.append((cur, bucket_end))
+        cur = bucket_end + timedelta(days=1)
+    return buckets
+
+
+def get_view_series(
+        db: Session,
+        start_date: date,
+        end_date: date,
+        granularity: str = 'day',
+        content_types: Optional[List[str]] = None,
+        content_ids: Optional[List[int]] = None,
+        limit: int = 20
+) -> List[rank_schema.ViewSeriesItem]:
+    """기간별 조회수 시계열 조회 (weekly_views / monthly_views 집계 테이블 우선 사용)
+
+    각 구간을 집계된 월/주 단위와 나머지 일 단위로 나누고, 단위별로 한 번씩만 조회합니다.
+    (raw daily_views 는 구간 양 끝과 아직 집계되지 않은 최근 날짜만 읽음)
+    content_ids 가 없으면 기간 내 조회수 상위 limit 개 컨텐츠를 반환합니다.
+    """
+    content_types = content_types or list(VIEW_CONTENT_MODELS.keys())
+    buckets = get_view_buckets(start_date, end_date, granularity)
+    rolled_through = view_rollup_service.get_rolled_through(db)
+
+    # 집계 단위별 기간 시작일 -> 소속 구간
+    period_buckets: Dict[str, Dict[date, int]] = {level: {} for level in _VIEW_LEVEL_COLUMNS}
+    for index, (bucket_start, bucket_end) in enumerate(buckets):
+        for level, period_start in plan_periods(bucket_start, bucket_end, rolled_through):
+            period_buckets[level][period_start] = index
+
+    # (content_type, content_id) -> 구간별 조회수
+    series: Dict[Tuple[str, int], List[int]] = {}
+    for level, starts in period_buckets.items():
+        if not starts:
+            continue
+        model, period_column = _VIEW_LEVEL_COLUMNS[level]
+        query = db.query(
+            period_column,
+            model.content_type,
+            model.content_id,
+            func.sum(model.view_count)
+        ).filter(
+            period_column.in_(list(starts.keys())),
+            model.content_type.in_(content_types)
+        )
+        if content_ids:
+            query = query.filter(model.content_id.in_(content_ids))
+
+        for period_start, content_type, content_id, view_count in query.group_by(
+                period_column, model.content_type, model.content_id).all():
+            counts = series.setdefault((content_type, content_id), [0] * len(buckets))
+            counts[starts[period_start]] += view_count or 0
+
+    if content_ids:
+        # 조회수가 없는 컨텐츠도 0으로 포함
+        for content_type in content_types:
+            for content_id in content_ids:
+                series.setdefault((content_type, content_id), [0] * len(buckets))
+        keys = sorted(series.keys())
+    else:
+        keys = sorted(series.keys(), key=lambda key: (-sum(series[key]), key))[:limit]
+
+    # 컨텐츠 이름 (종류별 PK 조회 1회)
+    names: Dict[Tuple[str, int], str] = {}
+    for content_type, model in VIEW_CONTENT_MODELS.items():
+        ids = [content_id for ct, content_id in keys if ct == content_type]
+        if ids:
+            for row in db.query(model.id, model.design_name).filter(model.id.in_(ids)).all():
+                names[(content_type, row.id)] = row.design_name
+
+    if content_ids:
+        # 0으로 채운 항목 중 존재하지 않는 컨텐츠는 제외
+        keys = [key for key in keys if key in names or sum(series[key])]
+
+    return [
+        rank_schema.ViewSeriesItem(
+            content_type=content_type,
+            content_id=content_id,
+            name=names.get((content_type, content_id)),
+            total=sum(series[(content_type, content_id)]),
+            points=[
+                rank_schema.ViewSeriesPoint(period_start=bucket_start, period_end=bucket_end, view_count=count)
+                for (bucket_start, bucket_end), count in zip(buckets, series[(content_type, content_id)])
+            ]
+        )
+        for content_type, content_id in keys
+    ]
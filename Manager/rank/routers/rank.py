@@ -1,11 +1,14 @@
 # rank/routers/rank.py
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
+from datetime import date
+from typing import List, Optional
 from db.database import get_db
 from Manager.rank.crud import rank as rank_crud
 from Manager.rank.schemas import rank as rank_schema
 from db import models
 from core.security import get_current_user
+from services.status_counter_service import status_counter_service
 
 router = APIRouter()
 
@@ -32,4 +35,93 @@ def get_rank_data(db: Session = Depends(get_db), current_user: models.AdminUser
         portfolio=portfolio_items,
         custom_design=rank_schema.CustomDesignStatus(**custom_design_counts),
         progress_status=rank_schema.ProgressStatus(**progress_status_counts)  # 실제 데이터 사용
-    )
\ No newline at end of file
+    )
+
+
+# 조회수 시계열 조회 시 최대 구간 수
+MAX_VIEW_BUCKETS = 400
+
+
+@router.get("/v1/rank/views", response_model=rank_schema.ViewSeriesResponse, summary="Get view series")
+def get_view_series(
+        start_date: date = Query(..., description="시작일 (YYYY-MM-DD)"),
+        end_date: date = Query(..., description="종료일 (YYYY-MM-DD, 포함)"),
+        granularity: str = Query("day", description="집계 단위 (day, week, month)"),
+        content_type: Optional[List[str]] = Query(None, description="컨텐츠 종류 (released_product, portfolio) - 기본값: 전체"),
+        content_ids: Optional[List[int]] = Query(None, description="컨텐츠 ID 목록 - 없으면 조회수 상위 limit개"),
+        limit: int = Query(20, ge=1, le=100, description="content_ids가 없을 때 반환할 컨텐츠 수"),
+        db: Session = Depends(get_db),
+        current_user: models.AdminUser = Depends(get_current_user)
+):
+    """
+    **기간별 조회수 시계열을 반환합니다.**
+
+    - 주간/월간 집계 테이블(weekly_views, monthly_views)을 우선 사용하고
+      구간 양 끝과 아직 집계되지 않은 최근 날짜만 daily_views 에서 읽습니다.
+    - **granularity**: 시계열 단위 (day, week, month). 첫/마지막 구간은 기간에 맞춰 잘립니다.
+    - **items**: 컨텐츠별 총 조회수(total)와 구간별 조회수(points)
+    """
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date는 end_date보다 이후일 수 없습니다."
+        )
+
+    if granularity not in ['day', 'week', 'month']:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="granularity는 'day', 'week' 또는 'month'여야 합니다."
+        )
+
+    if content_type and any(ct not in ['released_product', 'portfolio'] for ct in content_type):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="content_type은 'released_product' 또는 'portfolio'여야 합니다."
+        )
+
+    if len(rank_crud.get_view_buckets(start_date, end_date, granularity)) > MAX_VIEW_BUCKETS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"조회 구간이 너무 깁니다. (최대 {MAX_VIEW_BUCKETS}개 구간)"
+        )
+
+    items = rank_crud.get_view_series(
+        db,
+        start_date=start_date,
+        end_date=end_date,
+        granularity=granularity,
+        content_types=content_type,
+        content_ids=content_ids,
+        limit=limit
+    )
+
+    return rank_schema.ViewSeriesResponse(
+        start_date=start_date,
+        end_date=end_date,
+        granularity=granularity,
+        items=items
+    )
+
+
+@router.post("/v1/rank/status-counters/reconcile", response_model=rank_schema.StatusCounterReconcileResponse,
+             summary="Reconcile status counters")
+def reconcile_status_counters(current_user: models.AdminUser = Depends(get_current_user)):
+    """
+    **상태별 카운터(status_counters)를 원본 테이블 집계로 즉시 보정합니다.**
+
+    평소에는 백그라운드 작업이 하루 한 번 수행합니다. 보정된 오차를 반환합니다.
+    """
+    if current_user.permission != 'superadmin':
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 작업은 superadmin 권한이 필요합니다."
+        )
+
+    drift = status_counter_service.run(force=True)
+    if drift is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="상태 카운터 트리거가 설치되지 않았습니다. (migrations/create_status_counters.sql 실행 필요)"
+        )
+    return rank_schema.StatusCounterReconcileResponse(drift=drift)
+
@@ -1,6 +1,7 @@
 # rank/schemas/rank.py
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Dict, List, Optional
+from datetime import date
 
 class RankItem(BaseModel):
     image: Optional[str] = None
@@ -29,3 +30,25 @@ class RankResponse(BaseModel):
     portfolio: List[RankItem]
     custom_design: CustomDesignStatus
     progress_status: ProgressStatus
+
+
+class ViewSeriesPoint(BaseModel):
+    period_start: date
+    period_end: date
+    view_count: int
+
+class ViewSeriesItem(BaseModel):
+    content_type: str
+    content_id: int
+    name: Optional[str] = None
+    total: int
+    points: List[ViewSeriesPoint]
+
+class ViewSeriesResponse(BaseModel):
+    start_date: date
+    end_date: date
+    granularity: str
+    items: List[ViewSeriesItem]
+
+class StatusCounterReconcileResponse(BaseModel):
+    drift: Dict[str, Dict[str, int]]  # {kind: {상태: 보정된 오차}} (오차가 없으면 빈 dict)
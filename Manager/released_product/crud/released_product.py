@@ -5,6 +5,9 @@ from Manager.released_product.schemas import released_product as released_produc
 from typing import Optional
 from fastapi import HTTPException
 from datetime import date
+from core.pagination import paginate, COUNT_WINDOW
+from core.search import contains
+from services.reference_cache import reference_cache
 
 
 def create_released_product(db: Session, released_product: dict, user_id: int):
@@ -84,24 +87,21 @@ def get_released_products_paginated(
     )
 
     if brandname:
-        query = query.filter(models.Brand.brand_name.ilike(f"%{brandname}%"))
+        query = query.filter(contains(models.Brand.brand_name, brandname))
     if design_name:
-        query = query.filter(models.Releasedproduct.design_name.ilike(f"%{design_name}%"))
+        query = query.filter(contains(models.Releasedproduct.design_name, design_name))
     if color_name:
         # 빈 문자열인 경우 NULL 값 검색, 아닌 경우 LIKE 검색
         if color_name.strip() == "":
             query = query.filter(models.Releasedproduct.color_name.is_(None))
         else:
-            query = query.filter(models.Releasedproduct.color_name.ilike(f"%{color_name}%"))
+            query = query.filter(contains(models.Releasedproduct.color_name, color_name))
 
     print("=" * 20)
     print("Query after filtering:")
     print(str(query.statement.compile(compile_kwargs={"literal_binds": True})))
     print("=" * 20)
 
-    total_count = query.count()
-
-
     if orderBy:
         try:
             order_column_name, order_direction = orderBy.strip().split()
@@ -131,8 +131,9 @@ def get_released_products_paginated(
         query = query.order_by(models.Releasedproduct.created_at.desc())
 
 
-    offset = (page - 1) * size
-    results = query.order_by(models.Releasedproduct.id.desc()).offset(offset).limit(size).all()
+    results, total_count = paginate(
+        query.order_by(models.Releasedproduct.id.desc()), page, size, count_strategy=COUNT_WINDOW
+    )
 
 
     formatted_items = []
@@ -146,9 +147,9 @@ def get_released_products_paginated(
         ]
         all_color_ids.update(id for id in ids_to_add if id)
 
-    # color_id로 color 정보 한 번에 조회
-    colors_map = {str(col.id): col for col in
-                  db.query(models.Color).filter(models.Color.id.in_(list(all_color_ids))).all()}
+    # color_id로 color 정보 한 번에 조회 (참조 테이블 캐시)
+    colors_map = {str(col_id): col for col_id, col in
+                  reference_cache.get_many(db, 'colors', all_color_ids).items()}
 
     def get_color_name(col_id):
         return colors_map.get(str(col_id)).color_name if str(col_id) in colors_map else ""
@@ -162,7 +163,7 @@ def get_released_products_paginated(
     def get_color_details(color_id: Optional[str]):
         if not color_id:
             return None
-        return db.query(models.Color).filter(models.Color.id == color_id).first()
+        return colors_map.get(str(color_id))
 
 
     for product, brand in results:
@@ -209,12 +210,12 @@ def get_released_product_detail(db: Session, product_id: int):
     def get_color_details(color_id: Optional[str]):
         if not color_id:
             return None
-        return db.query(models.Color).filter(models.Color.id == color_id).first()
+        return reference_cache.color(db, color_id)
 
     brand_name = ""
     brand_image_url = None
     if product.brand_id:
-        brand = db.query(models.Brand).filter(models.Brand.id == product.brand_id).first()
+        brand = reference_cache.brand(db, product.brand_id)
         if brand:
             brand_name = brand.brand_name
             brand_image_url = brand.brand_image_url
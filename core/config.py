@@ -1,4 +1,5 @@
 # core/config.py
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 from typing import Optional
 
@@ -23,7 +24,38 @@ class Settings(BaseSettings):
     MINIO_BUCKET_NAME: Optional[str] = None
     MINIO_USE_SECURE: Optional[bool] = None
 
+    # ▼▼▼▼▼ 실시간 유저(presence) 저장소 설정 ▼▼▼▼▼
+    PRESENCE_BACKEND: str = "memory"  # memory(기본) | shared(멀티 워커) | sql(realtime_users 테이블)
+    PRESENCE_TTL_SECONDS: int = 60
+    PRESENCE_SWEEP_INTERVAL_SECONDS: int = 30  # 만료 기록 정리 주기 (0이면 비활성화)
+    PRESENCE_SWEEP_BATCH_SIZE: int = 1000  # 정리 시 한 번에 삭제할 최대 행 수
+    PRESENCE_PUSH_REFRESH_SECONDS: int = 5  # WebSocket 구독 컨텐츠 재집계 주기 (0이면 비활성화)
+
+    # ▼▼▼▼▼ 목록 조회 페이지네이션 설정 ▼▼▼▼▼
+    PAGINATION_COUNT_CACHE_TTL_SECONDS: int = 30  # cached 방식 전체 개수 캐시 유지 시간
+
+    # ▼▼▼▼▼ 참조 테이블(이미지/컬러/브랜드/국가) 캐시 설정 ▼▼▼▼▼
+    REFERENCE_CACHE_TTL_SECONDS: int = 300  # 다른 워커의 수정/삭제가 반영되기까지 최대 시간 (0이면 만료 없음)
+
+    # ▼▼▼▼▼ 조회수 write-behind 버퍼 설정 ▼▼▼▼▼
+    VIEW_FLUSH_INTERVAL_SECONDS: int = 10  # 조회수 DB 반영 주기 (종료 시에도 반영)
+    LEADERBOARD_REBUILD_SECONDS: int = 300  # daily_views 기준 랭킹 재구성 주기 (멀티 워커 보정)
+    VIEW_ROLLUP_INTERVAL_SECONDS: int = 3600  # daily_views 주간/월간 집계 주기 (끝난 날짜만 증분 반영)
+    TRENDING_HALF_LIFE_DAYS: float = 7  # 트렌딩 점수 반감기 (변경 후 scripts/rebuild_trending_scores.py 실행)
+    PROGRESS_DELAY_CHECK_SECONDS: int = 3600  # 진행 상태 지연 처리 확인 주기 (날짜가 바뀐 뒤 하루 한 번만 반영)
+    STATUS_COUNTER_RECONCILE_CHECK_SECONDS: int = 3600  # 상태별 카운터 보정 확인 주기 (날짜가 바뀐 뒤 하루 한 번만 보정)
+    PRESENCE_SHARED_HOST: str = "127.0.0.1"
+    PRESENCE_SHARED_PORT: int = 50055
+    PRESENCE_SHARED_AUTHKEY: Optional[str] = None  # 공유 presence 서버 인증 키 (shared 사용 시 필수, 추측하기 어려운 값)
+
     class Config:
         env_file = ".env"
 
+    @model_validator(mode="after")
+    def check_presence_shared_authkey(self):
+        # 공유 presence 서버는 pickle 기반 연결이므로 인증 키 없이 실행하지 않음
+        if self.PRESENCE_BACKEND.lower() == "shared" and not self.PRESENCE_SHARED_AUTHKEY:
+            raise ValueError("PRESENCE_BACKEND=shared 사용 시 PRESENCE_SHARED_AUTHKEY를 지정해야 합니다.")
+        return self
+
 settings = Settings()
\ No newline at end of file
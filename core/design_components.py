@@ -0,0 +1,131 @@
+# core/design_components.py
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from db import models
+from services.reference_cache import reference_cache
+
+# 디자인 컴포넌트 레이어 (응답 키: design_<layer>)
+LAYERS = ('line', 'base1', 'base2', 'pupil')
+
+
+class DesignLayer(NamedTuple):
+    """디자인 한 레이어의 원본 id/옵션 값과 조회된 이미지/컬러 행"""
+    image_id: Optional[str]
+    color_id: Optional[str]
+    image: Any
+    color: Any
+    transparency: Optional[str]
+    size: Optional[str]
+    color_only: bool  # 출시 제품은 이미지 없이 컬러만 가짐
+
+
+def to_int(value, default=None):
+    """문자열/정수 값을 정수로 변환 (비어 있거나 변환할 수 없으면 default)"""
+    if value is None or value == '':
+        return default
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def _layer_ids(design, layer: str):
+    if isinstance(design, models.Releasedproduct):
+        return None, getattr(design, f'color_{layer}_color_id', None)
+    return getattr(design, f'design_{layer}_image_id', None), getattr(design, f'design_{layer}_color_id', None)
+
+
+def resolve_design_components(db: Session, designs: Sequence[Any]) -> List[Dict[str, DesignLayer]]:
+    """디자인 목록(Portfolio, CustomDesign, Releasedproduct)의 레이어별 이미지/컬러를 한 번에 조회합니다.
+
+    전체 디자인의 이미지 id와 컬러 id를 모아 참조 테이블 캐시에서 각각 한 번씩 조회하며,
+    designs와 같은 순서로 {layer: DesignLayer} 목록을 반환합니다. (None 디자인은 빈 dict)
+    """
+    image_ids, color_ids = set(), set()
+    for design in designs:
+        if design is None:
+            continue
+        for layer in LAYERS:
+            image_id, color_id = _layer_ids(design, layer)
+            if image_id:
+                image_ids.add(image_id)
+            if color_id:
+                color_ids.add(color_id)
+
+    images = reference_cache.get_many(db, 'images', image_ids)
+    colors = reference_cache.get_many(db, 'colors', color_ids)
+
+    resolved = []
+    for design in designs:
+        layers = {}
+        if design is not None:
+            color_only = isinstance(design, models.Releasedproduct)
+            for layer in LAYERS:
+                image_id, color_id = _layer_ids(design, layer)
+                layers[layer] = DesignLayer(
+                    image_id=image_id,
+                    color_id=color_id,
+                    image=images.get(to_int(image_id)),
+                    color=colors.get(to_int(color_id)),
+                    transparency=getattr(design, f'{layer}_transparency', None),
+                    size=getattr(design, f'{layer}_size', None),
+                    color_only=color_only,
+                )
+        resolved.append(layers)
+    return resolved
+
+
+def resolve_design_component(db: Session, design) -> Dict[str, DesignLayer]:
+    """단일 디자인용 resolve_design_components"""
+    return resolve_design_components(db, [design])[0]
+
+
+def unity_component(layer: Optional[DesignLayer], use_options: bool = True) -> Optional[Dict[str, Any]]:
+    """Enduser(Unity) 응답용 컴포넌트 dict (이미지와 컬러가 모두 있어야 함, 출시 제품은 컬러만)
+
+    use_options=False 이거나 값이 없으면 크기/투명도는 100입니다.
+    """
+    if layer is None or not layer.color_id or layer.color is None:
+        return None
+    if not layer.color_only and (not layer.image_id or layer.image is None):
+        return None
+
+    return {
+        "image_id": None if layer.color_only else layer.image_id,
+        "image_url": None if layer.color_only else layer.image.public_url,
+        "image_name": None if layer.color_only else layer.image.display_name,
+        "RGB_id": layer.color_id,
+        "RGB_color": layer.color.color_values,
+        "RGB_name": layer.color.color_name,
+        "size": to_int(layer.size, 100) if use_options else 100,
+        "opacity": to_int(layer.transparency, 100) if use_options else 100
+    }
+
+
+def unity_components(layers: Dict[str, DesignLayer], use_options: bool = True) -> Dict[str, Optional[Dict[str, Any]]]:
+    """{design_line: ..., design_base1: ..., design_base2: ..., design_pupil: ...}"""
+    return {f"design_{layer}": unity_component(layers.get(layer), use_options) for layer in LAYERS}
+
+
+def image_detail(layer: Optional[DesignLayer]) -> Optional[Dict[str, Any]]:
+    """Manager 응답용 이미지 정보 (id, display_name, public_url)"""
+    if layer is None or layer.image is None:
+        return None
+    return {
+        "id": layer.image.id,
+        "display_name": layer.image.display_name,
+        "public_url": layer.image.public_url
+    }
+
+
+def color_detail(layer: Optional[DesignLayer]) -> Optional[Dict[str, Any]]:
+    """Manager 응답용 컬러 정보 (id, color_name, color_values)"""
+    if layer is None or layer.color is None:
+        return None
+    return {
+        "id": layer.color.id,
+        "color_name": layer.color.color_name,
+        "color_values": layer.color.color_values
+    }
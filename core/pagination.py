@@ -0,0 +1,404 @@
+# core/pagination.py
+import base64
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Any, Hashable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, false, func, or_, tuple_
+from sqlalchemy.orm import Query
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 정렬 키: (컬럼/표현식, 내림차순 여부)
+SortKey = Tuple[Any, bool]
+
+# 전체 개수 계산 방식
+COUNT_EXACT = 'exact'        # SELECT count(*) 별도 실행
+COUNT_WINDOW = 'window'      # 페이지 쿼리에 count(*) OVER() 를 붙여 한 번에 조회
+COUNT_ESTIMATE = 'estimate'  # 실행 계획(EXPLAIN)의 예상 행 수 (작은 결과는 exact)
+COUNT_CACHED = 'cached'      # 필터 조건별 exact 결과를 짧게 캐시
+COUNT_STRATEGIES = (COUNT_EXACT, COUNT_WINDOW, COUNT_ESTIMATE, COUNT_CACHED)
+
+# 예상 행 수가 이보다 작으면 exact 로 다시 계산
+ESTIMATE_EXACT_THRESHOLD = 1000
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"$d": value.isoformat()}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        if "$dt" in value:
+            return datetime.fromisoformat(value["$dt"])
+        if "$d" in value:
+            return date.fromisoformat(value["$d"])
+        raise ValueError("invalid cursor value")
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """마지막 항목의 정렬 키 값을 불투명 cursor 문자열로 변환"""
+    raw = json.dumps([_encode_value(value) for value in values], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def _load_cursor(cursor: str) -> list:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError("invalid cursor") from e
+
+    if not isinstance(values, list):
+        raise ValueError("invalid cursor")
+    return values
+
+
+def decode_cursor(cursor: str, key_count: int) -> List[Any]:
+    """cursor 문자열을 정렬 키 값 목록으로 변환 (형식이 맞지 않으면 ValueError)"""
+    values = _load_cursor(cursor)
+    if len(values) != key_count:
+        raise ValueError("invalid cursor")
+
+    return [_decode_value(value) for value in values]
+
+
+def _check_cursor_type(column, value):
+    """cursor 값이 정렬 컬럼의 Python 타입과 맞는지 확인 (맞지 않으면 ValueError)
+
+    타입을 알 수 없는 컬럼은 확인하지 않으며, NULL 값은 허용합니다.
+    """
+    if value is None:
+        return
+    try:
+        python_type = column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return
+
+    if python_type is bool:
+        valid = isinstance(value, bool)
+    elif python_type is int:
+        valid = isinstance(value, int) and not isinstance(value, bool)
+    elif python_type is float or python_type.__name__ == 'Decimal':
+        valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+    elif python_type is datetime:
+        valid = isinstance(value, datetime)
+    elif python_type is date:
+        valid = isinstance(value, date) and not isinstance(value, datetime)
+    elif python_type is str:
+        valid = isinstance(value, str)
+    else:
+        return
+
+    if not valid:
+        raise ValueError("invalid cursor")
+
+
+def decode_keyset_cursor(cursor: str, keys: Sequence[SortKey]) -> List[Any]:
+    """cursor 문자열을 정렬 키 값 목록으로 변환하고 값 타입을 정렬 컬럼과 비교합니다. (맞지 않으면 ValueError)
+
+    DB에서 타입 오류(DataError)가 나기 전에 잘못된 cursor 를 400 으로 처리하기 위함입니다.
+    """
+    values = decode_cursor(cursor, len(keys))
+    _check_cursor_types(keys, values)
+    return values
+
+
+def _check_cursor_types(keys: Sequence[SortKey], values: Sequence[Any]):
+    for (column, _), value in zip(keys, values):
+        _check_cursor_type(column, value)
+
+
+def _is_nullable(column) -> bool:
+    """정렬 키가 NULL 일 수 있는지 (NOT NULL 컬럼임을 알 수 없는 표현식은 NULL 가능으로 간주)"""
+    return getattr(getattr(column, 'expression', column), 'nullable', True) is not False
+
+
+def _key_equals(column, value):
+    return column.is_(None) if value is None else column == value
+
+
+def _key_after(column, descending: bool, value):
+    """정렬 키 하나가 value 보다 뒤인 조건 (NULL 은 가장 큰 값: 오름차순 NULLS LAST, 내림차순 NULLS FIRST)"""
+    if value is None:
+        return column.isnot(None) if descending else false()
+    if descending:
+        return column < value
+    if _is_nullable(column):
+        return or_(column > value, column.is_(None))
+    return column > value
+
+
+def keyset_predicate(keys: Sequence[SortKey], values: Sequence[Any]):
+    """정렬 키 기준으로 values 다음 항목만 남기는 조건
+
+    정렬 방향이 모두 같고 NULL 이 올 수 없으면 (k1, k2) < (:a, :b) 행 비교를 사용하고 (인덱스 범위 스캔),
+    그 외에는 k1 < :a OR (k1 = :a AND k2 > :b) ... 형태로 펼치고,
+    첫 키의 인덱스 범위 스캔을 위해 k1 <= :a 조건을 함께 붙입니다.
+    NULL 은 order_by_keys 와 같이 가장 큰 값으로 보고 IS NULL / IS NOT NULL 조건으로 비교합니다.
+    """
+    directions = {descending for _, descending in keys}
+    nullable = any(value is None or _is_nullable(column) for (column, _), value in zip(keys, values))
+    if len(directions) == 1 and not nullable:
+        row = tuple_(*[column for column, _ in keys])
+        bound = tuple_(*values)
+        return row < bound if directions.pop() else row > bound
+
+    conditions = []
+    for index, (column, descending) in enumerate(keys):
+        prefix = [_key_equals(keys[i][0], values[i]) for i in range(index)]
+        conditions.append(and_(*prefix, _key_after(column, descending, values[index])))
+
+    # 첫 키의 범위 조건 (NULL 이 섞여 단순 범위로 표현할 수 없으면 생략)
+    first_column, first_descending = keys[0]
+    first_value = values[0]
+    if first_value is None:
+        first_bound = None if first_descending else first_column.is_(None)
+    elif first_descending:
+        first_bound = first_column <= first_value
+    else:
+        first_bound = None if _is_nullable(first_column) else first_column >= first_value
+
+    if first_bound is None:
+        return or_(*conditions)
+    return and_(first_bound, or_(*conditions))
+
+
+def order_by_keys(query: Query, keys: Sequence[SortKey]) -> Query:
+    """keys 순서로 정렬 (NULL 가능 키는 NULL 을 가장 큰 값으로 명시 - PostgreSQL 기본 순서와 같아 인덱스 사용 가능)"""
+    order = []
+    for column, descending in keys:
+        if not _is_nullable(column):
+            order.append(column.desc() if descending else column.asc())
+        else:
+            order.append(column.desc().nulls_first() if descending else column.asc().nulls_last())
+    return query.order_by(*order)
+
+
+def _fetch_keyset(
+        query: Query,
+        keys: Sequence[SortKey],
+        values: Optional[Sequence[Any]],
+        size: int
+) -> Tuple[list, Optional[list]]:
+    """values 다음 size개와, 더 남아 있으면 마지막 항목의 정렬 키 값을 반환합니다."""
+    entity_count = len(query.column_descriptions)
+
+    if values:
+        query = query.filter(keyset_predicate(keys, values))
+
+    query = order_by_keys(query.order_by(None), keys)
+    rows = query.add_columns(*[column for column, _ in keys]).limit(size + 1).all()
+
+    has_more = len(rows) > size
+    rows = rows[:size]
+
+    items = [row[0] if entity_count == 1 else tuple(row[:entity_count]) for row in rows]
+    last_values = list(rows[-1][entity_count:]) if has_more and rows else None
+    return items, last_values
+
+
+def paginate_keyset(
+        query: Query,
+        keys: Sequence[SortKey],
+        cursor: Optional[str],
+        size: int
+) -> Tuple[list, Optional[str]]:
+    """OFFSET 없이 cursor 다음 size개를 조회하고 (items, next_cursor)를 반환합니다.
+
+    keys 의 마지막 항목은 유일한 컬럼(id)이어야 합니다. 다음 페이지가 없으면 next_cursor는 None 입니다.
+    query 의 기존 정렬은 무시하고 keys 순서로 정렬합니다.
+    """
+    values = decode_keyset_cursor(cursor, keys) if cursor else None
+    items, last_values = _fetch_keyset(query, keys, values, size)
+    return items, encode_cursor(last_values) if last_values is not None else None
+
+
+# 이어 붙여 조회할 쿼리 목록: [(쿼리, 정렬 키), ...] (앞 쿼리의 결과가 모두 끝나면 다음 쿼리 결과가 이어짐)
+QueryParts = Sequence[Tuple[Query, Sequence[SortKey]]]
+
+
+def paginate_chained(
+        parts: QueryParts,
+        page: int,
+        size: int,
+        count_strategy: str = COUNT_EXACT
+) -> Tuple[list, int]:
+    """겹치지 않는 여러 쿼리를 순서대로 이어 붙인 목록의 OFFSET 페이지네이션. (items, total_count)를 반환합니다.
+
+    각 쿼리는 자신의 정렬 키로만 정렬되므로 정렬 키별 인덱스를 그대로 사용할 수 있습니다.
+    전체 개수는 쿼리별 count_total 의 합이며, 쿼리별 개수로 OFFSET 위치를 나누므로
+    COUNT_ESTIMATE 는 사용할 수 없습니다. (COUNT_WINDOW 는 exact 로 계산)
+    """
+    if count_strategy not in COUNT_STRATEGIES or count_strategy == COUNT_ESTIMATE:
+        raise ValueError(f"unsupported count strategy: {count_strategy}")
+
+    offset = (page - 1) * size
+    items = []
+    total_count = 0
+    for query, keys in parts:
+        part_count = count_total(query, count_strategy)
+        total_count += part_count
+        if len(items) < size and offset < part_count:
+            items += order_by_keys(query.order_by(None), keys).offset(offset).limit(size - len(items)).all()
+        offset = max(0, offset - part_count)
+
+    return items, total_count
+
+
+def paginate_keyset_chained(
+        parts: QueryParts,
+        cursor: Optional[str],
+        size: int
+) -> Tuple[list, Optional[str]]:
+    """겹치지 않는 여러 쿼리를 순서대로 이어 붙인 목록의 cursor 페이지네이션. (items, next_cursor)를 반환합니다.
+
+    cursor 는 [쿼리 순번, *정렬 키 값] 이며, 정렬 키 값이 없으면 해당 쿼리의 처음부터 조회합니다.
+    """
+    part_index, values = 0, None
+    if cursor:
+        raw = _load_cursor(cursor)
+        if not raw or type(raw[0]) is not int or not 0 <= raw[0] < len(parts):
+            raise ValueError("invalid cursor")
+        part_index, keys = raw[0], parts[raw[0]][1]
+        if len(raw) > 1:
+            if len(raw) - 1 != len(keys):
+                raise ValueError("invalid cursor")
+            values = [_decode_value(value) for value in raw[1:]]
+            _check_cursor_types(keys, values)
+
+    items = []
+    while part_index < len(parts) and len(items) < size:
+        query, keys = parts[part_index]
+        part_items, last_values = _fetch_keyset(query, keys, values, size - len(items))
+        items += part_items
+        if last_values is not None:
+            return items, encode_cursor([part_index, *last_values])
+        part_index, values = part_index + 1, None
+
+    # 페이지가 쿼리 경계에서 딱 찬 경우 남은 쿼리에 결과가 있을 때만 다음 cursor 반환
+    for next_index in range(part_index, len(parts)):
+        if parts[next_index][0].order_by(None).first() is not None:
+            return items, encode_cursor([next_index])
+    return items, None
+
+
+class _CountCache:
+    """필터 조건(쿼리 SQL + 파라미터)별 전체 개수 TTL 캐시"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, int]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def set(self, key: Hashable, value: int, ttl_seconds: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+count_cache = _CountCache()
+
+
+def _count_signature(query: Query) -> Hashable:
+    """쿼리의 필터 조건을 나타내는 캐시 키 (SQL 문 + 바인딩 값)"""
+    compiled = query.order_by(None).statement.compile()
+    return str(compiled), tuple(sorted((key, repr(value)) for key, value in compiled.params.items()))
+
+
+def _estimate_count(query: Query) -> Optional[int]:
+    """PostgreSQL 실행 계획의 예상 행 수 (다른 DB 이거나 실패하면 None)"""
+    connection = query.session.connection()
+    if connection.dialect.name != 'postgresql':
+        return None
+
+    compiled = query.order_by(None).statement.compile(
+        dialect=connection.dialect, compile_kwargs={"render_postcompile": True}
+    )
+    try:
+        plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception as e:
+        logger.warning(f"Count estimate failed, falling back to exact count: {e}")
+        return None
+
+
+def count_total(query: Query, count_strategy: str = COUNT_EXACT) -> int:
+    """query 결과의 전체 개수 (COUNT_WINDOW 는 페이지 쿼리가 없으므로 exact 로 계산)"""
+    if count_strategy == COUNT_ESTIMATE:
+        estimate = _estimate_count(query)
+        if estimate is not None and estimate >= ESTIMATE_EXACT_THRESHOLD:
+            return estimate
+
+    if count_strategy == COUNT_CACHED:
+        key = _count_signature(query)
+        total = count_cache.get(key)
+        if total is None:
+            total = query.order_by(None).count()
+            count_cache.set(key, total, settings.PAGINATION_COUNT_CACHE_TTL_SECONDS)
+        return total
+
+    return query.order_by(None).count()
+
+
+def paginate(
+        query: Query,
+        page: int,
+        size: int,
+        count_strategy: str = COUNT_EXACT
+) -> Tuple[list, int]:
+    """OFFSET 페이지네이션 공용 함수. (items, total_count)를 반환합니다.
+
+    query 는 필터와 정렬이 적용된 상태로 전달합니다. 전체 개수 계산 방식은 엔드포인트별로 선택합니다.
+    - COUNT_EXACT: 기존과 같이 count 쿼리를 따로 실행
+    - COUNT_WINDOW: count(*) OVER() 로 페이지와 개수를 한 번에 조회 (범위를 벗어난 페이지만 count 추가 실행)
+    - COUNT_ESTIMATE: 결과가 큰 목록에서 실행 계획의 예상 행 수 사용 (정확하지 않음)
+    - COUNT_CACHED: 같은 필터 조건의 개수를 PAGINATION_COUNT_CACHE_TTL_SECONDS 동안 재사용
+    """
+    if count_strategy not in COUNT_STRATEGIES:
+        raise ValueError(f"unknown count strategy: {count_strategy}")
+
+    offset = (page - 1) * size
+
+    if count_strategy != COUNT_WINDOW:
+        total_count = count_total(query, count_strategy)
+        return query.offset(offset).limit(size).all(), total_count
+
+    entity_count = len(query.column_descriptions)
+    rows = query.add_columns(func.count().over()).offset(offset).limit(size).all()
+    if rows:
+        total_count = rows[0][-1]
+    else:
+        total_count = 0 if offset == 0 else count_total(query, COUNT_EXACT)
+
+    items = [row[0] if entity_count == 1 else tuple(row[:entity_count]) for row in rows]
+    return items, total_count
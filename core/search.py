@@ -0,0 +1,36 @@
+# core/search.py
+from sqlalchemy import text
+
+# LIKE 패턴 escape 문자 (사용자가 입력한 %, _ 를 문자 그대로 검색)
+LIKE_ESCAPE = '/'
+
+
+def escape_like(term: str) -> str:
+    return (
+        term.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace('%', LIKE_ESCAPE + '%')
+        .replace('_', LIKE_ESCAPE + '_')
+    )
+
+
+def contains(column, term: str, case_sensitive: bool = False):
+    """부분 문자열 검색 조건 (column LIKE/ILIKE '%term%')
+
+    pg_trgm GIN 인덱스(gin_trgm_ops)는 LIKE/ILIKE '%term%' 를 그대로 인덱스로 처리합니다.
+    lower(column) 등으로 감싸면 인덱스를 쓰지 못하므로 컬럼에 직접 적용하고,
+    패턴은 바인딩 값으로 전달해 인덱스 유무와 관계없이 같은 결과를 반환합니다.
+    (pg_trgm이 없는 DB에서는 기존과 같이 순차 스캔)
+    """
+    pattern = f"%{escape_like(term)}%"
+    if case_sensitive:
+        return column.like(pattern, escape=LIKE_ESCAPE)
+    return column.ilike(pattern, escape=LIKE_ESCAPE)
+
+
+def trgm_available(connection) -> bool:
+    """pg_trgm 확장이 설치된 PostgreSQL 인지 확인"""
+    if connection.dialect.name != 'postgresql':
+        return False
+    return connection.execute(
+        text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+    ).first() is not None
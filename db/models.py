@@ -1,6 +1,7 @@
 # db/models.py
 from sqlalchemy import Column, Integer, String, TIMESTAMP, UniqueConstraint, DateTime, Text, Boolean, Date, ForeignKey, \
-    Index
+    Index, Float
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 from .database import Base
 from sqlalchemy.types import JSON
@@ -56,6 +57,17 @@ class Image(Base):
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
     uploaded_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
+class ImageExposedUser(Base):
+    __tablename__ = "image_exposed_users"
+
+    # 이미지 노출 사용자 (Image.exposed_users 콤마 문자열을 정규화, 업로드/수정 시 함께 기록)
+    image_id = Column(Integer, ForeignKey("images.id", ondelete="CASCADE"), primary_key=True)
+    user_id = Column(Integer, primary_key=True)
+
+    __table_args__ = (
+        Index('idx_image_exposed_users_user', 'user_id', 'image_id'),  # 사용자별 노출 이미지 조회용
+    )
+
 class Color(Base):
     __tablename__ = "colors"
 
@@ -145,6 +157,18 @@ class Portfolio(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+class PortfolioCountry(Base):
+    __tablename__ = "portfolio_countries"
+
+    # 포트폴리오 노출 국가 (Portfolio.exposed_countries 콤마 문자열을 정규화, 생성/수정 시 함께 기록)
+    portfolio_id = Column(Integer, ForeignKey("portfolios.id", ondelete="CASCADE"), primary_key=True)
+    country_id = Column(Integer, primary_key=True)
+
+    __table_args__ = (
+        Index('idx_portfolio_countries_country', 'country_id', 'portfolio_id'),  # 국가별 포트폴리오 조회용
+    )
+
+
 class Releasedproduct(Base):
     __tablename__ = "releasedproducts"
 
@@ -193,6 +217,61 @@ class DailyView(Base):
     )
 
 
+class WeeklyView(Base):
+    __tablename__ = "weekly_views"
+
+    # daily_views 주간 집계 (services/view_rollup_service.py 에서 증분 갱신)
+    id = Column(Integer, primary_key=True, index=True)
+    week_start = Column(Date, nullable=False)  # 해당 주의 월요일
+    content_type = Column(String(50), nullable=False)
+    content_id = Column(Integer, nullable=False)
+    view_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint('week_start', 'content_type', 'content_id', name='_weekly_view_uc'),
+        Index('idx_weekly_view_content', 'content_type', 'content_id', 'week_start'),
+    )
+
+
+class MonthlyView(Base):
+    __tablename__ = "monthly_views"
+
+    # daily_views 월간 집계 (services/view_rollup_service.py 에서 증분 갱신)
+    id = Column(Integer, primary_key=True, index=True)
+    month_start = Column(Date, nullable=False)  # 해당 월의 1일
+    content_type = Column(String(50), nullable=False)
+    content_id = Column(Integer, nullable=False)
+    view_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint('month_start', 'content_type', 'content_id', name='_monthly_view_uc'),
+        Index('idx_monthly_view_content', 'content_type', 'content_id', 'month_start'),
+    )
+
+
+class ViewRollupState(Base):
+    __tablename__ = "view_rollup_state"
+
+    # 집계 작업 진행 상태 (rolled_through 날짜까지 weekly/monthly 에 반영됨)
+    name = Column(String(50), primary_key=True)
+    rolled_through = Column(Date, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class TrendingScore(Base):
+    __tablename__ = "trending_scores"
+
+    # 조회수를 시간 감쇠해 합산한 트렌딩 점수의 자연로그 (services/trending_service.py 참고)
+    content_type = Column(String(50), primary_key=True)  # 'released_product' 또는 'portfolio'
+    content_id = Column(Integer, primary_key=True)
+    score = Column(Float, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index('idx_trending_type_score', 'content_type', 'score'),  # 트렌딩순 정렬용 인덱스
+    )
+
+
 class Progressstatus(Base):
     __tablename__ = "progressstatus"
 
@@ -210,11 +289,34 @@ class Progressstatus(Base):
     status_note = Column(Text, nullable=True)  # 진행현황 노트
     request_date = Column(DateTime(timezone=True), server_default=func.now())  # 요청일
     expected_shipping_date = Column(Date, nullable=True)  # 예상 배송일
-    changelog = Column(Text, nullable=True)  # 변경 이력
+    # 변경 이력 (구 텍스트 컬럼): progressstatus_changelog 테이블로 이관되어 더 이상 기록하지 않으며, 목록/상세 조회 시 읽지 않도록 지연 로딩
+    changelog = deferred(Column(Text, nullable=True))
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        # 배송 예정일이 지난 진행중 상태 조회 (services/progress_delay_service.py)
+        Index('idx_progressstatus_status_shipping', 'status', 'expected_shipping_date'),
+    )
+
+
+class ProgressstatusChangelog(Base):
+    __tablename__ = "progressstatus_changelog"
+
+    # 진행 상태 변경 이력 (추가 전용, 상세 조회에서만 읽음)
+    id = Column(Integer, primary_key=True)
+    progress_id = Column(Integer, ForeignKey("progressstatus.id", ondelete="CASCADE"), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    actor = Column(String(200), nullable=True)  # 변경자 "username(company_name)"
+    field = Column(String(30), nullable=False)  # status, expected_shipping_date, status_note (이관 시 해석 불가한 줄은 legacy)
+    old_value = Column(Text, nullable=True)  # 표시용 값 (상태명, yy-mm-dd, 메모)
+    new_value = Column(Text, nullable=True)
+
+    __table_args__ = (
+        Index('idx_progressstatus_changelog_progress', 'progress_id', 'id'),  # 진행 상태별 이력 조회용
+    )
+
 
 class Cart(Base):
     __tablename__ = "carts"
@@ -261,4 +363,16 @@ class RealtimeUser(Base):
         UniqueConstraint('user_id', 'content_type', 'content_id', name='_user_content_id_uc'),
         Index('idx_entered_at', 'entered_at'),  # 만료된 레코드 삭제를 위한 인덱스
         Index('idx_content', 'content_type', 'content_id'),  # 빠른 조회를 위한 복합 인덱스
-    )
\ No newline at end of file
+    )
+
+
+class StatusCounter(Base):
+    __tablename__ = "status_counters"
+
+    # 상태별 행 수 (대시보드용), DB 트리거가 custom_designs/progressstatus 변경 시 증감하고
+    # services/status_counter_service.py 가 하루 한 번 GROUP BY 결과로 맞춥니다. (트리거는 migrations/create_status_counters.sql 로만 생성,
+    # 트리거가 없으면 이 테이블은 읽지도 채우지도 않음)
+    kind = Column(String(30), primary_key=True)  # custom_design, progress_status
+    status = Column(String(20), primary_key=True)  # 상태값 (NULL은 '')
+    count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -14,6 +14,7 @@ from Enduser.routers.released_product import router as enduser_released_product_
 from Enduser.routers.share import router as enduser_share_router  # 추가
 from Enduser.routers.language_setting import router as enduser_language_setting_router
 from Enduser.routers.country import router as enduser_country_router
+from Enduser.routers.realtime_users import router as enduser_realtime_users_router
 from Enduser.Email import router as email_mail_router, email_router
 from Manager.released_product.routers.released_product import router as released_product
 from Manager.portfolio.routers.portfolio import router as portfolio
@@ -28,6 +29,15 @@ from Manager.admin.routers.database import router as database
 from Manager.rank.routers.rank import router as rank
 from Manager.progress_status.routers.progress_status import router as progress_status
 from db.database import engine, Base
+from core.config import settings
+from services.presence_service import presence_service
+from services.presence_hub import presence_hub
+from services.scheduler_service import scheduler_service
+from services.view_counter_service import view_counter_service
+from services.leaderboard_service import leaderboard_service
+from services.view_rollup_service import view_rollup_service
+from services.progress_delay_service import progress_delay_service
+from services.status_counter_service import status_counter_service
 
 
 from fastapi.responses import HTMLResponse
@@ -61,6 +71,63 @@ async def add_no_cache_header(request: Request, call_next):
     return response
 
 
+# 백그라운드 주기 작업 등록
+# - 실시간 유저 만료 기록 정리 (요청 처리 중에는 삭제하지 않음)
+scheduler_service.add_job(
+    "presence_sweep",
+    settings.PRESENCE_SWEEP_INTERVAL_SECONDS,
+    presence_service.expire
+)
+# - WebSocket 구독자에게 만료/타 워커 변경분 전송
+scheduler_service.add_job(
+    "presence_push_refresh",
+    settings.PRESENCE_PUSH_REFRESH_SECONDS,
+    presence_hub.refresh
+)
+# - 상세 조회수 버퍼 DB 반영 (종료 시에도 한 번 반영)
+scheduler_service.add_job(
+    "view_counter_flush",
+    settings.VIEW_FLUSH_INTERVAL_SECONDS,
+    view_counter_service.flush,
+    run_on_shutdown=True
+)
+# - 일간 조회수 랭킹 재구성 (다른 워커 반영분 및 날짜 변경 처리)
+scheduler_service.add_job(
+    "leaderboard_rebuild",
+    settings.LEADERBOARD_REBUILD_SECONDS,
+    leaderboard_service.rebuild
+)
+# - 일별 조회수 주간/월간 집계 (집계되지 않은 날짜만)
+scheduler_service.add_job(
+    "view_rollup",
+    settings.VIEW_ROLLUP_INTERVAL_SECONDS,
+    view_rollup_service.run
+)
+# - 배송 예정일이 지난 진행중 상태를 지연으로 변경 (시작 시 바로 한 번, 이후 하루 한 번)
+scheduler_service.add_job(
+    "progress_delay",
+    settings.PROGRESS_DELAY_CHECK_SECONDS,
+    progress_delay_service.run,
+    run_on_start=True
+)
+# - 상태별 카운터(status_counters) 보정 (하루 한 번)
+scheduler_service.add_job(
+    "status_counter_reconcile",
+    settings.STATUS_COUNTER_RECONCILE_CHECK_SECONDS,
+    status_counter_service.run
+)
+
+
+@app.on_event("startup")
+async def start_scheduler():
+    await scheduler_service.start()
+
+
+@app.on_event("shutdown")
+async def stop_scheduler():
+    await scheduler_service.stop()
+
+
 # 허용할 출처(origin) 목록을 정의합니다.
 # 개발 중에는 프론트엔드 개발 서버의 주소를 넣습니다.
 # 예: React는 3000, Vue는 8080, Svelte는 5173 등
@@ -119,6 +186,7 @@ unity_router.include_router(enduser_released_product_router)  # 추가
 unity_router.include_router(enduser_share_router)  # 추가
 unity_router.include_router(enduser_language_setting_router)
 unity_router.include_router(enduser_country_router)
+unity_router.include_router(enduser_realtime_users_router)
 
 unity_router.include_router(email_mail_router)
 unity_router.include_router(email_router)
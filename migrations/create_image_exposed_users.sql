@@ -0,0 +1,26 @@
+-- 이미지 노출 사용자 정규화 테이블 생성 및 기존 데이터 이관
+-- images.exposed_users("1,2,3")가 비어 있으면 전체 공개이며, 값이 있는 이미지만 이 테이블에 행이 생깁니다.
+-- images.exposed_users는 유지하며, 업로드/수정(Manager/image/routers/upload.py) 시 함께 기록합니다.
+
+CREATE TABLE IF NOT EXISTS image_exposed_users (
+    image_id INTEGER NOT NULL REFERENCES images(id) ON DELETE CASCADE,
+    user_id INTEGER NOT NULL,
+    PRIMARY KEY (image_id, user_id)
+);
+
+-- 사용자별 노출 이미지 조회용 인덱스
+CREATE INDEX IF NOT EXISTS idx_image_exposed_users_user ON image_exposed_users (user_id, image_id);
+
+-- 기존 콤마 문자열 이관 (숫자가 아닌 값은 제외, 여러 번 실행해도 안전)
+INSERT INTO image_exposed_users (image_id, user_id)
+SELECT DISTINCT i.id, trim(u.value)::INTEGER
+FROM images i
+CROSS JOIN LATERAL unnest(string_to_array(i.exposed_users, ',')) AS u(value)
+WHERE i.exposed_users IS NOT NULL
+  AND trim(u.value) ~ '^[0-9]+$'
+ON CONFLICT (image_id, user_id) DO NOTHING;
+
+-- 이관 결과 확인
+SELECT COUNT(*) AS image_exposed_user_rows FROM image_exposed_users;
+
+COMMENT ON TABLE image_exposed_users IS '이미지 노출 사용자 (images.exposed_users 정규화)';
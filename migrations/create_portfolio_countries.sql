@@ -0,0 +1,25 @@
+-- 포트폴리오 노출 국가 정규화 테이블 생성 및 기존 데이터 이관
+-- portfolios.exposed_countries("1,2,3")는 전환 기간 동안 유지하며, 포트폴리오 생성/수정 시 두 곳에 함께 기록합니다.
+
+CREATE TABLE IF NOT EXISTS portfolio_countries (
+    portfolio_id INTEGER NOT NULL REFERENCES portfolios(id) ON DELETE CASCADE,
+    country_id INTEGER NOT NULL,
+    PRIMARY KEY (portfolio_id, country_id)
+);
+
+-- 국가별 포트폴리오 조회용 인덱스
+CREATE INDEX IF NOT EXISTS idx_portfolio_countries_country ON portfolio_countries (country_id, portfolio_id);
+
+-- 기존 콤마 문자열 이관 (숫자가 아닌 값은 제외, 여러 번 실행해도 안전)
+INSERT INTO portfolio_countries (portfolio_id, country_id)
+SELECT DISTINCT p.id, trim(c.value)::INTEGER
+FROM portfolios p
+CROSS JOIN LATERAL unnest(string_to_array(p.exposed_countries, ',')) AS c(value)
+WHERE p.exposed_countries IS NOT NULL
+  AND trim(c.value) ~ '^[0-9]+$'
+ON CONFLICT (portfolio_id, country_id) DO NOTHING;
+
+-- 이관 결과 확인
+SELECT COUNT(*) AS portfolio_country_rows FROM portfolio_countries;
+
+COMMENT ON TABLE portfolio_countries IS '포트폴리오 노출 국가 (portfolios.exposed_countries 정규화)';
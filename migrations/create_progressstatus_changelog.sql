@@ -0,0 +1,52 @@
+-- 진행 상태 변경 이력 테이블 생성 및 기존 progressstatus.changelog 텍스트 이관
+-- 기존 텍스트는 한 줄에 한 건: [YYYY-MM-DD HH:MI] 진행현황|발송예정일|발송메모: "이전" → "이후", username(company_name)
+-- 시각은 한국 시간(KST)으로 기록되어 있으므로 Asia/Seoul 기준으로 변환합니다.
+-- 형식에 맞지 않는 줄은 field = 'legacy' 로 원문을 new_value에 보관합니다. (상세 조회 시 그대로 표시)
+-- progressstatus.changelog 컬럼은 유지하지만 더 이상 기록하지 않습니다.
+
+CREATE TABLE IF NOT EXISTS progressstatus_changelog (
+    id SERIAL PRIMARY KEY,
+    progress_id INTEGER NOT NULL REFERENCES progressstatus(id) ON DELETE CASCADE,
+    created_at TIMESTAMPTZ DEFAULT now(),
+    actor VARCHAR(200),
+    field VARCHAR(30) NOT NULL,
+    old_value TEXT,
+    new_value TEXT
+);
+
+-- 진행 상태별 이력 조회용 인덱스
+CREATE INDEX IF NOT EXISTS idx_progressstatus_changelog_progress ON progressstatus_changelog (progress_id, id);
+
+-- 기존 텍스트 이관 (이미 이력 행이 있는 진행 상태는 건너뛰므로 여러 번 실행해도 안전)
+INSERT INTO progressstatus_changelog (progress_id, created_at, actor, field, old_value, new_value)
+SELECT
+    p.id,
+    COALESCE((m.parts[1])::TIMESTAMP AT TIME ZONE 'Asia/Seoul', p.updated_at, p.created_at, now()),
+    m.parts[5],
+    CASE m.parts[2]
+        WHEN '진행현황' THEN 'status'
+        WHEN '발송예정일' THEN 'expected_shipping_date'
+        WHEN '발송메모' THEN 'status_note'
+        ELSE 'legacy'
+    END,
+    m.parts[3],
+    COALESCE(m.parts[4], l.line)
+FROM progressstatus p
+CROSS JOIN LATERAL regexp_split_to_table(p.changelog, E'\n') WITH ORDINALITY AS l(line, n)
+CROSS JOIN LATERAL (
+    SELECT regexp_match(
+        l.line,
+        '^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2})\] (진행현황|발송예정일|발송메모): "(.*)" → "(.*)", (.*)$'
+    ) AS parts
+) m
+WHERE p.changelog IS NOT NULL
+  AND trim(l.line) <> ''
+  AND NOT EXISTS (
+      SELECT 1 FROM progressstatus_changelog c WHERE c.progress_id = p.id
+  )
+ORDER BY p.id, l.n;
+
+-- 이관 결과 확인
+SELECT field, COUNT(*) AS row_count FROM progressstatus_changelog GROUP BY field ORDER BY field;
+
+COMMENT ON TABLE progressstatus_changelog IS '진행 상태 변경 이력 (progressstatus.changelog 텍스트 대체, 추가 전용)';
@@ -0,0 +1,7 @@
+-- 진행 상태 지연 처리용 인덱스
+-- services/progress_delay_service.py 가 하루 한 번 실행하는
+-- UPDATE progressstatus SET status = '2' WHERE status = '1' AND expected_shipping_date < 오늘
+-- 이 전체 테이블 대신 인덱스 범위만 읽도록 합니다. (목록 조회 시에는 더 이상 UPDATE 하지 않음)
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_progressstatus_status_shipping
+    ON progressstatus (status, expected_shipping_date);
@@ -0,0 +1,105 @@
+-- 상태별 카운터 테이블 생성, 증감 트리거 등록 및 초기 집계
+-- custom_designs / progressstatus 의 INSERT, status 변경, DELETE 시 문장 단위 트리거가 변경된 행을
+-- 상태별로 모아 한 번에 증감합니다. (ORM, 일괄 UPDATE, INSERT ... SELECT, 관리자 SQL 모두 반영)
+-- TRUNCATE 등으로 생긴 오차는 services/status_counter_service.py 가 하루 한 번 GROUP BY 결과로 맞춥니다.
+-- kind 값은 services/status_counter_service.py 의 STATUS_COUNTER_SOURCES 와 같아야 합니다.
+
+CREATE TABLE IF NOT EXISTS status_counters (
+    kind VARCHAR(30) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+    PRIMARY KEY (kind, status)
+);
+
+-- TG_ARGV[0]: kind, 전이 테이블 old_rows/new_rows 의 status 컬럼 기준으로 증감 (NULL 상태는 '')
+-- 카운터 행은 status 순서로 잠가 동시 일괄 변경 간 교착을 피합니다.
+CREATE OR REPLACE FUNCTION status_counters_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO status_counters (kind, status, count)
+        SELECT TG_ARGV[0], COALESCE(n.status, ''), COUNT(*)
+        FROM new_rows n
+        GROUP BY COALESCE(n.status, '')
+        ORDER BY 2
+        ON CONFLICT (kind, status) DO UPDATE
+            SET count = status_counters.count + EXCLUDED.count, updated_at = now();
+
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO status_counters (kind, status, count)
+        SELECT TG_ARGV[0], COALESCE(o.status, ''), -COUNT(*)
+        FROM old_rows o
+        GROUP BY COALESCE(o.status, '')
+        ORDER BY 2
+        ON CONFLICT (kind, status) DO UPDATE
+            SET count = status_counters.count + EXCLUDED.count, updated_at = now();
+
+    ELSE
+        INSERT INTO status_counters (kind, status, count)
+        SELECT TG_ARGV[0], d.status, SUM(d.delta)
+        FROM (
+            SELECT COALESCE(o.status, '') AS status, -1 AS delta
+            FROM old_rows o JOIN new_rows n ON n.id = o.id
+            WHERE o.status IS DISTINCT FROM n.status
+            UNION ALL
+            SELECT COALESCE(n.status, ''), 1
+            FROM old_rows o JOIN new_rows n ON n.id = o.id
+            WHERE o.status IS DISTINCT FROM n.status
+        ) d
+        GROUP BY d.status
+        HAVING SUM(d.delta) <> 0
+        ORDER BY 2
+        ON CONFLICT (kind, status) DO UPDATE
+            SET count = status_counters.count + EXCLUDED.count, updated_at = now();
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+-- 커스텀 디자인 트리거
+DROP TRIGGER IF EXISTS trg_custom_designs_status_insert ON custom_designs;
+CREATE TRIGGER trg_custom_designs_status_insert
+    AFTER INSERT ON custom_designs REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION status_counters_apply('custom_design');
+
+DROP TRIGGER IF EXISTS trg_custom_designs_status_update ON custom_designs;
+CREATE TRIGGER trg_custom_designs_status_update
+    AFTER UPDATE ON custom_designs REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION status_counters_apply('custom_design');
+
+DROP TRIGGER IF EXISTS trg_custom_designs_status_delete ON custom_designs;
+CREATE TRIGGER trg_custom_designs_status_delete
+    AFTER DELETE ON custom_designs REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION status_counters_apply('custom_design');
+
+-- 진행 상태 트리거
+DROP TRIGGER IF EXISTS trg_progressstatus_status_insert ON progressstatus;
+CREATE TRIGGER trg_progressstatus_status_insert
+    AFTER INSERT ON progressstatus REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION status_counters_apply('progress_status');
+
+DROP TRIGGER IF EXISTS trg_progressstatus_status_update ON progressstatus;
+CREATE TRIGGER trg_progressstatus_status_update
+    AFTER UPDATE ON progressstatus REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION status_counters_apply('progress_status');
+
+DROP TRIGGER IF EXISTS trg_progressstatus_status_delete ON progressstatus;
+CREATE TRIGGER trg_progressstatus_status_delete
+    AFTER DELETE ON progressstatus REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION status_counters_apply('progress_status');
+
+-- 초기 집계 (트리거 등록 후 테이블을 잠그고 전체 값으로 덮어쓰므로 여러 번 실행해도 안전)
+BEGIN;
+LOCK TABLE status_counters IN EXCLUSIVE MODE;
+DELETE FROM status_counters WHERE kind IN ('custom_design', 'progress_status');
+INSERT INTO status_counters (kind, status, count)
+SELECT 'custom_design', COALESCE(status, ''), COUNT(*) FROM custom_designs GROUP BY COALESCE(status, '')
+UNION ALL
+SELECT 'progress_status', COALESCE(status, ''), COUNT(*) FROM progressstatus GROUP BY COALESCE(status, '');
+COMMIT;
+
+-- 집계 결과 확인
+SELECT kind, status, count FROM status_counters ORDER BY kind, status;
+
+COMMENT ON TABLE status_counters IS '커스텀 디자인/진행 상태의 상태별 행 수 (트리거 증감, 일 1회 보정)';
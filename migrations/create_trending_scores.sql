@@ -0,0 +1,33 @@
+-- 트렌딩 점수 테이블 생성 및 daily_views 기준 초기 점수 구축
+-- 점수 = ln(Σ view_count * exp(ln2 / 반감기 * (view_date - 기준일))) (exp 값은 기준일에서 멀어지면 float 범위를 넘으므로 로그로 저장)
+-- 초기 점수 계산은 기존 값을 덮어쓰므로 다시 실행하면 이전 형식(로그 아님)의 점수도 변환됩니다.
+-- 기준일(2025-01-01)과 반감기(7일)는 services/trending_service.py, core/config.py 값과 같아야 합니다.
+
+CREATE TABLE IF NOT EXISTS trending_scores (
+    content_type VARCHAR(50) NOT NULL,
+    content_id INTEGER NOT NULL,
+    score DOUBLE PRECISION NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+    PRIMARY KEY (content_type, content_id)
+);
+
+-- 트렌딩순 정렬용 인덱스
+CREATE INDEX IF NOT EXISTS idx_trending_type_score ON trending_scores (content_type, score);
+
+-- 기존 일별 조회수로 초기 점수 계산 (ln(Σ exp(w)) = max(w) + ln(Σ exp(w - max(w))))
+INSERT INTO trending_scores (content_type, content_id, score)
+SELECT content_type, content_id, MAX(max_weight) + ln(SUM(exp(log_weight - max_weight)))
+FROM (
+    SELECT content_type, content_id, log_weight,
+           MAX(log_weight) OVER (PARTITION BY content_type, content_id) AS max_weight
+    FROM (
+        SELECT content_type, content_id,
+               ln(view_count) + ln(2) / 7 * (view_date - DATE '2025-01-01') AS log_weight
+        FROM daily_views
+        WHERE view_count > 0
+    ) w
+) m
+GROUP BY content_type, content_id
+ON CONFLICT (content_type, content_id) DO UPDATE SET score = EXCLUDED.score, updated_at = now();
+
+COMMENT ON TABLE trending_scores IS '시간 감쇠 조회수 기반 트렌딩 점수 (조회수 반영 시 증분 갱신)';
@@ -0,0 +1,27 @@
+-- 부분 문자열 검색('%검색어%')용 pg_trgm GIN 인덱스 생성
+-- LIKE/ILIKE '%x%' 는 일반 B-tree 인덱스를 사용할 수 없어 순차 스캔이 되므로
+-- gin_trgm_ops 인덱스로 검색합니다. (검색 조건은 core/search.py 의 contains())
+-- pg_trgm 확장을 설치할 수 없는 환경에서는 NOTICE만 남기고 건너뛰며, 검색은 기존처럼 순차 스캔으로 동작합니다.
+
+DO $$
+BEGIN
+    BEGIN
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+    EXCEPTION WHEN OTHERS THEN
+        RAISE NOTICE 'pg_trgm 확장을 설치할 수 없습니다: %', SQLERRM;
+    END;
+
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm') THEN
+        CREATE INDEX IF NOT EXISTS idx_trgm_portfolios_design_name ON portfolios USING gin (design_name gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_trgm_releasedproducts_design_name ON releasedproducts USING gin (design_name gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_trgm_releasedproducts_color_name ON releasedproducts USING gin (color_name gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_trgm_brands_brand_name ON brands USING gin (brand_name gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_trgm_images_display_name ON images USING gin (display_name gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_trgm_account_username ON account USING gin (username gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_trgm_account_company_name ON account USING gin (company_name gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_trgm_account_contact_name ON account USING gin (contact_name gin_trgm_ops);
+    END IF;
+END $$;
+
+-- 생성 결과 확인
+SELECT indexname, tablename FROM pg_indexes WHERE indexname LIKE 'idx_trgm_%' ORDER BY tablename, indexname;
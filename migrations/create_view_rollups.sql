@@ -0,0 +1,33 @@
+-- daily_views 주간/월간 집계 테이블 생성
+-- 기존 데이터는 view_rollup 스케줄 작업(services/view_rollup_service.py)이 첫 실행 시
+-- daily_views 최초 날짜부터 어제까지 집계합니다.
+
+CREATE TABLE IF NOT EXISTS weekly_views (
+    id SERIAL PRIMARY KEY,
+    week_start DATE NOT NULL,
+    content_type VARCHAR(50) NOT NULL,
+    content_id INTEGER NOT NULL,
+    view_count INTEGER NOT NULL DEFAULT 0,
+    CONSTRAINT _weekly_view_uc UNIQUE (week_start, content_type, content_id)
+);
+CREATE INDEX IF NOT EXISTS idx_weekly_view_content ON weekly_views (content_type, content_id, week_start);
+
+CREATE TABLE IF NOT EXISTS monthly_views (
+    id SERIAL PRIMARY KEY,
+    month_start DATE NOT NULL,
+    content_type VARCHAR(50) NOT NULL,
+    content_id INTEGER NOT NULL,
+    view_count INTEGER NOT NULL DEFAULT 0,
+    CONSTRAINT _monthly_view_uc UNIQUE (month_start, content_type, content_id)
+);
+CREATE INDEX IF NOT EXISTS idx_monthly_view_content ON monthly_views (content_type, content_id, month_start);
+
+-- 집계 진행 상태 (rolled_through 날짜까지 반영됨)
+CREATE TABLE IF NOT EXISTS view_rollup_state (
+    name VARCHAR(50) PRIMARY KEY,
+    rolled_through DATE NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT now()
+);
+
+COMMENT ON TABLE weekly_views IS 'daily_views 주간 집계 (week_start = 월요일)';
+COMMENT ON TABLE monthly_views IS 'daily_views 월간 집계 (month_start = 1일)';
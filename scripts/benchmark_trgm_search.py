@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+부분 문자열 검색 벤치마크 (pg_trgm GIN 인덱스 유무 비교)
+별도 스키마에 검색용 테이블을 만들고 N건을 넣은 뒤, core/search.py 의 contains() 조건으로
+인덱스 없이 / gin_trgm_ops 인덱스로 각각 검색해 지연 시간(p50, p95)과 실행 계획을 출력합니다.
+
+사용 방법:
+    python scripts/benchmark_trgm_search.py --rows 100000
+    python scripts/benchmark_trgm_search.py --rows 300000 --keep   # 스키마를 남겨 둠
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import argparse
+import logging
+import random
+import string
+import time
+from sqlalchemy import MetaData, Table, Column, Integer, String, select, func, text
+from db.database import engine
+from core.search import contains, trgm_available
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SEARCH_TERMS = ['abc', 'lens', 'x7q', 'blue', 'zz']
+REPEAT = 20
+
+
+def build_table(schema: str) -> Table:
+    metadata = MetaData(schema=schema)
+    return Table(
+        'search_bench', metadata,
+        Column('id', Integer, primary_key=True),
+        Column('name', String(100), nullable=False),
+    )
+
+
+def random_name(rng: random.Random) -> str:
+    words = ['lens', 'blue', 'brown', 'gray', 'natural', 'ring', 'honey', 'olive']
+    suffix = ''.join(rng.choices(string.ascii_lowercase + string.digits, k=8))
+    return f"{rng.choice(words)}-{suffix}"
+
+
+def seed(conn, table: Table, rows: int, batch: int = 10000):
+    rng = random.Random(42)
+    for start in range(0, rows, batch):
+        conn.execute(table.insert(), [
+            {'name': random_name(rng)} for _ in range(min(batch, rows - start))
+        ])
+    conn.execute(text(f'ANALYZE {table.schema}.{table.name}'))
+
+
+def measure(conn, table: Table, case_sensitive: bool):
+    results = {}
+    for term in SEARCH_TERMS:
+        query = select(func.count()).select_from(table).where(
+            contains(table.c.name, term, case_sensitive=case_sensitive)
+        )
+        timings = []
+        for _ in range(REPEAT):
+            started = time.perf_counter()
+            conn.execute(query).scalar()
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        compiled = query.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+        plan = conn.execute(text(f"EXPLAIN {compiled}")).scalars().all()
+        scan = next((line.strip() for line in plan if 'Scan' in line), plan[0].strip())
+        results[term] = (timings[len(timings) // 2], timings[int(len(timings) * 0.95) - 1], scan)
+    return results
+
+
+def report(label: str, results: dict):
+    logger.info(f"[{label}]")
+    for term, (p50, p95, scan) in results.items():
+        logger.info(f"  '{term}': p50={p50:.2f}ms p95={p95:.2f}ms  {scan}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='pg_trgm 부분 문자열 검색 벤치마크')
+    parser.add_argument('--rows', type=int, default=100000, help='생성할 행 수 (기본 100000)')
+    parser.add_argument('--schema', default='trgm_bench', help='벤치마크용 스키마 이름')
+    parser.add_argument('--keep', action='store_true', help='종료 후 스키마를 삭제하지 않음')
+    args = parser.parse_args()
+
+    if engine.dialect.name != 'postgresql':
+        logger.error("PostgreSQL DATABASE_URL 에서만 실행할 수 있습니다.")
+        sys.exit(1)
+
+    table = build_table(args.schema)
+    # 단계마다 트랜잭션을 따로 사용 (측정용 SELECT가 시작한 트랜잭션은 측정 후 롤백)
+    with engine.begin() as conn:
+        conn.execute(text(f'DROP SCHEMA IF EXISTS "{args.schema}" CASCADE'))
+        conn.execute(text(f'CREATE SCHEMA "{args.schema}"'))
+        table.create(conn)
+        seed(conn, table, args.rows)
+    logger.info(f"{args.rows}건 생성 완료")
+
+    try:
+        with engine.connect() as conn:
+            for case_sensitive in (False, True):
+                op = 'LIKE' if case_sensitive else 'ILIKE'
+                report(f"{op} / 인덱스 없음", measure(conn, table, case_sensitive))
+            conn.rollback()
+
+        with engine.begin() as conn:
+            if not trgm_available(conn):
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            conn.execute(text(
+                f'CREATE INDEX idx_trgm_search_bench_name ON "{args.schema}".search_bench '
+                f'USING gin (name gin_trgm_ops)'
+            ))
+            conn.execute(text(f'ANALYZE "{args.schema}".search_bench'))
+
+        with engine.connect() as conn:
+            for case_sensitive in (False, True):
+                op = 'LIKE' if case_sensitive else 'ILIKE'
+                report(f"{op} / gin_trgm_ops", measure(conn, table, case_sensitive))
+            conn.rollback()
+    finally:
+        if not args.keep:
+            with engine.begin() as conn:
+                conn.execute(text(f'DROP SCHEMA IF EXISTS "{args.schema}" CASCADE'))
+
+
+if __name__ == "__main__":
+    main()
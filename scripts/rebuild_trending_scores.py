@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+트렌딩 점수 재계산 스크립트
+daily_views 전체로 trending_scores 테이블의 점수를 다시 계산합니다.
+
+사용 방법:
+- 최초 구축 시 (migrations/create_trending_scores.sql 대신 사용 가능)
+- core/config.py 의 TRENDING_HALF_LIFE_DAYS 변경 후
+- 점수를 로그 값으로 저장하기 전에 계산된 점수를 변환할 때
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import logging
+from db.database import SessionLocal, engine
+from db import models
+from services.trending_service import rebuild_trending_scores
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+if __name__ == "__main__":
+    models.TrendingScore.__table__.create(bind=engine, checkfirst=True)
+
+    with SessionLocal() as db:
+        count = rebuild_trending_scores(db)
+
+    logger.info(f"트렌딩 점수 재계산 완료: {count}건")
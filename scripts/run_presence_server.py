@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+공유 presence 서버 실행 스크립트
+여러 uvicorn 워커가 실시간 유저수를 공유해야 할 때 사용합니다.
+
+사용 방법:
+1. 이 스크립트를 별도 프로세스로 실행
+2. 각 API 서버의 .env 에 PRESENCE_BACKEND=shared 설정
+   (PRESENCE_SHARED_HOST / PRESENCE_SHARED_PORT / PRESENCE_SHARED_AUTHKEY 동일하게 지정)
+   PRESENCE_SHARED_AUTHKEY 는 기본값이 없으며, 서버와 API 서버 모두 같은 비밀 값을 지정해야 합니다.
+   (예: python -c "import secrets; print(secrets.token_urlsafe(32))")
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import logging
+from core.config import settings
+from services.presence_service import serve_shared_presence
+
+logging.basicConfig(level=logging.INFO)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="공유 presence 서버")
+    parser.add_argument('--host', default=settings.PRESENCE_SHARED_HOST, help='바인딩 주소')
+    parser.add_argument('--port', type=int, default=settings.PRESENCE_SHARED_PORT, help='바인딩 포트')
+
+    args = parser.parse_args()
+
+    serve_shared_presence(args.host, args.port, settings.PRESENCE_SHARED_AUTHKEY)
@@ -0,0 +1,124 @@
+# services/leaderboard_service.py
+import heapq
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from db import models
+from db.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+BoardKey = Tuple[str, date]  # (content_type, view_date)
+
+
+class DailyLeaderboard:
+    """하루치 컨텐츠 조회수 top-N
+
+    조회수는 증가만 하므로 top 밖의 항목은 현재 top의 최솟값을 넘을 때만 진입합니다.
+    전체 조회수(counts)는 top에서 밀려난 항목의 재진입을 위해 유지합니다.
+    """
+
+    def __init__(self, capacity: int, counts: Optional[Dict[int, int]] = None):
+        self.capacity = capacity
+        self.counts: Dict[int, int] = dict(counts or {})
+        self.top: Dict[int, int] = dict(
+            heapq.nlargest(capacity, self.counts.items(), key=lambda item: (item[1], -item[0]))
+        )
+
+    def add(self, content_id: int, count: int):
+        new_count = self.counts.get(content_id, 0) + count
+        self.counts[content_id] = new_count
+
+        if content_id in self.top or len(self.top) < self.capacity:
+            self.top[content_id] = new_count
+            return
+
+        # top의 최솟값보다 커지면 교체 (capacity가 작으므로 최솟값은 선형 탐색)
+        min_id = min(self.top, key=lambda cid: (self.top[cid], -cid))
+        if (new_count, -content_id) > (self.top[min_id], -min_id):
+            del self.top[min_id]
+            self.top[content_id] = new_count
+
+    def ranked(self) -> List[Tuple[int, int]]:
+        """(content_id, view_count) 목록을 조회수 내림차순으로 반환"""
+        return sorted(self.top.items(), key=lambda item: (-item[1], item[0]))
+
+
+class LeaderboardService:
+    """컨텐츠 종류별 일간 조회수 랭킹 (메모리)
+
+    - 조회수가 DB에 반영될 때 apply()로 증분 갱신합니다.
+    - 해당 날짜의 랭킹이 없으면(콜드 스타트, 날짜 변경) daily_views에서 다시 만듭니다.
+    - 다른 워커에서 반영된 조회수를 맞추기 위해 스케줄러가 rebuild()를 주기적으로 호출합니다.
+
+    이 워커의 조회수 커밋과 apply()는 committing() 안에서 실행해 rebuild()의 조회/교체와 겹치지 않게 합니다.
+    (겹치면 rebuild가 읽은 값에 apply가 다시 더해지거나, 이전 랭킹에만 반영된 뒤 교체되어 사라짐)
+    """
+
+    def __init__(self, capacity: int = 20, session_factory=SessionLocal):
+        self.capacity = capacity
+        self.session_factory = session_factory
+        self._lock = threading.Lock()
+        # 조회수 커밋+apply 와 rebuild 의 조회+교체를 직렬화 (랭킹 조회는 _lock 만 사용)
+        self._sync_lock = threading.Lock()
+        self._boards: Dict[BoardKey, DailyLeaderboard] = {}
+
+    @contextmanager
+    def committing(self):
+        """조회수 DB 커밋과 apply()를 묶는 구간 (그 사이에 rebuild()가 랭킹을 읽거나 교체하지 않음)"""
+        with self._sync_lock:
+            yield
+
+    def apply(self, views: Dict[Tuple[str, int, date], int]):
+        """DB에 반영된 조회수를 랭킹에 반영 (이미 만들어진 날짜의 랭킹만 갱신)"""
+        with self._lock:
+            for (content_type, content_id, view_date), count in views.items():
+                board = self._boards.get((content_type, view_date))
+                if board is not None and count:
+                    board.add(content_id, count)
+
+    def _load(self, content_type: str, view_date: date) -> DailyLeaderboard:
+        with self.session_factory() as db:
+            rows = db.query(
+                models.DailyView.content_id,
+                models.DailyView.view_count
+            ).filter(
+                models.DailyView.view_date == view_date,
+                models.DailyView.content_type == content_type
+            ).all()
+
+        return DailyLeaderboard(self.capacity, {row.content_id: row.view_count or 0 for row in rows})
+
+    def rebuild(self, content_types=('released_product', 'portfolio'), view_date: Optional[date] = None) -> int:
+        """daily_views에서 랭킹을 다시 만들고 이전 날짜 랭킹은 정리합니다."""
+        view_date = view_date or date.today()
+
+        with self._sync_lock:
+            boards = {content_type: self._load(content_type, view_date) for content_type in content_types}
+
+            with self._lock:
+                for content_type, board in boards.items():
+                    self._boards[(content_type, view_date)] = board
+                for key in [key for key in self._boards if key[1] < view_date]:
+                    del self._boards[key]
+
+        return sum(len(board.counts) for board in boards.values())
+
+    def get_top(self, content_type: str, limit: int = 10, view_date: Optional[date] = None) -> List[Tuple[int, int]]:
+        """(content_id, view_count) top 목록 조회"""
+        view_date = view_date or date.today()
+
+        with self._lock:
+            board = self._boards.get((content_type, view_date))
+        if board is None:
+            self.rebuild((content_type,), view_date)
+
+        with self._lock:
+            return self._boards[(content_type, view_date)].ranked()[:limit]
+
+
+# 싱글톤 인스턴스
+leaderboard_service = LeaderboardService()
@@ -0,0 +1,122 @@
+# services/presence_hub.py
+import asyncio
+import logging
+import threading
+from typing import Dict, Iterable, List, Set, Tuple
+
+from services.presence_service import presence_service
+
+logger = logging.getLogger(__name__)
+
+ContentKey = Tuple[str, int]  # (content_type, content_id)
+
+
+class PresenceSubscription:
+    """WebSocket 연결 하나의 구독 정보
+
+    publish는 동기 엔드포인트(스레드풀)에서도 호출되므로
+    이벤트 루프에 call_soon_threadsafe로 메시지를 넘깁니다.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.keys: Set[ContentKey] = set()
+
+    def push(self, message: dict):
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, message)
+
+
+class PresenceHub:
+    """실시간 유저수 변경을 구독자에게 전달하는 프로세스 내 fan-out 허브
+
+    컨텐츠별 마지막 전송 값을 기억해 값이 바뀐 경우에만 전송합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[ContentKey, Set[PresenceSubscription]] = {}
+        self._last_counts: Dict[ContentKey, int] = {}
+
+    def subscribe(self, subscription: PresenceSubscription, keys: Iterable[ContentKey]) -> List[dict]:
+        """구독 추가 후 현재 유저수 스냅샷을 반환합니다."""
+        keys = [key for key in keys if key not in subscription.keys]
+
+        with self._lock:
+            for key in keys:
+                self._subscribers.setdefault(key, set()).add(subscription)
+                subscription.keys.add(key)
+
+        snapshot = []
+        for content_type, content_ids in _group_by_type(keys).items():
+            counts = presence_service.counts(content_type, content_ids)
+            for content_id, count in counts.items():
+                with self._lock:
+                    self._last_counts.setdefault((content_type, content_id), count)
+                snapshot.append(_message(content_type, content_id, count))
+
+        return snapshot
+
+    def unsubscribe(self, subscription: PresenceSubscription, keys: Iterable[ContentKey] = None):
+        """구독 해제 (keys가 없으면 전체 해제)"""
+        keys = list(subscription.keys if keys is None else keys)
+
+        with self._lock:
+            for key in keys:
+                subscription.keys.discard(key)
+                subscribers = self._subscribers.get(key)
+                if not subscribers:
+                    continue
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[key]
+                    self._last_counts.pop(key, None)
+
+    def publish(self, content_type: str, content_id: int, count: int):
+        """유저수 변경 알림 (구독자가 없거나 값이 같으면 무시)"""
+        key = (content_type, content_id)
+
+        with self._lock:
+            subscribers = self._subscribers.get(key)
+            if not subscribers or self._last_counts.get(key) == count:
+                return
+            self._last_counts[key] = count
+            subscribers = list(subscribers)
+
+        message = _message(content_type, content_id, count)
+        for subscription in subscribers:
+            subscription.push(message)
+
+    def refresh(self) -> int:
+        """구독 중인 컨텐츠의 유저수를 다시 조회해 변경분을 전송합니다.
+
+        만료로 인한 감소나 다른 워커(shared 저장소)에서 발생한 변경을 반영하기 위해
+        스케줄러에서 주기적으로 호출합니다.
+        """
+        with self._lock:
+            keys = list(self._subscribers.keys())
+
+        for content_type, content_ids in _group_by_type(keys).items():
+            for content_id, count in presence_service.counts(content_type, content_ids).items():
+                self.publish(content_type, content_id, count)
+
+        return len(keys)
+
+
+def _group_by_type(keys: Iterable[ContentKey]) -> Dict[str, List[int]]:
+    grouped: Dict[str, List[int]] = {}
+    for content_type, content_id in keys:
+        grouped.setdefault(content_type, []).append(content_id)
+    return grouped
+
+
+def _message(content_type: str, content_id: int, count: int) -> dict:
+    return {
+        "content_type": content_type,
+        "content_id": content_id,
+        "realtime_users": count
+    }
+
+
+# 싱글톤 인스턴스
+presence_hub = PresenceHub()
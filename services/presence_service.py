@@ -0,0 +1,411 @@
+# services/presence_service.py
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from multiprocessing.managers import BaseManager
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from core.config import settings
+from db import models
+from db.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+ContentKey = Tuple[str, int]  # (content_type, content_id)
+
+
+class PresenceBackend:
+    """실시간 유저(presence) 저장소 인터페이스
+
+    모든 메서드는 content_type + content_id 기준으로 동작하며,
+    touch/leave는 처리 후의 현재 유저수를 반환합니다.
+    """
+
+    def touch(self, content_type: str, content_id: int, user_id: str,
+              content_name: Optional[str] = None) -> int:
+        """유저 입장 또는 입장 시간 갱신"""
+        raise NotImplementedError
+
+    def leave(self, content_type: str, content_id: int, user_id: str) -> int:
+        """유저 퇴장"""
+        raise NotImplementedError
+
+    def count(self, content_type: str, content_id: int) -> int:
+        """현재 유저수 조회"""
+        return self.counts(content_type, [content_id]).get(content_id, 0)
+
+    def counts(self, content_type: str, content_ids: Iterable[int]) -> Dict[int, int]:
+        """여러 컨텐츠의 현재 유저수 일괄 조회"""
+        raise NotImplementedError
+
+    def heartbeat(self, user_id: str, enter_keys: List[ContentKey],
+                  leave_keys: List[ContentKey]) -> Dict[ContentKey, int]:
+        """여러 컨텐츠의 입장/갱신/퇴장을 한 번에 처리하고 변경 후 유저수를 반환합니다."""
+        for content_type, content_id in enter_keys:
+            self.touch(content_type, content_id, user_id)
+        for content_type, content_id in leave_keys:
+            self.leave(content_type, content_id, user_id)
+        return self._counts_by_key(list(enter_keys) + list(leave_keys))
+
+    def _counts_by_key(self, keys: List[ContentKey]) -> Dict[ContentKey, int]:
+        grouped: Dict[str, List[int]] = {}
+        for content_type, content_id in keys:
+            grouped.setdefault(content_type, []).append(content_id)
+
+        result = {}
+        for content_type, content_ids in grouped.items():
+            for content_id, count in self.counts(content_type, content_ids).items():
+                result[(content_type, content_id)] = count
+        return result
+
+    def expire(self) -> int:
+        """만료된 기록 정리. 정리된 기록 수를 반환합니다."""
+        raise NotImplementedError
+
+
+class MemoryPresenceBackend(PresenceBackend):
+    """프로세스 내 메모리 presence 저장소 (기본값)
+
+    컨텐츠별 {user_id: 마지막 갱신 시각} 딕셔너리와 시간 버킷 큐를 사용합니다.
+    touch는 현재 버킷에 항목을 추가만 하고, 만료 처리는 가장 오래된 버킷부터
+    꺼내며 그 사이 갱신되지 않은 항목만 삭제하므로 touch/expire/count 모두
+    분할 상환 O(1)입니다.
+    """
+
+    def __init__(self, ttl_seconds: int = 60, bucket_seconds: int = 1):
+        self.ttl_seconds = ttl_seconds
+        self.bucket_seconds = bucket_seconds
+        self._lock = threading.Lock()
+        self._last_seen: Dict[ContentKey, Dict[str, float]] = {}
+        self._buckets: Dict[int, Set[Tuple[ContentKey, str]]] = {}
+        self._bucket_order: Deque[int] = deque()
+
+    def _bucket_of(self, timestamp: float) -> int:
+        return int(timestamp // self.bucket_seconds)
+
+    def _expire_locked(self, now: float) -> int:
+        cutoff_bucket = self._bucket_of(now - self.ttl_seconds)
+        removed = 0
+
+        while self._bucket_order and self._bucket_order[0] < cutoff_bucket:
+            bucket = self._bucket_order.popleft()
+            for key, user_id in self._buckets.pop(bucket, ()):
+                users = self._last_seen.get(key)
+                if not users or user_id not in users:
+                    continue  # 이미 퇴장한 유저
+                # 이후에 다시 갱신된 유저는 더 최근 버킷에 들어 있으므로 건너뜀
+                if self._bucket_of(users[user_id]) != bucket:
+                    continue
+                del users[user_id]
+                removed += 1
+                if not users:
+                    del self._last_seen[key]
+
+        return removed
+
+    def _touch_locked(self, key: ContentKey, user_id: str, now: float) -> int:
+        bucket = self._bucket_of(now)
+
+        self._last_seen.setdefault(key, {})[user_id] = now
+        if bucket not in self._buckets:
+            self._buckets[bucket] = set()
+            self._bucket_order.append(bucket)
+        self._buckets[bucket].add((key, user_id))
+
+        return len(self._last_seen[key])
+
+    def _leave_locked(self, key: ContentKey, user_id: str) -> int:
+        users = self._last_seen.get(key)
+        if not users:
+            return 0
+        users.pop(user_id, None)
+        if not users:
+            del self._last_seen[key]
+            return 0
+        return len(users)
+
+    def touch(self, content_type: str, content_id: int, user_id: str,
+              content_name: Optional[str] = None) -> int:
+        now = time.monotonic()
+
+        with self._lock:
+            self._expire_locked(now)
+            return self._touch_locked((content_type, content_id), user_id, now)
+
+    def leave(self, content_type: str, content_id: int, user_id: str) -> int:
+        with self._lock:
+            self._expire_locked(time.monotonic())
+            return self._leave_locked((content_type, content_id), user_id)
+
+    def heartbeat(self, user_id: str, enter_keys: List[ContentKey],
+                  leave_keys: List[ContentKey]) -> Dict[ContentKey, int]:
+        now = time.monotonic()
+
+        with self._lock:
+            self._expire_locked(now)
+            for key in enter_keys:
+                self._touch_locked(tuple(key), user_id, now)
+            for key in leave_keys:
+                self._leave_locked(tuple(key), user_id)
+
+            return {
+                tuple(key): len(self._last_seen.get(tuple(key), ()))
+                for key in list(enter_keys) + list(leave_keys)
+            }
+
+    def counts(self, content_type: str, content_ids: Iterable[int]) -> Dict[int, int]:
+        with self._lock:
+            self._expire_locked(time.monotonic())
+            return {
+                content_id: len(self._last_seen.get((content_type, content_id), ()))
+                for content_id in content_ids
+            }
+
+    def expire(self) -> int:
+        with self._lock:
+            return self._expire_locked(time.monotonic())
+
+
+class _PresenceManager(BaseManager):
+    """공유 presence 서버/클라이언트용 multiprocessing 매니저"""
+    pass
+
+
+_PresenceManager.register('get_presence')
+
+
+class SharedPresenceBackend(PresenceBackend):
+    """별도 프로세스의 MemoryPresenceBackend를 공유하는 저장소 (멀티 워커용)
+
+    서버는 scripts/run_presence_server.py 로 실행합니다.
+    연결이 끊기면 한 번 재연결 후 재시도합니다.
+    """
+
+    def __init__(self, host: str, port: int, authkey: str):
+        self.address = (host, port)
+        self.authkey = authkey.encode()
+        self._lock = threading.Lock()
+        self._proxy = None
+
+    def _connect(self):
+        manager = _PresenceManager(address=self.address, authkey=self.authkey)
+        manager.connect()
+        return manager.get_presence()
+
+    def _call(self, method: str, *args):
+        for attempt in range(2):
+            with self._lock:
+                if self._proxy is None:
+                    self._proxy = self._connect()
+                proxy = self._proxy
+            try:
+                return getattr(proxy, method)(*args)
+            except (ConnectionError, EOFError, BrokenPipeError):
+                with self._lock:
+                    self._proxy = None
+                if attempt:
+                    raise
+                logger.warning("공유 presence 서버 연결이 끊어져 재연결합니다.")
+
+    def touch(self, content_type: str, content_id: int, user_id: str,
+              content_name: Optional[str] = None) -> int:
+        return self._call('touch', content_type, content_id, user_id)
+
+    def leave(self, content_type: str, content_id: int, user_id: str) -> int:
+        return self._call('leave', content_type, content_id, user_id)
+
+    def counts(self, content_type: str, content_ids: Iterable[int]) -> Dict[int, int]:
+        return self._call('counts', content_type, list(content_ids))
+
+    def heartbeat(self, user_id: str, enter_keys: List[ContentKey],
+                  leave_keys: List[ContentKey]) -> Dict[ContentKey, int]:
+        return self._call('heartbeat', user_id, list(enter_keys), list(leave_keys))
+
+    def expire(self) -> int:
+        return self._call('expire')
+
+
+class SqlPresenceBackend(PresenceBackend):
+    """realtime_users 테이블을 사용하는 영속 presence 저장소 (선택사항)"""
+
+    def __init__(self, ttl_seconds: int = 60, session_factory=SessionLocal, sweep_batch_size: int = 1000):
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.session_factory = session_factory
+        self.sweep_batch_size = sweep_batch_size
+
+    def _count_query(self, db, content_type: str, content_ids):
+        expire_time = datetime.now() - self.ttl
+        rows = db.query(
+            models.RealtimeUser.content_id,
+            func.count(models.RealtimeUser.id)
+        ).filter(
+            models.RealtimeUser.content_type == content_type,
+            models.RealtimeUser.content_id.in_(content_ids),
+            models.RealtimeUser.entered_at > expire_time  # 만료된 기록은 삭제 대신 조회에서 제외
+        ).group_by(models.RealtimeUser.content_id).all()
+
+        counts = {content_id: 0 for content_id in content_ids}
+        for content_id, count in rows:
+            counts[content_id] = count or 0
+        return counts
+
+    def touch(self, content_type: str, content_id: int, user_id: str,
+              content_name: Optional[str] = None) -> int:
+        with self.session_factory() as db:
+            existing = db.query(models.RealtimeUser).filter(
+                models.RealtimeUser.user_id == user_id,
+                models.RealtimeUser.content_type == content_type,
+                models.RealtimeUser.content_id == content_id
+            ).first()
+
+            if existing:
+                existing.entered_at = datetime.now()
+            else:
+                db.add(models.RealtimeUser(
+                    user_id=user_id,
+                    content_type=content_type,
+                    content_id=content_id,
+                    content_name=content_name  # 참고용
+                ))
+            db.commit()
+
+            return self._count_query(db, content_type, [content_id])[content_id]
+
+    def leave(self, content_type: str, content_id: int, user_id: str) -> int:
+        with self.session_factory() as db:
+            db.query(models.RealtimeUser).filter(
+                models.RealtimeUser.user_id == user_id,
+                models.RealtimeUser.content_type == content_type,
+                models.RealtimeUser.content_id == content_id
+            ).delete()
+            db.commit()
+
+            return self._count_query(db, content_type, [content_id])[content_id]
+
+    def counts(self, content_type: str, content_ids: Iterable[int]) -> Dict[int, int]:
+        content_ids = list(content_ids)
+        if not content_ids:
+            return {}
+        with self.session_factory() as db:
+            return self._count_query(db, content_type, content_ids)
+
+    def heartbeat(self, user_id: str, enter_keys: List[ContentKey],
+                  leave_keys: List[ContentKey]) -> Dict[ContentKey, int]:
+        """_user_content_id_uc 기준 일괄 upsert + 일괄 삭제 + 그룹 집계를 한 트랜잭션으로 처리"""
+        now = datetime.now()
+
+        with self.session_factory() as db:
+            if enter_keys:
+                stmt = pg_insert(models.RealtimeUser).values([
+                    {
+                        "user_id": user_id,
+                        "content_type": content_type,
+                        "content_id": content_id,
+                        "entered_at": now
+                    }
+                    for content_type, content_id in enter_keys
+                ])
+                stmt = stmt.on_conflict_do_update(
+                    constraint='_user_content_id_uc',
+                    set_={"entered_at": stmt.excluded.entered_at}
+                )
+                db.execute(stmt)
+
+            if leave_keys:
+                db.query(models.RealtimeUser).filter(
+                    models.RealtimeUser.user_id == user_id,
+                    tuple_(models.RealtimeUser.content_type, models.RealtimeUser.content_id).in_(
+                        [tuple(key) for key in leave_keys]
+                    )
+                ).delete(synchronize_session=False)
+
+            keys = [tuple(key) for key in list(enter_keys) + list(leave_keys)]
+            rows = db.query(
+                models.RealtimeUser.content_type,
+                models.RealtimeUser.content_id,
+                func.count(models.RealtimeUser.id)
+            ).filter(
+                tuple_(models.RealtimeUser.content_type, models.RealtimeUser.content_id).in_(keys),
+                models.RealtimeUser.entered_at > now - self.ttl
+            ).group_by(
+                models.RealtimeUser.content_type,
+                models.RealtimeUser.content_id
+            ).all()
+
+            db.commit()
+
+        counts = {key: 0 for key in keys}
+        for content_type, content_id, count in rows:
+            counts[(content_type, content_id)] = count
+        return counts
+
+    def expire(self) -> int:
+        """만료된 기록을 sweep_batch_size 단위로 나누어 삭제 (스위퍼 전용)
+
+        각 배치는 idx_entered_at 인덱스로 대상 id를 찾아 삭제하고 바로 커밋하므로
+        한 번에 많은 행을 잠그지 않습니다.
+        """
+        expire_time = datetime.now() - self.ttl
+        total_deleted = 0
+
+        with self.session_factory() as db:
+            while True:
+                expired_ids = db.query(models.RealtimeUser.id).filter(
+                    models.RealtimeUser.entered_at <= expire_time
+                ).order_by(models.RealtimeUser.entered_at).limit(self.sweep_batch_size).subquery()
+
+                deleted = db.query(models.RealtimeUser).filter(
+                    models.RealtimeUser.id.in_(select(expired_ids.c.id))
+                ).delete(synchronize_session=False)
+                db.commit()
+
+                total_deleted += deleted
+                if deleted < self.sweep_batch_size:
+                    break
+
+        return total_deleted
+
+
+def serve_shared_presence(host: str, port: int, authkey: str):
+    """공유 presence 서버 실행 (블로킹)
+
+    연결은 pickle 로 주고받으므로 인증 키가 없으면 실행하지 않습니다.
+    """
+    if not authkey:
+        raise ValueError("PRESENCE_SHARED_AUTHKEY is required to run the shared presence server")
+    backend = MemoryPresenceBackend(ttl_seconds=settings.PRESENCE_TTL_SECONDS)
+    _PresenceManager.register('get_presence', callable=lambda: backend)
+    manager = _PresenceManager(address=(host, port), authkey=authkey.encode())
+    server = manager.get_server()
+    logger.info(f"Shared presence server listening on {host}:{port}")
+    server.serve_forever()
+
+
+def create_presence_backend() -> PresenceBackend:
+    """설정(PRESENCE_BACKEND)에 따라 presence 저장소를 생성합니다."""
+    backend = settings.PRESENCE_BACKEND.lower()
+
+    if backend == 'shared':
+        return SharedPresenceBackend(
+            host=settings.PRESENCE_SHARED_HOST,
+            port=settings.PRESENCE_SHARED_PORT,
+            authkey=settings.PRESENCE_SHARED_AUTHKEY
+        )
+    if backend == 'sql':
+        return SqlPresenceBackend(
+            ttl_seconds=settings.PRESENCE_TTL_SECONDS,
+            sweep_batch_size=settings.PRESENCE_SWEEP_BATCH_SIZE
+        )
+    if backend != 'memory':
+        logger.warning(f"Unknown PRESENCE_BACKEND '{settings.PRESENCE_BACKEND}', falling back to memory")
+
+    return MemoryPresenceBackend(ttl_seconds=settings.PRESENCE_TTL_SECONDS)
+
+
+# 싱글톤 인스턴스
+presence_service = create_presence_backend()
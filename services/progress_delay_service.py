@@ -0,0 +1,82 @@
+# services/progress_delay_service.py
+import logging
+import threading
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from db import models
+from db.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# 자동 지연 처리 변경 이력의 변경자
+DELAY_ACTOR = "시스템(배송예정일 경과)"
+
+
+def mark_overdue_as_delayed(db: Session, today: Optional[date] = None) -> int:
+    """배송 예정일이 지난 진행중(1) 상태를 지연(2)으로 일괄 변경하고 변경된 행 수를 반환합니다. (커밋은 호출한 쪽에서 수행)
+
+    idx_progressstatus_status_shipping (status, expected_shipping_date) 인덱스 범위만 읽으며,
+    변경된 행의 이력은 progressstatus_changelog에 한 번의 INSERT로 추가합니다.
+    """
+    today = today or date.today()
+    updated_ids = db.execute(
+        update(models.Progressstatus)
+        .where(
+            models.Progressstatus.status == '1',
+            models.Progressstatus.expected_shipping_date.isnot(None),
+            models.Progressstatus.expected_shipping_date < today
+        )
+        .values(status='2')
+        .returning(models.Progressstatus.id)
+        .execution_options(synchronize_session=False)
+    ).scalars().all()
+
+    if updated_ids:
+        db.execute(insert(models.ProgressstatusChangelog), [
+            {
+                "progress_id": progress_id,
+                "actor": DELAY_ACTOR,
+                "field": "status",
+                "old_value": "진행중",
+                "new_value": "지연",
+            }
+            for progress_id in updated_ids
+        ])
+    return len(updated_ids)
+
+
+class ProgressDelayService:
+    """진행 상태 지연 처리 작업
+
+    스케줄러가 앱 시작 시와 주기적으로 run()을 호출하지만 실제 변경은 날짜가 바뀐 뒤 처음 한 번만 수행합니다.
+    (목록 조회 시에는 쓰기 작업을 하지 않음) 관리자 요청 시 force=True로 즉시 실행합니다.
+    """
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+        self._lock = threading.Lock()
+        self._last_run_date: Optional[date] = None
+
+    def run(self, force: bool = False) -> int:
+        today = date.today()
+        with self._lock:
+            if not force and self._last_run_date == today:
+                return 0
+
+            with self.session_factory() as db:
+                updated_rows = mark_overdue_as_delayed(db, today)
+                db.commit()
+
+            self._last_run_date = today
+
+        if updated_rows:
+            logger.info(f"Marked {updated_rows} overdue progress statuses as delayed")
+        return updated_rows
+
+
+# 싱글톤 인스턴스
+progress_delay_service = ProgressDelayService()
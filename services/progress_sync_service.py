@@ -0,0 +1,94 @@
+# services/progress_sync_service.py
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from db.database import SessionLocal
+from Manager.progress_status.crud import progress_status as progress_status_crud
+
+logger = logging.getLogger(__name__)
+
+# 상태 조회용으로 보관하는 최근 작업 수
+MAX_KEPT_JOBS = 20
+
+
+class ProgressSyncService:
+    """기존 데이터 -> progress_status 동기화 백그라운드 작업
+
+    start()는 작업을 스레드에서 시작하고 바로 작업 정보를 반환합니다. (요청을 붙잡지 않음)
+    진행 상황(완료 단계, 단계별 생성 수)은 get(job_id)로 조회하며, 동시에 하나의 작업만 실행합니다.
+    작업 정보는 이 프로세스 메모리에만 보관합니다.
+    """
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, Dict]" = OrderedDict()
+
+    def _snapshot(self, job: Dict) -> Dict:
+        return {**job, "created": dict(job["created"])}
+
+    def start(self) -> Dict:
+        """동기화 작업을 시작합니다. 이미 실행 중인 작업이 있으면 그 작업 정보를 반환합니다."""
+        with self._lock:
+            for job in self._jobs.values():
+                if job["status"] in ("pending", "running"):
+                    return self._snapshot(job)
+
+            job = {
+                "job_id": uuid.uuid4().hex,
+                "status": "pending",
+                "current_step": None,
+                "steps_total": len(progress_status_crud.SYNC_STEPS),
+                "steps_done": 0,
+                "created": {},
+                "created_count": 0,
+                "error": None,
+                "started_at": datetime.now(timezone.utc),
+                "finished_at": None,
+            }
+            self._jobs[job["job_id"]] = job
+            while len(self._jobs) > MAX_KEPT_JOBS:
+                self._jobs.popitem(last=False)
+
+        threading.Thread(
+            target=self._run, args=(job["job_id"],), name="progress-sync", daemon=True
+        ).start()
+        return self._snapshot(job)
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return self._snapshot(job) if job else None
+
+    def _update(self, job_id: str, **values):
+        with self._lock:
+            self._jobs[job_id].update(values)
+
+    def _run(self, job_id: str):
+        self._update(job_id, status="running", current_step=progress_status_crud.SYNC_STEPS[0][0])
+
+        def on_step(step: str, created: int):
+            with self._lock:
+                job = self._jobs[job_id]
+                job["created"][step] = created
+                job["created_count"] += created
+                job["steps_done"] += 1
+                steps = progress_status_crud.SYNC_STEPS
+                job["current_step"] = steps[job["steps_done"]][0] if job["steps_done"] < len(steps) else None
+
+        try:
+            with self.session_factory() as db:
+                created_count = progress_status_crud.sync_existing_data(db, on_step=on_step)
+            self._update(job_id, status="completed", finished_at=datetime.now(timezone.utc))
+            logger.info(f"Progress status sync {job_id} created {created_count} rows")
+        except Exception as e:
+            logger.exception(f"Progress status sync {job_id} failed: {e}")
+            self._update(job_id, status="failed", error=str(e), finished_at=datetime.now(timezone.utc))
+
+
+# 싱글톤 인스턴스
+progress_sync_service = ProgressSyncService()
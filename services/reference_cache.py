@@ -0,0 +1,188 @@
+# services/reference_cache.py
+import logging
+import threading
+import time
+from itertools import chain
+from types import SimpleNamespace
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from db import models
+
+logger = logging.getLogger(__name__)
+
+# 캐시 대상 참조 테이블 (테이블 이름 -> 모델)
+REFERENCE_MODELS = {
+    'images': models.Image,
+    'colors': models.Color,
+    'brands': models.Brand,
+    'countries': models.Country,
+}
+
+_DIRTY_TABLES_KEY = 'reference_cache_dirty_tables'
+
+
+def _to_id(value) -> Optional[int]:
+    """디자인 테이블의 문자열 id("12")와 정수 id를 모두 정수로 변환 (변환할 수 없으면 None)"""
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+class _TableCache:
+    def __init__(self):
+        self.version = 0
+        self.rows: Optional[Dict[int, SimpleNamespace]] = None
+        self.loaded_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+
+
+class ReferenceCache:
+    """참조 테이블(images, colors, brands, countries) 프로세스 내 read-through 캐시
+
+    - 테이블별로 전체 행을 한 번 읽어 id로 조회합니다. (행은 ORM 객체가 아닌 컬럼 값 스냅샷)
+    - 커밋된 변경(ORM flush, query.update/delete)은 세션 이벤트로 감지해 해당 테이블의 버전을 올리고 비웁니다.
+      로드 중 버전이 바뀌면 읽은 결과는 저장하지 않습니다.
+    - 다른 워커에서의 수정/삭제는 ttl_seconds 이내에 반영되며, 스냅샷에 없는 id는 DB에서 직접 조회합니다.
+    """
+
+    def __init__(self, ttl_seconds: int = 300):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._tables: Dict[str, _TableCache] = {name: _TableCache() for name in REFERENCE_MODELS}
+
+    def _snapshot(self, db: Session, table_name: str) -> Dict[int, SimpleNamespace]:
+        state = self._tables[table_name]
+        with self._lock:
+            rows = state.rows
+            if rows is not None and (
+                    self.ttl_seconds <= 0 or time.monotonic() - state.loaded_at < self.ttl_seconds):
+                state.hits += 1
+                return rows
+            state.misses += 1
+            version = state.version
+
+        rows = self._fetch(db, table_name)
+
+        with self._lock:
+            state.loads += 1
+            if state.version == version:
+                state.rows = rows
+                state.loaded_at = time.monotonic()
+        return rows
+
+    @staticmethod
+    def _fetch(db: Session, table_name: str, ids: Optional[Iterable[int]] = None) -> Dict[int, SimpleNamespace]:
+        table = REFERENCE_MODELS[table_name].__table__
+        query = select(table)
+        if ids is not None:
+            query = query.where(table.c.id.in_(list(ids)))
+        return {row.id: SimpleNamespace(**row._asdict()) for row in db.execute(query)}
+
+    def get_many(self, db: Session, table_name: str, ids: Iterable) -> Dict[int, SimpleNamespace]:
+        """id 목록의 행을 {id: 행} 으로 반환 (없는 id는 제외)"""
+        wanted = {_to_id(value) for value in ids} - {None}
+        if not wanted:
+            return {}
+
+        rows = self._snapshot(db, table_name)
+        found = {row_id: rows[row_id] for row_id in wanted if row_id in rows}
+
+        # 다른 워커에서 새로 추가된 행일 수 있으므로 스냅샷에 없는 id는 DB에서 확인
+        missing = wanted - found.keys()
+        if missing:
+            found.update(self._fetch(db, table_name, missing))
+        return found
+
+    def get(self, db: Session, table_name: str, row_id) -> Optional[SimpleNamespace]:
+        row_id = _to_id(row_id)
+        if row_id is None:
+            return None
+        return self.get_many(db, table_name, [row_id]).get(row_id)
+
+    def image(self, db: Session, image_id) -> Optional[SimpleNamespace]:
+        return self.get(db, 'images', image_id)
+
+    def color(self, db: Session, color_id) -> Optional[SimpleNamespace]:
+        return self.get(db, 'colors', color_id)
+
+    def brand(self, db: Session, brand_id) -> Optional[SimpleNamespace]:
+        return self.get(db, 'brands', brand_id)
+
+    def country(self, db: Session, country_id) -> Optional[SimpleNamespace]:
+        return self.get(db, 'countries', country_id)
+
+    def invalidate(self, *table_names: str):
+        """테이블 버전을 올리고 캐시를 비웁니다. (이름을 생략하면 전체)"""
+        with self._lock:
+            for table_name in table_names or REFERENCE_MODELS:
+                state = self._tables.get(table_name)
+                if state is not None:
+                    state.version += 1
+                    state.rows = None
+
+    def stats(self) -> Dict[str, dict]:
+        """테이블별 버전, 캐시 행 수, hit/miss/load 횟수"""
+        with self._lock:
+            return {
+                table_name: {
+                    "version": state.version,
+                    "size": len(state.rows) if state.rows is not None else 0,
+                    "hits": state.hits,
+                    "misses": state.misses,
+                    "loads": state.loads,
+                }
+                for table_name, state in self._tables.items()
+            }
+
+
+reference_cache = ReferenceCache(ttl_seconds=settings.REFERENCE_CACHE_TTL_SECONDS)
+
+
+# --- 커밋 시 캐시 무효화 (세션 이벤트) ---
+
+def _reference_tables_of(mappers) -> set:
+    return {
+        mapper.local_table.name for mapper in mappers
+        if mapper is not None and mapper.local_table.name in REFERENCE_MODELS
+    }
+
+
+@event.listens_for(Session, 'after_flush')
+def _collect_flushed_tables(session, flush_context):
+    objects = chain(session.new, session.dirty, session.deleted)
+    tables = _reference_tables_of({getattr(obj, '__mapper__', None) for obj in objects})
+    if tables:
+        session.info.setdefault(_DIRTY_TABLES_KEY, set()).update(tables)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _collect_bulk_tables(orm_execute_state):
+    # query(...).update()/delete() 처럼 flush를 거치지 않는 일괄 변경
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        tables = _reference_tables_of(orm_execute_state.all_mappers)
+        if tables:
+            orm_execute_state.session.info.setdefault(_DIRTY_TABLES_KEY, set()).update(tables)
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_committed_tables(session):
+    tables = session.info.pop(_DIRTY_TABLES_KEY, None)
+    if tables:
+        reference_cache.invalidate(*tables)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _invalidate_rolled_back_tables(session):
+    # 롤백 전 같은 세션에서 커밋되지 않은 값을 읽어 캐시했을 수 있으므로 함께 비웁니다.
+    tables = session.info.pop(_DIRTY_TABLES_KEY, None)
+    if tables:
+        reference_cache.invalidate(*tables)
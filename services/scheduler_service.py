@@ -0,0 +1,81 @@
+# services/scheduler_service.py
+import asyncio
+import logging
+from typing import Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob:
+    """일정 간격으로 실행되는 백그라운드 작업"""
+
+    def __init__(self, name: str, interval_seconds: float, func: Callable[[], object],
+                 run_on_shutdown: bool = False, run_on_start: bool = False):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.func = func
+        self.run_on_shutdown = run_on_shutdown
+        self.run_on_start = run_on_start
+        self.task = None
+
+    async def run_once(self):
+        """작업을 한 번 실행합니다. (DB 작업이 이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        try:
+            return await asyncio.to_thread(self.func)
+        except Exception as e:
+            logger.exception(f"Scheduled job '{self.name}' failed: {e}")
+            return None
+
+    async def loop(self):
+        if self.run_on_start:
+            await self.run_once()
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.run_once()
+
+
+class SchedulerService:
+    """앱 프로세스 내 주기 작업 스케줄러
+
+    main.py의 startup/shutdown 이벤트에서 start()/stop()을 호출합니다.
+    interval_seconds가 0 이하인 작업은 등록만 되고 자동 실행되지 않습니다.
+    run_on_start=True인 작업은 첫 주기를 기다리지 않고 시작 시 바로 한 번 실행됩니다.
+    run_on_shutdown=True인 작업은 종료 시 한 번 더 실행됩니다. (버퍼 flush 등)
+    """
+
+    def __init__(self):
+        self._jobs: Dict[str, PeriodicJob] = {}
+
+    def add_job(self, name: str, interval_seconds: float, func: Callable[[], object],
+                run_on_shutdown: bool = False, run_on_start: bool = False) -> PeriodicJob:
+        """주기 작업 등록 (같은 이름이면 교체)"""
+        job = PeriodicJob(name, interval_seconds, func, run_on_shutdown, run_on_start)
+        self._jobs[name] = job
+        return job
+
+    def get_job_names(self) -> List[str]:
+        return list(self._jobs.keys())
+
+    async def start(self):
+        for job in self._jobs.values():
+            if job.interval_seconds > 0 and job.task is None:
+                job.task = asyncio.create_task(job.loop())
+                logger.info(f"Scheduled job '{job.name}' started (every {job.interval_seconds}s)")
+
+    async def stop(self):
+        for job in self._jobs.values():
+            if job.task is not None:
+                job.task.cancel()
+                try:
+                    await job.task
+                except asyncio.CancelledError:
+                    pass
+                job.task = None
+
+        for job in self._jobs.values():
+            if job.run_on_shutdown:
+                await job.run_once()
+
+
+# 싱글톤 인스턴스
+scheduler_service = SchedulerService()
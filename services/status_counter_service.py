@@ -0,0 +1,156 @@
+# services/status_counter_service.py
+import logging
+import threading
+from datetime import date
+from typing import Dict, Optional
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from db import models
+from db.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# 카운터 종류 -> 상태 컬럼을 가진 모델 (migrations/create_status_counters.sql 의 트리거 인자와 같아야 함)
+STATUS_COUNTER_SOURCES = {
+    'custom_design': models.CustomDesign,
+    'progress_status': models.Progressstatus,
+}
+
+
+# 카운터를 증감하는 트리거 (migrations/create_status_counters.sql)
+STATUS_COUNTER_TRIGGERS = (
+    'trg_custom_designs_status_insert',
+    'trg_custom_designs_status_update',
+    'trg_custom_designs_status_delete',
+    'trg_progressstatus_status_insert',
+    'trg_progressstatus_status_update',
+    'trg_progressstatus_status_delete',
+)
+
+# 트리거 설치 여부 (프로세스당 한 번 확인, 보정 작업 시 다시 확인)
+_triggers_installed: Optional[bool] = None
+
+
+def counter_triggers_installed(db: Session, refresh: bool = False) -> bool:
+    """카운터 트리거가 모두 설치되어 있는지 확인합니다. (postgres 외에는 항상 False)
+
+    create_all 은 status_counters 테이블만 만들고 트리거는 만들지 않으므로,
+    트리거가 없으면 카운터는 증감되지 않아 읽거나 채우면 안 됩니다.
+    """
+    global _triggers_installed
+    if _triggers_installed is None or refresh:
+        if db.get_bind().dialect.name != 'postgresql':
+            _triggers_installed = False
+        else:
+            installed = db.execute(
+                text(
+                    "SELECT count(DISTINCT tgname) FROM pg_trigger "
+                    "WHERE tgname = ANY(:names) AND NOT tgisinternal AND tgenabled <> 'D'"
+                ),
+                {"names": list(STATUS_COUNTER_TRIGGERS)}
+            ).scalar()
+            _triggers_installed = installed == len(STATUS_COUNTER_TRIGGERS)
+    return _triggers_installed
+
+
+def count_statuses(db: Session, kind: str) -> Dict[str, int]:
+    """원본 테이블을 GROUP BY 해서 {상태: 행 수} 를 반환합니다. (NULL 상태는 '')"""
+    model = STATUS_COUNTER_SOURCES[kind]
+    status = func.coalesce(model.status, '')
+    return {row_status: count for row_status, count in db.query(status, func.count()).group_by(status)}
+
+
+def get_status_counts(db: Session, kind: str) -> Dict[str, int]:
+    """status_counters 에서 {상태: 행 수} 를 읽습니다.
+
+    트리거가 설치되지 않았거나 카운터가 아직 비어 있으면 원본 테이블을 GROUP BY 합니다.
+    """
+    if not counter_triggers_installed(db):
+        return count_statuses(db, kind)
+
+    rows = db.query(models.StatusCounter.status, models.StatusCounter.count).filter(
+        models.StatusCounter.kind == kind
+    ).all()
+    if not rows:
+        return count_statuses(db, kind)
+    return {row.status: row.count for row in rows}
+
+
+def reconcile_status_counters(db: Session) -> Optional[Dict[str, Dict[str, int]]]:
+    """status_counters 를 원본 테이블의 GROUP BY 결과로 덮어쓰고 {kind: {상태: 오차}} 를 반환합니다. (커밋은 호출한 쪽에서 수행)
+
+    트리거가 설치되지 않았으면 채운 값이 곧 틀려지므로 아무것도 하지 않고 None 을 반환합니다.
+
+    postgres 에서는 카운터 테이블을 EXCLUSIVE 로 잠가 집계 중 트리거 증감이 끼어들지 않게 합니다.
+    (진행 중인 쓰기는 잠금을 기다렸다가 보정 후 증감을 반영)
+    """
+    if not counter_triggers_installed(db, refresh=True):
+        return None
+
+    db.execute(text("LOCK TABLE status_counters IN EXCLUSIVE MODE"))
+
+    drift = {}
+    for kind in STATUS_COUNTER_SOURCES:
+        stored = dict(db.query(models.StatusCounter.status, models.StatusCounter.count).filter(
+            models.StatusCounter.kind == kind
+        ).all())
+        actual = count_statuses(db, kind)
+
+        # 카운터가 비어 있으면 처음 만드는 것이므로 오차로 보지 않음
+        kind_drift = {
+            status: actual.get(status, 0) - stored.get(status, 0)
+            for status in stored.keys() | actual.keys()
+            if actual.get(status, 0) != stored.get(status, 0)
+        } if stored else {}
+        if kind_drift:
+            drift[kind] = kind_drift
+
+        db.query(models.StatusCounter).filter(
+            models.StatusCounter.kind == kind
+        ).delete(synchronize_session=False)
+        db.add_all([
+            models.StatusCounter(kind=kind, status=status, count=count)
+            for status, count in actual.items()
+        ])
+    return drift
+
+
+class StatusCounterService:
+    """상태별 카운터 보정 작업
+
+    카운터는 DB 트리거가 증감하며, 이 작업은 스케줄러가 주기적으로 run()을 호출하면
+    날짜가 바뀐 뒤 처음 한 번만 GROUP BY 결과로 맞춥니다. 관리자 요청 시 force=True로 즉시 실행합니다.
+    """
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+        self._lock = threading.Lock()
+        self._last_run_date: Optional[date] = None
+
+    def run(self, force: bool = False) -> Optional[Dict[str, Dict[str, int]]]:
+        """보정된 오차를 반환합니다. (트리거가 설치되지 않았으면 None)"""
+        today = date.today()
+        with self._lock:
+            if not force and self._last_run_date == today:
+                return {}
+
+            with self.session_factory() as db:
+                drift = reconcile_status_counters(db)
+                db.commit()
+
+            self._last_run_date = today
+
+        if drift is None:
+            logger.warning(
+                "Status counter triggers are not installed, dashboard counts use GROUP BY "
+                "(run migrations/create_status_counters.sql)"
+            )
+        elif drift:
+            logger.warning(f"Status counters drifted and were corrected: {drift}")
+        return drift
+
+
+# 싱글톤 인스턴스
+status_counter_service = StatusCounterService()
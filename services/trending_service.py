@@ -0,0 +1,131 @@
+# services/trending_service.py
+import math
+from datetime import date
+from typing import Dict, List, Tuple
+
+from sqlalchemy import and_, exists, func, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Query, Session
+
+from core.config import settings
+from core.pagination import SortKey
+from db import models
+
+# 점수 기준일. 모든 점수는 이 날짜 기준 가중치로 저장합니다.
+TRENDING_EPOCH = date(2025, 1, 1)
+
+
+def _decay_rate() -> float:
+    """일 단위 감쇠율 (반감기 TRENDING_HALF_LIFE_DAYS일)"""
+    return math.log(2) / settings.TRENDING_HALF_LIFE_DAYS
+
+
+def trending_log_weight(view_date: date) -> float:
+    """view_date의 조회 1회가 점수에 더하는 값의 자연로그
+
+    현재 시점의 감쇠 점수는 Σ views * exp(-λ * (today - view_date)) 이고,
+    이는 Σ views * exp(λ * (view_date - epoch)) 에 모든 컨텐츠 공통인
+    exp(-λ * (today - epoch)) 를 곱한 값입니다. 따라서 후자만 저장하면
+    기존 점수를 매일 다시 계산하지 않아도 정렬 순서가 감쇠 점수와 같습니다.
+    후자는 기준일에서 멀어질수록 exp 가 float 범위를 넘으므로 로그 값으로 저장합니다. (정렬 순서 동일)
+    """
+    return _decay_rate() * (view_date - TRENDING_EPOCH).days
+
+
+def log_add(a: float, b: float) -> float:
+    """ln(exp(a) + exp(b)) (exp 를 직접 계산하지 않아 overflow 없음)"""
+    high, low = max(a, b), min(a, b)
+    return high + math.log1p(math.exp(low - high))
+
+
+def trending_query_parts(
+        query: Query,
+        content_type: str,
+        model,
+        name_column
+) -> List[Tuple[Query, List[SortKey]]]:
+    """트렌딩순 목록을 core.pagination 의 *_chained 로 조회할 쿼리 목록
+
+    점수가 있는 항목을 trending_scores 기준으로 inner join 해 점수 내림차순으로 먼저 반환하고
+    (idx_trending_type_score 사용), 점수가 없는 항목은 그 뒤에 디자인명 오름차순으로 이어 붙입니다.
+    """
+    tracked_condition = and_(
+        models.TrendingScore.content_type == content_type,
+        models.TrendingScore.content_id == model.id
+    )
+    tracked = query.join(models.TrendingScore, tracked_condition)
+    untracked = query.filter(~exists().where(tracked_condition))
+    return [
+        (tracked, [(models.TrendingScore.score, True), (name_column, False), (model.id, False)]),
+        (untracked, [(name_column, False), (model.id, False)]),
+    ]
+
+
+def add_trending_scores(db: Session, views: Dict[Tuple[str, int, date], int]):
+    """조회수를 트렌딩 점수(로그 값)에 증분 반영 (단일 upsert, 커밋은 호출한 쪽에서 수행)"""
+    scores: Dict[Tuple[str, int], float] = {}
+    for (content_type, content_id, view_date), count in views.items():
+        if count > 0:
+            log_score = math.log(count) + trending_log_weight(view_date)
+            key = (content_type, content_id)
+            scores[key] = log_add(scores[key], log_score) if key in scores else log_score
+
+    if not scores:
+        return
+
+    stmt = pg_insert(models.TrendingScore).values([
+        {"content_type": content_type, "content_id": content_id, "score": score}
+        for (content_type, content_id), score in scores.items()
+    ])
+    # ln(exp(기존) + exp(추가)) = greatest + ln(1 + exp(-|기존 - 추가|))
+    current, added = models.TrendingScore.score, stmt.excluded.score
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['content_type', 'content_id'],
+        set_={
+            "score": func.greatest(current, added) + func.ln(1 + func.exp(-func.abs(current - added))),
+            "updated_at": func.now()
+        }
+    )
+    db.execute(stmt)
+
+
+def rebuild_trending_scores(db: Session) -> int:
+    """daily_views 전체로 트렌딩 점수(로그 값)를 다시 계산합니다. (초기 구축 / 반감기 변경 시)"""
+    days = models.DailyView.view_date - literal_column(f"DATE '{TRENDING_EPOCH.isoformat()}'")
+    weighted = db.query(
+        models.DailyView.content_type,
+        models.DailyView.content_id,
+        models.DailyView.view_count,
+        (func.ln(models.DailyView.view_count) + _decay_rate() * days).label('log_weight')
+    ).filter(models.DailyView.view_count > 0).subquery()
+
+    # ln(Σ exp(w)) = max(w) + ln(Σ exp(w - max(w)))
+    max_weight = func.max(weighted.c.log_weight).over(
+        partition_by=[weighted.c.content_type, weighted.c.content_id]
+    )
+    shifted = db.query(
+        weighted.c.content_type,
+        weighted.c.content_id,
+        weighted.c.log_weight,
+        max_weight.label('max_weight')
+    ).subquery()
+
+    select_stmt = db.query(
+        shifted.c.content_type,
+        shifted.c.content_id,
+        func.max(shifted.c.max_weight) + func.ln(func.sum(func.exp(shifted.c.log_weight - shifted.c.max_weight)))
+    ).group_by(
+        shifted.c.content_type,
+        shifted.c.content_id
+    ).statement
+
+    stmt = pg_insert(models.TrendingScore).from_select(
+        ['content_type', 'content_id', 'score'], select_stmt
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['content_type', 'content_id'],
+        set_={"score": stmt.excluded.score, "updated_at": func.now()}
+    )
+    result = db.execute(stmt)
+    db.commit()
+    return result.rowcount
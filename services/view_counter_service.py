@@ -0,0 +1,129 @@
+# services/view_counter_service.py
+import logging
+import threading
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Tuple
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from db import models
+from db.database import SessionLocal
+from services.leaderboard_service import leaderboard_service
+from services.trending_service import add_trending_scores
+
+logger = logging.getLogger(__name__)
+
+ViewKey = Tuple[str, int, date]  # (content_type, content_id, view_date)
+
+# content_type별 조회수(views) 컬럼을 가진 모델
+VIEW_CONTENT_MODELS = {
+    'portfolio': models.Portfolio,
+    'released_product': models.Releasedproduct,
+}
+
+
+def record_views(db: Session, views: Dict[ViewKey, int]):
+    """조회수 일괄 기록 (Enduser/Manager 공용, 커밋은 호출한 쪽에서 수행)
+
+    - 컨텐츠 테이블: UPDATE ... SET views = views + n (컨텐츠 종류별 executemany 1회)
+    - daily_views: INSERT ... ON CONFLICT (_daily_view_uc)
+      DO UPDATE SET view_count = daily_views.view_count + EXCLUDED.view_count (1회)
+    - trending_scores: 감쇠 가중치를 적용한 점수 증분 upsert (1회)
+
+    select 후 insert 방식과 달리 왕복이 한 번이고, 같은 날 첫 조회가 동시에 들어와도
+    _daily_view_uc 위반이 발생하지 않습니다.
+    """
+    views = {key: count for key, count in views.items() if count}
+    if not views:
+        return
+
+    # 1. 컨텐츠별 누적 조회수 (날짜와 무관하게 합산)
+    totals: Dict[Tuple[str, int], int] = defaultdict(int)
+    for (content_type, content_id, _), count in views.items():
+        totals[(content_type, content_id)] += count
+
+    for content_type, model in VIEW_CONTENT_MODELS.items():
+        params = [
+            {"_content_id": content_id, "_count": count}
+            for (ct, content_id), count in totals.items() if ct == content_type
+        ]
+        if params:
+            table = model.__table__
+            db.connection().execute(
+                update(table)
+                .where(table.c.id == bindparam("_content_id"))
+                .values(views=table.c.views + bindparam("_count")),
+                params
+            )
+
+    # 2. 일별 조회수 upsert
+    stmt = pg_insert(models.DailyView).values([
+        {
+            "view_date": view_date,
+            "content_type": content_type,
+            "content_id": content_id,
+            "view_count": count
+        }
+        for (content_type, content_id, view_date), count in views.items()
+    ])
+    stmt = stmt.on_conflict_do_update(
+        constraint='_daily_view_uc',
+        set_={"view_count": models.DailyView.view_count + stmt.excluded.view_count}
+    )
+    db.execute(stmt)
+
+    # 3. 트렌딩 점수 증분 반영
+    add_trending_scores(db, views)
+
+
+class ViewCounterService:
+    """상세 조회수 write-behind 버퍼
+
+    상세 조회 시에는 메모리의 (content_type, content_id, date) 카운터만 올리고,
+    스케줄러가 주기적으로(및 종료 시) 모아서 record_views()로 DB에 반영합니다.
+    """
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+        self._lock = threading.Lock()
+        self._pending: Dict[ViewKey, int] = defaultdict(int)
+
+    def record(self, content_type: str, content_id: int, count: int = 1):
+        """조회수 기록 (DB 접근 없음)"""
+        with self._lock:
+            self._pending[(content_type, content_id, date.today())] += count
+
+    def flush(self) -> int:
+        """버퍼의 조회수를 DB에 반영하고 반영한 조회수 합계를 반환합니다.
+
+        실패하면 버퍼에 되돌려 다음 주기에 다시 시도합니다.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(int)
+
+        if not pending:
+            return 0
+
+        # 커밋과 랭킹 증분 반영 사이에 랭킹 재구성이 끼어들지 않도록 함께 묶음
+        with leaderboard_service.committing():
+            try:
+                with self.session_factory() as db:
+                    record_views(db, pending)
+                    db.commit()
+            except Exception:
+                with self._lock:
+                    for key, count in pending.items():
+                        self._pending[key] += count
+                raise
+
+            # 커밋된 조회수를 랭킹에 증분 반영
+            leaderboard_service.apply(pending)
+
+        return sum(pending.values())
+
+
+# 싱글톤 인스턴스
+view_counter_service = ViewCounterService()
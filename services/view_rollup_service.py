@@ -0,0 +1,149 @@
+# services/view_rollup_service.py
+import logging
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import Date, cast, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from db import models
+from db.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_NAME = 'daily_views'
+
+# 자정 직후 flush 되는 전날 조회수(view_counter_service 버퍼)를 기다리는 시간
+ROLLUP_GRACE = timedelta(minutes=10)
+
+# 집계 단위별 (모델, 기간 시작일 컬럼, unique constraint)
+ROLLUP_LEVELS = {
+    'week': (models.WeeklyView, 'week_start', '_weekly_view_uc'),
+    'month': (models.MonthlyView, 'month_start', '_monthly_view_uc'),
+}
+
+Period = Tuple[str, date]  # (level: 'day' | 'week' | 'month', 기간 시작일)
+
+
+def week_start(d: date) -> date:
+    return d - timedelta(days=d.weekday())
+
+
+def month_start(d: date) -> date:
+    return d.replace(day=1)
+
+
+def next_month(d: date) -> date:
+    return (d.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def plan_periods(start: date, end: date, rolled_through: Optional[date]) -> List[Period]:
+    """[start, end] 구간을 겹치지 않는 월/주/일 단위 기간으로 나눕니다.
+
+    rolled_through 까지의 날짜는 가능한 큰 단위(월 > 주)로, 나머지 날짜와
+    아직 집계되지 않은 날짜는 일 단위(daily_views)로 읽습니다.
+    """
+    periods: List[Period] = []
+    limit = min(end, rolled_through) if rolled_through else None
+    cur = start
+    while cur <= end:
+        if limit and cur <= limit:
+            following = next_month(cur)
+            if cur.day == 1 and following - timedelta(days=1) <= limit:
+                periods.append(('month', cur))
+                cur = following
+                continue
+
+            # 다음 달 전체를 월 단위로 읽을 수 있으면 달 경계를 넘는 주는 쓰지 않음
+            crosses_month = cur + timedelta(days=6) >= following
+            if cur.weekday() == 0 and cur + timedelta(days=6) <= limit and not (
+                    crosses_month and next_month(following) - timedelta(days=1) <= limit):
+                periods.append(('week', cur))
+                cur += timedelta(days=7)
+                continue
+
+        periods.append(('day', cur))
+        cur += timedelta(days=1)
+
+    return periods
+
+
+class ViewRollupService:
+    """daily_views -> weekly_views / monthly_views 증분 집계
+
+    끝난 날짜만 집계하며 view_rollup_state.rolled_through 이후 날짜만 처리합니다.
+    상태 행을 FOR UPDATE 로 잠그므로 여러 워커에서 동시에 실행해도 중복 집계되지 않습니다.
+    """
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+
+    def get_rolled_through(self, db: Session) -> Optional[date]:
+        state = db.query(models.ViewRollupState).filter(
+            models.ViewRollupState.name == ROLLUP_NAME
+        ).first()
+        return state.rolled_through if state else None
+
+    def _lock_state(self, db: Session) -> Optional[models.ViewRollupState]:
+        """상태 행을 잠그고 반환 (처음 실행이면 daily_views 최초 날짜 전날로 생성)"""
+        first_date = db.query(func.min(models.DailyView.view_date)).scalar()
+        if first_date is None:
+            return None
+
+        db.execute(
+            pg_insert(models.ViewRollupState).values(
+                name=ROLLUP_NAME, rolled_through=first_date - timedelta(days=1)
+            ).on_conflict_do_nothing(index_elements=['name'])
+        )
+        return db.query(models.ViewRollupState).filter(
+            models.ViewRollupState.name == ROLLUP_NAME
+        ).with_for_update().one()
+
+    def run(self) -> int:
+        """아직 집계되지 않은 끝난 날짜를 주간/월간 테이블에 반영하고 처리한 일수를 반환합니다."""
+        last_complete_day = (datetime.now() - ROLLUP_GRACE).date() - timedelta(days=1)
+
+        with self.session_factory() as db:
+            state = self._lock_state(db)
+            if state is None or state.rolled_through >= last_complete_day:
+                db.rollback()
+                return 0
+
+            first_day = state.rolled_through + timedelta(days=1)
+
+            for level, (model, period_column, constraint) in ROLLUP_LEVELS.items():
+                period = cast(func.date_trunc(level, models.DailyView.view_date), Date)
+                select_stmt = db.query(
+                    period,
+                    models.DailyView.content_type,
+                    models.DailyView.content_id,
+                    func.sum(models.DailyView.view_count)
+                ).filter(
+                    models.DailyView.view_date >= first_day,
+                    models.DailyView.view_date <= last_complete_day
+                ).group_by(
+                    period,
+                    models.DailyView.content_type,
+                    models.DailyView.content_id
+                ).statement
+
+                stmt = pg_insert(model).from_select(
+                    [period_column, 'content_type', 'content_id', 'view_count'], select_stmt
+                )
+                stmt = stmt.on_conflict_do_update(
+                    constraint=constraint,
+                    set_={"view_count": model.view_count + stmt.excluded.view_count}
+                )
+                db.execute(stmt)
+
+            state.rolled_through = last_complete_day
+            db.commit()
+
+        days = (last_complete_day - first_day).days + 1
+        logger.info(f"View rollup: {first_day} ~ {last_complete_day} ({days} days)")
+        return days
+
+
+# 싱글톤 인스턴스
+view_rollup_service = ViewRollupService()
@@ -0,0 +1,57 @@
+# tests/conftest.py
+import os
+import sys
+from pathlib import Path
+
+# 앱 설정(core/config.py)이 요구하는 환경 변수 (테스트는 sqlite 메모리 DB 사용)
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "5")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_DAYS", "1")
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from db.database import Base
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def count_queries(db):
+    """블록 안에서 실행된 SQL 문 수를 세는 context manager 를 반환합니다."""
+    class _Counter:
+        def __init__(self):
+            self.statements = []
+
+        def _record(self, conn, cursor, statement, parameters, context, executemany):
+            self.statements.append(statement)
+
+        def __enter__(self):
+            self.statements = []
+            event.listen(db.get_bind(), "before_cursor_execute", self._record)
+            return self
+
+        def __exit__(self, *exc):
+            event.remove(db.get_bind(), "before_cursor_execute", self._record)
+
+        @property
+        def count(self):
+            return len(self.statements)
+
+    return _Counter()
@@ -0,0 +1,55 @@
+# tests/test_cart_query_count.py
+from db import models
+from Enduser.crud import cart as cart_crud
+
+USERNAME = "cart_tester"
+
+
+def _seed_cart(db, custom_designs: int, portfolios: int):
+    user = models.AdminUser(permission="user", username=USERNAME, hashed_password="x",
+                            company_name="test", account_code="C001")
+    owner = models.AdminUser(permission="admin", username="portfolio_owner", hashed_password="x",
+                             company_name="test", account_code="P001")
+    db.add_all([user, owner])
+    db.flush()
+
+    for i in range(custom_designs):
+        design = models.CustomDesign(user_id=USERNAME, item_name=f"design-{i}", status="3",
+                                     thumbnail_url=f"http://example.com/design-{i}.jpg")
+        db.add(design)
+        db.flush()
+        db.add(models.Cart(user_id=USERNAME, item_name=design.item_name, category="커스텀디자인"))
+
+    for i in range(portfolios):
+        portfolio = models.Portfolio(user_id=owner.id, design_name=f"portfolio-{i}", is_fixed_axis="N",
+                                     main_image_url=f"http://example.com/portfolio-{i}.jpg",
+                                     thumbnail_url=f"http://example.com/portfolio-{i}-thumb.jpg")
+        db.add(portfolio)
+        db.flush()
+        db.add(models.Cart(user_id=USERNAME, item_name=portfolio.design_name, category="포트폴리오"))
+    db.commit()
+
+
+def test_get_cart_items_query_count_does_not_grow_with_items(db, count_queries):
+    _seed_cart(db, custom_designs=15, portfolios=15)
+
+    with count_queries as counter:
+        items = cart_crud.get_cart_items(db, USERNAME)
+
+    assert len(items) == 30
+    # 장바구니 1 + 사용자 1 + 커스텀디자인 1 + 포트폴리오(작성자 join) 1
+    assert counter.count <= 4, counter.statements
+
+
+def test_get_cart_items_resolves_both_categories(db, count_queries):
+    _seed_cart(db, custom_designs=2, portfolios=2)
+
+    with count_queries as counter:
+        items = cart_crud.get_cart_items(db, USERNAME)
+
+    assert counter.count <= 4, counter.statements
+    by_name = {item["item_name"]: item for item in items}
+    assert by_name["design-0"]["account_code"] == "C001"
+    assert by_name["design-0"]["thumbnail_url"] == "http://example.com/design-0.jpg"
+    assert by_name["portfolio-1"]["account_code"] == "P001"
+    assert by_name["portfolio-1"]["thumbnail_url"] == "http://example.com/portfolio-1-thumb.jpg"
@@ -0,0 +1,65 @@
+# tests/test_leaderboard_consistency.py
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date
+
+from services import view_counter_service as view_counter_module
+from services.leaderboard_service import DailyLeaderboard, LeaderboardService
+from services.view_counter_service import ViewCounterService
+
+
+class _FakeSession:
+    def commit(self):
+        pass
+
+
+@contextmanager
+def _fake_session_factory():
+    yield _FakeSession()
+
+
+def test_flush_and_rebuild_do_not_lose_or_double_count(monkeypatch):
+    """조회수 커밋/apply 와 rebuild 가 동시에 실행되어도 랭킹이 DB 값과 같아야 함"""
+    today = date.today()
+    store = {}  # daily_views 대신 사용하는 content_id -> view_count
+
+    def fake_record_views(db, views):
+        snapshot = dict(store)
+        time.sleep(0.002)  # 커밋 전후로 rebuild 가 끼어들 틈
+        for (content_type, content_id, view_date), count in views.items():
+            snapshot[content_id] = snapshot.get(content_id, 0) + count
+        store.clear()
+        store.update(snapshot)
+
+    leaderboard = LeaderboardService(capacity=5, session_factory=_fake_session_factory)
+
+    def fake_load(content_type, view_date):
+        counts = dict(store)
+        time.sleep(0.002)  # 조회 후 교체 전에 커밋/apply 가 끼어들 틈
+        return DailyLeaderboard(leaderboard.capacity, counts)
+
+    monkeypatch.setattr(leaderboard, "_load", fake_load)
+    monkeypatch.setattr(view_counter_module, "leaderboard_service", leaderboard)
+    monkeypatch.setattr(view_counter_module, "record_views", fake_record_views)
+
+    counter = ViewCounterService(session_factory=_fake_session_factory)
+    leaderboard.rebuild(("portfolio",), today)
+
+    def flush_loop():
+        for i in range(50):
+            counter.record("portfolio", i % 7, 1)
+            counter.flush()
+
+    def rebuild_loop():
+        for _ in range(50):
+            leaderboard.rebuild(("portfolio",), today)
+
+    threads = [threading.Thread(target=flush_loop), threading.Thread(target=rebuild_loop)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(store.values()) == 50
+    assert leaderboard._boards[("portfolio", today)].counts == store
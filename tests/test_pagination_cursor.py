@@ -0,0 +1,84 @@
+# tests/test_pagination_cursor.py
+import base64
+import json
+from datetime import datetime
+
+import pytest
+
+from core.pagination import decode_keyset_cursor, encode_cursor, order_by_keys, paginate_keyset
+from db import models
+
+POPULARITY_KEYS = [
+    (models.Portfolio.views, True),
+    (models.Portfolio.design_name, False),
+    (models.Portfolio.id, True),
+]
+
+
+def _raw_cursor(values) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def test_round_trip():
+    assert decode_keyset_cursor(encode_cursor([5, "abc", 3]), POPULARITY_KEYS) == [5, "abc", 3]
+
+    created_at = datetime(2025, 1, 2, 3, 4, 5)
+    keys = [(models.Portfolio.created_at, True), (models.Portfolio.id, True)]
+    assert decode_keyset_cursor(encode_cursor([created_at, 7]), keys) == [created_at, 7]
+
+
+@pytest.mark.parametrize("values", [
+    ["5", "abc", 3],      # views 에 문자열
+    [5, 1, 3],            # design_name 에 숫자
+    [5, "abc", True],     # id 에 bool
+    [5, "abc", 1.5],      # id 에 실수
+    [5, "abc"],           # 키 개수 불일치
+])
+def test_rejects_mismatched_values(values):
+    with pytest.raises(ValueError):
+        decode_keyset_cursor(_raw_cursor(values), POPULARITY_KEYS)
+
+
+def test_rejects_string_for_datetime_key():
+    keys = [(models.Portfolio.created_at, True), (models.Portfolio.id, True)]
+    with pytest.raises(ValueError):
+        decode_keyset_cursor(_raw_cursor(["2025-01-02", 1]), keys)
+
+
+# 엔드유저 포트폴리오 인기순 (design_name 은 NULL 가능)
+ENDUSER_POPULARITY_KEYS = [
+    (models.Portfolio.views, True),
+    (models.Portfolio.design_name, False),
+    (models.Portfolio.id, False),
+]
+
+
+@pytest.mark.parametrize("keys", [
+    ENDUSER_POPULARITY_KEYS,
+    [(models.Portfolio.design_name, True), (models.Portfolio.id, True)],
+    [(models.Portfolio.design_name, False), (models.Portfolio.id, False)],
+])
+@pytest.mark.parametrize("size", [1, 2, 3])
+def test_null_sort_values_on_page_boundary(db, keys, size):
+    """마지막 항목의 정렬 키가 NULL 이어도 뒤의 항목을 건너뛰지 않아야 함"""
+    for views, design_name in [(5, None), (5, "a"), (5, None), (5, None), (3, None), (3, "b"), (1, "c")]:
+        db.add(models.Portfolio(user_id=1, design_name=design_name, views=views, is_fixed_axis="N",
+                                main_image_url="http://example.com/p.jpg"))
+    db.commit()
+
+    query = db.query(models.Portfolio)
+    expected = [portfolio.id for portfolio in order_by_keys(query, keys).all()]
+
+    ids, cursor = [], None
+    while True:
+        items, cursor = paginate_keyset(query, keys, cursor, size)
+        ids += [portfolio.id for portfolio in items]
+        if cursor is None:
+            break
+
+    assert ids == expected
+    # NULL 은 가장 큰 값 (오름차순이면 끝, 내림차순이면 앞)
+    names = {portfolio.id: portfolio.design_name for portfolio in query}
+    if keys[0][0] is models.Portfolio.design_name:
+        null_positions = [index for index, pid in enumerate(ids) if names[pid] is None]
+        assert null_positions == (list(range(4)) if keys[0][1] else list(range(3, 7)))
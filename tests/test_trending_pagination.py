@@ -0,0 +1,79 @@
+# tests/test_trending_pagination.py
+import math
+from datetime import date
+
+import pytest
+
+from core.pagination import encode_cursor, paginate_chained, paginate_keyset_chained
+from db import models
+from services.trending_service import log_add, trending_log_weight, trending_query_parts
+
+# (id, design_name, 트렌딩 점수 - None 이면 점수 없음)
+PRODUCTS = [
+    (1, "c", 5.0),
+    (2, "a", None),
+    (3, "b", 5.0),
+    (4, "a", 9.0),
+    (5, "d", None),
+    (6, "b", None),
+    (7, "e", 1.0),
+]
+# 점수 내림차순(동점은 디자인명, id) 뒤에 점수 없는 항목을 디자인명, id 순으로
+EXPECTED_IDS = [4, 3, 1, 7, 2, 6, 5]
+
+
+@pytest.fixture
+def trending_parts(db):
+    db.add(models.Brand(id=1, brand_name="brand", rank=1))
+    for product_id, design_name, score in PRODUCTS:
+        db.add(models.Releasedproduct(
+            id=product_id, user_id=1, design_name=design_name, brand_id=1, main_image_url="m", views=0
+        ))
+        if score is not None:
+            db.add(models.TrendingScore(content_type="released_product", content_id=product_id, score=score))
+    db.commit()
+
+    query = db.query(models.Releasedproduct, models.Brand).join(
+        models.Brand, models.Releasedproduct.brand_id == models.Brand.id
+    )
+    return trending_query_parts(
+        query, "released_product", models.Releasedproduct, models.Releasedproduct.design_name
+    )
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 4, 7, 10])
+def test_offset_pages_span_parts(trending_parts, size):
+    ids = []
+    for page in range(1, len(PRODUCTS) // size + 2):
+        items, total_count = paginate_chained(trending_parts, page, size)
+        assert total_count == len(PRODUCTS)
+        ids += [product.id for product, brand in items]
+    assert ids == EXPECTED_IDS
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 4, 7, 10])
+def test_cursor_pages_span_parts(trending_parts, size):
+    ids, cursor = [], None
+    while True:
+        items, cursor = paginate_keyset_chained(trending_parts, cursor, size)
+        assert items
+        ids += [product.id for product, brand in items]
+        if cursor is None:
+            break
+    assert ids == EXPECTED_IDS
+
+
+@pytest.mark.parametrize("values", [[2], [True], ["0"], [0, "x", "a", 1], [1, 5.0, "a", 1]])
+def test_chained_cursor_rejects_invalid(trending_parts, values):
+    with pytest.raises(ValueError):
+        paginate_keyset_chained(trending_parts, encode_cursor(values), 10)
+
+
+def test_log_scores_stay_finite_far_from_epoch(monkeypatch):
+    from core.config import settings
+    monkeypatch.setattr(settings, "TRENDING_HALF_LIFE_DAYS", 1)
+
+    weight = trending_log_weight(date(2100, 1, 1))
+    assert math.isfinite(weight)
+    assert log_add(weight, weight) == pytest.approx(weight + math.log(2))
+    assert log_add(weight, 0.0) == pytest.approx(weight)